@@ -0,0 +1,81 @@
+"""
+Norma Cassandra Prepared Statement Benchmark
+
+Measures single-row write and read throughput with the statements the
+adapter prepares once per table and column set, against the same CQL sent
+unprepared (parsed by the server on every request and not routed
+token-aware). Needs a Cassandra node: set NORMA_BENCH_CASSANDRA_HOSTS
+(e.g. 127.0.0.1) to run it.
+
+Run with: python benchmarks/bench_cassandra_prepared.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from norma import BaseModel, Field, NormaClient
+
+
+@dataclass
+class Reading(BaseModel):
+    """Small row written and read by key."""
+
+    sensor: str = Field(max_length=20)
+    value: int = Field(default=0)
+    id: str = Field(primary_key=True, default_factory=lambda: "")
+
+
+def unprepared(session, count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        key = str(uuid.uuid4())
+        session.execute("INSERT INTO reading (sensor, value, id) VALUES (%s, %s, %s)", (f"s{i % 10}", i, key))
+        session.execute("SELECT * FROM reading WHERE id = %s", (key,)).one()
+    return time.perf_counter() - start
+
+
+async def prepared(client: NormaClient, count: int) -> float:
+    readings = client.get_model_client(Reading)
+    start = time.perf_counter()
+    for i in range(count):
+        reading = await readings.insert(Reading(sensor=f"s{i % 10}", value=i))
+        await readings.find_by_id(reading.id)
+    return time.perf_counter() - start
+
+
+async def main(count: int = 2_000) -> None:
+    hosts = os.environ.get("NORMA_BENCH_CASSANDRA_HOSTS")
+    if not hosts:
+        print("Set NORMA_BENCH_CASSANDRA_HOSTS to benchmark Cassandra")
+        return
+
+    client = NormaClient("cassandra", hosts, keyspace="norma_bench")
+    await client.connect()
+    readings = client.get_model_client(Reading)
+    await readings.drop_table()
+    await readings.create_table()
+
+    # Warm up both paths so connection setup and the first PREPARE are not timed
+    unprepared(client.adapter.session, 10)
+    await prepared(client, 10)
+
+    unprepared_time = unprepared(client.adapter.session, count)
+    prepared_time = await prepared(client, count)
+    await readings.drop_table()
+    await client.disconnect()
+
+    operations = count * 2
+    print(f"{operations:,} operations (insert + find_by_id per row) on Cassandra")
+    print(f"  unprepared:  {operations / unprepared_time:10,.0f} ops/s")
+    print(f"  prepared:    {operations / prepared_time:10,.0f} ops/s")
+    print(f"  speedup:     {unprepared_time / prepared_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
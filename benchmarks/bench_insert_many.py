@@ -0,0 +1,68 @@
+"""
+Norma Bulk Insert Benchmark
+
+Measures insert throughput against a temporary SQLite database: one
+insert() call per row versus a single insert_many() call.
+
+Run with: python benchmarks/bench_insert_many.py
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from norma import BaseModel, Field, NormaClient
+
+
+@dataclass
+class Event(BaseModel):
+    """Small model typical of append-heavy tables."""
+
+    kind: str = Field(max_length=20)
+    value: int = Field(default=0)
+    source: str = Field(default="api")
+    id: str = Field(primary_key=True, default_factory=lambda: "")
+
+
+def make_events(count: int) -> list:
+    return [Event(kind="click", value=i) for i in range(count)]
+
+
+async def per_row(client: NormaClient, count: int) -> float:
+    events = make_events(count)
+    start = time.perf_counter()
+    for event in events:
+        await client.insert(event)
+    return time.perf_counter() - start
+
+
+async def bulk(client: NormaClient, count: int) -> float:
+    events = make_events(count)
+    start = time.perf_counter()
+    await client.insert_many(events)
+    return time.perf_counter() - start
+
+
+async def main(count: int = 2_000) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        client = NormaClient("sql", f"sqlite+aiosqlite:///{os.path.join(directory, 'bench.db')}")
+        await client.connect()
+        await client.get_model_client(Event).create_table()
+
+        loop_time = await per_row(client, count)
+        bulk_time = await bulk(client, count)
+        await client.disconnect()
+
+    print(f"Inserting {count:,} rows into SQLite")
+    print(f"  insert() per row:  {count / loop_time:10,.0f} rows/s")
+    print(f"  insert_many():     {count / bulk_time:10,.0f} rows/s")
+    print(f"  speedup:           {loop_time / bulk_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+"""
+Norma Model Memory Benchmark
+
+Measures the per-instance memory of a 10-field model declared as a plain
+dataclass versus a slotted model (``@model(slots=True)``).
+
+Run with: python benchmarks/bench_memory.py
+"""
+
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from norma import BaseModel, Field, model
+
+
+@dataclass
+class Reading(BaseModel):
+    """Ten-field model with a per-instance __dict__."""
+
+    id: int = Field(primary_key=True, default=0)
+    sensor: str = Field(default="s-1")
+    site: str = Field(default="north")
+    value: float = Field(default=0.0)
+    unit: str = Field(default="C")
+    quality: int = Field(default=100)
+    flagged: bool = Field(default=False)
+    batch: int = Field(default=0)
+    note: Optional[str] = Field(default="ok")
+    source: str = Field(default="api")
+
+
+@model(slots=True)
+class CompactReading(BaseModel):
+    """The same ten fields, stored in __slots__."""
+
+    id: int = Field(primary_key=True, default=0)
+    sensor: str = Field(default="s-1")
+    site: str = Field(default="north")
+    value: float = Field(default=0.0)
+    unit: str = Field(default="C")
+    quality: int = Field(default=100)
+    flagged: bool = Field(default=False)
+    batch: int = Field(default=0)
+    note: Optional[str] = Field(default="ok")
+    source: str = Field(default="api")
+
+
+def measure(model_class: type, count: int) -> float:
+    """Return the traced bytes per instance for `count` hydrated instances."""
+    hydrate = model_class._hydrate_row
+    columns = ("id", "value", "batch")
+    # Share field values so only the instances themselves are measured
+    row = (1, 21.5, 7)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [hydrate(row, columns) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del instances
+    return (after - before) / count
+
+
+def main(count: int = 200_000) -> None:
+    plain = measure(Reading, count)
+    compact = measure(CompactReading, count)
+
+    print(f"Memory for {count:,} instances of a 10-field model")
+    print(f"  dataclass:     {plain:7.1f} bytes/instance")
+    print(f"  slots=True:    {compact:7.1f} bytes/instance")
+    print(f"  saving:        {plain - compact:7.1f} bytes/instance ({1 - compact / plain:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Norma Validation Benchmark
+
+Compares the per-instance cost of the compiled model validator against
+the field-by-field validation loop it replaced.
+
+Run with: python benchmarks/bench_validation.py
+"""
+
+import os
+import re
+import sys
+import timeit
+from dataclasses import dataclass, fields
+from typing import Optional, Union, get_args, get_origin
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from norma import BaseModel, Field
+from norma.exceptions import ValidationError
+
+
+@dataclass
+class Account(BaseModel):
+    """Benchmark model with a typical mix of constraints."""
+
+    id: str = Field(primary_key=True, default="acc_1")
+    name: str = Field(default="Jane Doe", min_length=1, max_length=100)
+    email: str = Field(default="jane@example.com", regex_pattern=r"^[^@]+@[^@]+\.[a-z]+$")
+    age: int = Field(default=30, min_value=0, max_value=150)
+    score: float = Field(default=0.5, min_value=0.0, max_value=1.0)
+    nickname: Optional[str] = Field(default="jd", max_length=20)
+    country: str = Field(default="NZ", min_length=2, max_length=2)
+    active: bool = Field(default=True)
+
+
+def legacy_validate(instance: BaseModel) -> None:
+    """Field-by-field validation as performed before compilation."""
+    for field_info in fields(instance):
+        config = field_info.metadata.get("norma_config")
+        if not config:
+            continue
+        name = field_info.name
+        value = getattr(instance, name)
+        if value is None:
+            if not config.nullable and not config.primary_key:
+                raise ValidationError(f"Field '{name}' cannot be None", name, value)
+            continue
+        expected_type = field_info.type
+        if get_origin(expected_type) is Union:
+            non_none = [arg for arg in get_args(expected_type) if arg is not type(None)]
+            if non_none and not any(isinstance(value, t) for t in non_none if isinstance(t, type)):
+                raise ValidationError(f"Field '{name}' has the wrong type", name, value)
+        elif isinstance(expected_type, type) and not isinstance(value, expected_type):
+            raise ValidationError(f"Field '{name}' has the wrong type", name, value)
+        if isinstance(value, str):
+            if config.min_length is not None and len(value) < config.min_length:
+                raise ValidationError(f"Field '{name}' is too short", name, value)
+            if config.max_length is not None and len(value) > config.max_length:
+                raise ValidationError(f"Field '{name}' is too long", name, value)
+            if config.regex_pattern and not re.match(config.regex_pattern, value):
+                raise ValidationError(f"Field '{name}' does not match", name, value)
+        if isinstance(value, (int, float)):
+            if config.min_value is not None and value < config.min_value:
+                raise ValidationError(f"Field '{name}' is too small", name, value)
+            if config.max_value is not None and value > config.max_value:
+                raise ValidationError(f"Field '{name}' is too large", name, value)
+
+
+def main(number: int = 100_000) -> None:
+    account = Account()
+
+    legacy = min(timeit.repeat(lambda: legacy_validate(account), number=number, repeat=5))
+    compiled = min(timeit.repeat(account.validate, number=number, repeat=5))
+
+    print(f"Validation of {number:,} instances ({len(fields(Account))} fields)")
+    print(f"  legacy:   {legacy / number * 1e6:7.2f} us/instance")
+    print(f"  compiled: {compiled / number * 1e6:7.2f} us/instance")
+    print(f"  speedup:  {legacy / compiled:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
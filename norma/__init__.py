@@ -5,9 +5,11 @@ A type-safe, dataclass-based ORM that supports PostgreSQL, SQLite, MongoDB, and
 with automatic Pydantic schema generation.
 """
 
-from .core.base_model import BaseModel
+from .core.base_model import BaseModel, model
 from .core.field import Field, OneToOne, OneToMany, ManyToOne, ManyToMany
+from .core.aggregates import Count, Sum, Avg, Min, Max
 from .core.client import NormaClient
+from .core.pagination import Page
 from .adapters.base_adapter import BaseAdapter
 from .adapters.sql_adapter import SQLAdapter
 from .adapters.mongo_adapter import MongoAdapter
@@ -19,6 +21,7 @@ from .exceptions import (
     NotFoundError,
     ConnectionError,
     DuplicateError,
+    BulkWriteError,
 )
 
 __version__ = "0.1.0"
@@ -28,8 +31,17 @@ __email__ = "eski.yin@gmail.com"
 __all__ = [
     # Core components
     "BaseModel",
+    "model",
     "Field", 
     "NormaClient",
+    "Page",
+    
+    # Aggregate metrics
+    "Count",
+    "Sum",
+    "Avg",
+    "Min",
+    "Max",
     
     # Relationships
     "OneToOne",
@@ -52,6 +64,7 @@ __all__ = [
     "NotFoundError",
     "ConnectionError",
     "DuplicateError",
+    "BulkWriteError",
     
     # Metadata
     "__version__",
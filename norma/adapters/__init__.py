@@ -8,10 +8,12 @@ from .base_adapter import BaseAdapter
 from .sql_adapter import SQLAdapter
 from .mongo_adapter import MongoAdapter
 from .cassandra_adapter import CassandraAdapter
+from .statement_cache import StatementCache
 
 __all__ = [
     "BaseAdapter",
     "SQLAdapter", 
     "MongoAdapter",
     "CassandraAdapter",
+    "StatementCache",
 ] 
\ No newline at end of file
@@ -6,11 +6,19 @@ Provides type-safe CRUD operations and connection management.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
-from dataclasses import fields
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar, Union
 
+from ..core.aggregates import Aggregate, Aggregator, Measure, resolve_aggregate
 from ..core.base_model import BaseModel
-from ..exceptions import NotFoundError, ConnectionError, QueryError
+from ..core.meta import ModelMeta, get_model_meta
+from ..core.pagination import (
+    Page, SortKey, decode_keyset_cursor, encode_keyset_cursor, keyset_filter, page_sort_key,
+)
+from ..core.relations import IncludeTree, assign_related, bind_lazy, get_relation, parse_include, relation_keys
+from .statement_cache import StatementCache
+from ..exceptions import BulkWriteError, NotFoundError, ConnectionError, QueryError
 
 
 T = TypeVar('T', bound=BaseModel)
@@ -31,9 +39,28 @@ class BaseAdapter(ABC):
         Args:
             connection_string: Database connection string
             **kwargs: Additional adapter-specific configuration
+                trusted_reads: Build models read from the database without
+                    re-validating them (default True). Set to False to
+                    validate every row, e.g. for tables written by other
+                    applications.
+                statement_cache_size: Maximum number of pre-built statements
+                    and compiled filters kept per adapter (default 512)
         """
         self.connection_string = connection_string
         self.config = kwargs
+        self.trusted_reads = kwargs.get('trusted_reads', True)
+        
+        # Pre-built statements and compiled filters, keyed by target and shape
+        self.statement_cache = StatementCache(kwargs.get('statement_cache_size', 512))
+        
+        # Backend handle (session, batch) of the transaction active in the
+        # current task or thread, joined by every operation
+        self._active_transaction: ContextVar[Any] = ContextVar(f"norma_transaction_{id(self)}", default=None)
+        # Models written in that transaction, with the field values to
+        # record as persisted once it commits
+        self._transaction_writes: ContextVar[Optional[List[Tuple[BaseModel, Tuple[Any, ...]]]]] = ContextVar(
+            f"norma_transaction_writes_{id(self)}", default=None
+        )
         self._connection = None
         self._is_connected = False
     
@@ -89,13 +116,100 @@ class BaseAdapter(ABC):
         """
         pass
     
+    async def insert_many(self, models: Sequence[T], batch_size: int = 1000) -> List[T]:
+        """
+        Insert many records, writing them in batches.
+        
+        The default implementation inserts one record at a time; adapters
+        override it with their backend's bulk write.
+        
+        Args:
+            models: The model instances to insert
+            batch_size: Maximum number of records written per round trip
+            
+        Returns:
+            The inserted models, with any auto-generated fields populated
+            
+        Raises:
+            BulkWriteError: If any batch fails; the other batches are still written
+            QueryError: If model validation fails (nothing is written)
+        """
+        for model in models:
+            self.validate_model(model)
+        
+        errors: List[Dict[str, Any]] = []
+        inserted = 0
+        for batch_number, (start, batch) in enumerate(self._batches(models, batch_size)):
+            for offset, model in enumerate(batch):
+                try:
+                    await self.insert(model)
+                    inserted += 1
+                except Exception as e:
+                    errors.append(self._bulk_error(batch_number, start + offset, e))
+        
+        self._check_bulk_errors(errors, inserted)
+        return list(models)
+    
+    async def upsert(self, model: T, conflict_fields: Optional[Sequence[str]] = None) -> T:
+        """
+        Insert a record, or update the existing record it conflicts with.
+        
+        The default implementation looks the record up by primary key and
+        then inserts or updates it, which is neither atomic nor able to use
+        other unique fields; adapters override it with a native upsert.
+        
+        Args:
+            model: The model instance to write
+            conflict_fields: Unique fields identifying an existing record
+                (default: the primary key)
+            
+        Returns:
+            The written model
+            
+        Raises:
+            QueryError: If conflict_fields are not unique fields of the model
+        """
+        model_class = model.__class__
+        pk_field = self.get_primary_key_field(model_class)
+        if self._conflict_columns(model_class, conflict_fields) != (self._column_name(model_class, pk_field),):
+            raise QueryError(f"{self.__class__.__name__} can only upsert by primary key")
+        
+        pk_value = model.get_primary_key_value()
+        if pk_value and await self.find_by_id(model_class, pk_value) is not None:
+            return await self.update(model, full=True)
+        return await self.insert(model)
+    
+    async def upsert_many(
+        self,
+        models: Sequence[T],
+        batch_size: int = 1000,
+        conflict_fields: Optional[Sequence[str]] = None
+    ) -> List[T]:
+        """
+        Upsert many records, writing them in batches.
+        
+        Args:
+            models: The model instances to write
+            batch_size: Maximum number of records written per round trip
+            conflict_fields: Unique fields identifying existing records
+                (default: the primary key)
+            
+        Returns:
+            The written models
+        """
+        return [await self.upsert(model, conflict_fields) for model in models]
+    
     @abstractmethod
-    async def update(self, model: T) -> T:
+    async def update(self, model: T, full: bool = False) -> T:
         """
         Update an existing record in the database.
         
+        Only fields changed since the model was loaded or last saved are
+        written; if nothing changed, no query is sent.
+        
         Args:
             model: The model instance to update
+            full: Write every column regardless of changes
             
         Returns:
             The updated model
@@ -107,13 +221,25 @@ class BaseAdapter(ABC):
         pass
     
     @abstractmethod
-    async def find_by_id(self, model_class: Type[T], id_value: Any) -> Optional[T]:
+    async def find_by_id(
+        self,
+        model_class: Type[T],
+        id_value: Any,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Optional[T]:
         """
         Find a record by its primary key.
         
+        Projected reads (fields/exclude) return partial models: omitted
+        fields hold their default or None and are not validated (see
+        BaseModel.get_unloaded_fields).
+        
         Args:
             model_class: The model class to search for
             id_value: The primary key value
+            fields: Only load these fields (the primary key is always loaded)
+            exclude: Load every field except these
             
         Returns:
             The found model or None if not found
@@ -127,7 +253,10 @@ class BaseAdapter(ABC):
         filters: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        order_by: Optional[List[str]] = None
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
     ) -> List[T]:
         """
         Find multiple records matching the given criteria.
@@ -138,12 +267,180 @@ class BaseAdapter(ABC):
             limit: Maximum number of records to return
             offset: Number of records to skip
             order_by: List of fields to order by
+            fields: Only load these fields (the primary key is always loaded)
+            exclude: Load every field except these
+            include: Relationships to load with the records (see load_related)
             
         Returns:
             List of matching models
         """
         pass
     
+    async def find_by_ids(
+        self,
+        model_class: Type[T],
+        ids: Sequence[Any],
+        preserve_order: bool = True,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        batch_size: int = 1000
+    ) -> Union[List[Optional[T]], Dict[Any, T]]:
+        """
+        Find many records by primary key in as few round trips as possible.
+        
+        The default implementation reads each batch of distinct IDs with one
+        find_many() primary key $in query.
+        
+        Args:
+            model_class: The model class to search for
+            ids: Primary key values (duplicates are read once)
+            preserve_order: Return a list aligned with `ids` (None for
+                misses) instead of a dict of the found records keyed by ID
+            fields: Only load these fields (the primary key is always loaded)
+            exclude: Load every field except these
+            batch_size: Maximum number of IDs per query
+            
+        Returns:
+            The ordered list, or the dict keyed by ID
+        """
+        pk_field = self.get_primary_key_field(model_class)
+        found: Dict[Any, T] = {}
+        for _, batch in self._batches(self._unique_ids(ids), batch_size):
+            models = await self.find_many(
+                model_class, {pk_field: {"$in": list(batch)}}, fields=fields, exclude=exclude
+            )
+            found.update((model.get_primary_key_value(), model) for model in models)
+        return self._finish_find_by_ids(ids, found, preserve_order)
+    
+    async def load_related(
+        self,
+        model_class: Type[T],
+        models: Sequence[T],
+        include: Union[Sequence[str], IncludeTree]
+    ) -> None:
+        """
+        Load relationships onto already-fetched models (see norma.core.relations).
+        
+        Each relation costs one query for all the models ("select-in"):
+        find_by_ids() when it matches the target's primary key, otherwise a
+        batched $in query on the target's key field. Dotted paths such as
+        "posts.comments" load nested relations level by level. Loaded values
+        are read with model.get_related(name).
+        
+        Raises:
+            QueryError: For unknown relationship names
+        """
+        tree = include if isinstance(include, dict) else parse_include(include)
+        for name, children in tree.items():
+            relation = get_relation(model_class, name)
+            keys = relation_keys(relation, models)
+            targets: List[BaseModel] = []
+            if keys and relation.remote_field == self.get_primary_key_field(relation.target):
+                targets = list((await self.find_by_ids(relation.target, keys, preserve_order=False)).values())
+            elif keys:
+                for _, batch in self._batches(keys, 1000):
+                    targets.extend(await self.find_many(relation.target, {relation.remote_field: {"$in": list(batch)}}))
+            assign_related(relation, models, targets)
+            bind_lazy(self, relation.target, targets)
+            if children and targets:
+                await self.load_related(relation.target, targets, children)
+    
+    async def stream(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[T]:
+        """
+        Iterate over matching records without loading them all at once.
+        
+        Adapters fetch `batch_size` rows per round trip from a server-side
+        cursor, so memory stays bounded by the batch size. The default
+        implementation falls back to find_many().
+        
+        Args:
+            model_class: The model class to search for
+            filters: Dictionary of field filters
+            batch_size: Number of records fetched per round trip
+            order_by: List of fields to order by
+            fields: Only load these fields (the primary key is always loaded)
+            exclude: Load every field except these
+            
+        Yields:
+            Matching models
+        """
+        for model in await self.find_many(model_class, filters, order_by=order_by, fields=fields, exclude=exclude):
+            yield model
+    
+    async def find_page(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Page[T]:
+        """
+        Find one page of records using keyset (seek) pagination.
+        
+        The primary key is added to `order_by` as a tie-breaker and the page
+        starts strictly after the row encoded in `after`, so the cost of a
+        page does not grow with its depth the way OFFSET does. Ordered
+        fields must be non-null.
+        
+        Args:
+            model_class: The model class to search for
+            filters: Dictionary of field filters
+            order_by: List of fields to order by ("-" prefix for descending)
+            after: Cursor returned with the previous page, None for the first page
+            limit: Maximum number of records on the page
+            fields: Only load these fields (the primary key is always loaded)
+            exclude: Load every field except these
+            
+        Returns:
+            The page's models and the cursor of the next page (None on the last page)
+            
+        Raises:
+            QueryError: If the cursor is malformed or was issued for another
+                order, or the page's last row has None in an ordered field
+        """
+        sort_key, page_filters, page_order = self._page_query(model_class, filters, order_by, after, limit)
+        fields, exclude = self._page_projection(sort_key, fields, exclude)
+        items = await self.find_many(
+            model_class, page_filters, limit=limit + 1, order_by=page_order, fields=fields, exclude=exclude
+        )
+        return self._finish_page(items, sort_key, limit)
+    
+    async def iter_pages(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[Page[T]]:
+        """
+        Iterate over the pages of find_page(), starting after the cursor `after`.
+        
+        Each page carries the cursor of the following one, so a scan can be
+        resumed later with after=page.next_cursor. The default
+        implementation requests a page once the previous one is consumed;
+        adapters may fetch ahead.
+        """
+        while True:
+            page = await self.find_page(model_class, filters, order_by, after, limit, fields, exclude)
+            yield page
+            if page.next_cursor is None:
+                return
+            after = page.next_cursor
+    
     @abstractmethod
     async def delete_by_id(self, model_class: Type[T], id_value: Any) -> bool:
         """
@@ -158,6 +455,80 @@ class BaseAdapter(ABC):
         """
         pass
     
+    async def update_many(
+        self,
+        model_class: Type[T],
+        filters: Dict[str, Any],
+        changes: Dict[str, Any]
+    ) -> int:
+        """
+        Apply the same changes to every record matching the filters.
+        
+        The default implementation loads the matching records and updates
+        them one at a time; adapters override it with a set-based write.
+        Changes are not validated against field constraints.
+        
+        Args:
+            model_class: The model class to update
+            filters: Dictionary of field filters (same syntax as find_many)
+            changes: Field values to set
+            
+        Returns:
+            Number of records updated
+            
+        Raises:
+            QueryError: If a change targets an unknown or primary key field
+        """
+        self._get_bulk_changes(model_class, changes)
+        models = await self.find_many(model_class, filters)
+        for model in models:
+            for field_name, value in changes.items():
+                setattr(model, field_name, value)
+            await self.update(model)
+        return len(models)
+    
+    async def delete_many(self, model_class: Type[T], filters: Dict[str, Any]) -> int:
+        """
+        Delete every record matching the filters.
+        
+        The default implementation loads the matching records and deletes
+        them one at a time; adapters override it with a set-based write.
+        
+        Args:
+            model_class: The model class
+            filters: Dictionary of field filters (same syntax as find_many);
+                an empty dictionary deletes every record
+            
+        Returns:
+            Number of records deleted
+        """
+        deleted = 0
+        for model in await self.find_many(model_class, filters):
+            if await self.delete_by_id(model_class, model.get_primary_key_value()):
+                deleted += 1
+        return deleted
+    
+    async def delete_many_by_ids(self, model_class: Type[T], ids: Sequence[Any], batch_size: int = 1000) -> int:
+        """
+        Delete many records by primary key.
+        
+        The default implementation runs one delete_many() primary key $in
+        query per batch of distinct IDs.
+        
+        Args:
+            model_class: The model class
+            ids: Primary key values (duplicates are deleted once)
+            batch_size: Maximum number of IDs per query
+            
+        Returns:
+            Number of records deleted
+        """
+        pk_field = self.get_primary_key_field(model_class)
+        deleted = 0
+        for _, batch in self._batches(self._unique_ids(ids), batch_size):
+            deleted += await self.delete_many(model_class, {pk_field: {"$in": list(batch)}})
+        return deleted
+    
     @abstractmethod
     async def count(
         self, 
@@ -194,17 +565,182 @@ class BaseAdapter(ABC):
         """
         pass
     
+    async def aggregate(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        group_by: Optional[Sequence[str]] = None,
+        metrics: Optional[Mapping[str, Aggregate]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Compute metrics over matching records, per group.
+        
+        Adapters push the aggregation down to the database. The default
+        implementation streams the needed fields and aggregates in Python.
+        
+        Args:
+            model_class: The model class to aggregate
+            filters: Dictionary of field filters
+            group_by: Fields to group by (one result row for all records if omitted)
+            metrics: Result names mapped to Count/Sum/Avg/Min/Max metrics
+                (defaults to {"count": Count()})
+            
+        Returns:
+            One plain dictionary per group, keyed by the group_by fields and
+            metric names, in no particular order
+        
+        Raises:
+            QueryError: For unknown fields or invalid metrics
+        """
+        groups, measures = self._aggregate_spec(model_class, group_by, metrics)
+        aggregator = Aggregator(groups, measures)
+        fields = self._aggregate_fields(model_class, groups, measures)
+        async for model in self.stream(model_class, filters, fields=fields):
+            aggregator.add(self._aggregate_row(model_class, model, fields))
+        return aggregator.results()
+    
+    # Transactions
+    
+    def in_transaction(self) -> bool:
+        """Check whether the current task or thread is inside transaction()."""
+        return self._active_transaction.get() is not None
+    
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """
+        Run the operations inside the block as one unit of work.
+        
+        Operations in the block (in the same task) share one backend session
+        and are committed together when the block exits, or rolled back if it
+        raises. A nested transaction() joins the outer one. Concurrent tasks
+        spawned inside the block must not use it at the same time. Models
+        written in the block are only marked clean once it commits.
+        
+        Raises:
+            NotImplementedError: If the adapter does not support transactions
+            QueryError: If the commit fails
+        """
+        if self._active_transaction.get() is not None:
+            yield
+            return
+        
+        handle = await self._begin_transaction()
+        writes: List[Tuple[BaseModel, Tuple[Any, ...]]] = []
+        token = self._active_transaction.set(handle)
+        writes_token = self._transaction_writes.set(writes)
+        try:
+            yield
+        except BaseException:
+            self._transaction_writes.reset(writes_token)
+            self._active_transaction.reset(token)
+            await self._rollback_transaction(handle)
+            raise
+        self._transaction_writes.reset(writes_token)
+        self._active_transaction.reset(token)
+        await self._commit_transaction(handle)
+        self._apply_committed_writes(writes)
+    
+    @contextmanager
+    def transaction_sync(self) -> Iterator[None]:
+        """Synchronous version of transaction, joined by the *_sync operations."""
+        if self._active_transaction.get() is not None:
+            yield
+            return
+        
+        handle = self._begin_transaction_sync()
+        writes: List[Tuple[BaseModel, Tuple[Any, ...]]] = []
+        token = self._active_transaction.set(handle)
+        writes_token = self._transaction_writes.set(writes)
+        try:
+            yield
+        except BaseException:
+            self._transaction_writes.reset(writes_token)
+            self._active_transaction.reset(token)
+            self._rollback_transaction_sync(handle)
+            raise
+        self._transaction_writes.reset(writes_token)
+        self._active_transaction.reset(token)
+        self._commit_transaction_sync(handle)
+        self._apply_committed_writes(writes)
+    
+    def _mark_clean(self, model: BaseModel) -> None:
+        """
+        Record a written model's current field values as persisted.
+        
+        Inside transaction() the values are captured now but only recorded
+        when the transaction commits, so a rolled-back write leaves the
+        model dirty and the next update() writes those fields again.
+        """
+        writes = self._transaction_writes.get()
+        if writes is None:
+            model.mark_clean()
+        else:
+            writes.append((model, get_model_meta(model.__class__).serializer.values(model)))
+    
+    @staticmethod
+    def _apply_committed_writes(writes: List[Tuple[BaseModel, Tuple[Any, ...]]]) -> None:
+        """Record the values written in a committed transaction as persisted."""
+        for model, snapshot in writes:
+            object.__setattr__(model, '_norma_snapshot', snapshot)
+    
+    async def _begin_transaction(self) -> Any:
+        """Start a transaction and return the handle operations should join."""
+        raise NotImplementedError("Transactions not supported by this adapter")
+    
+    async def _commit_transaction(self, handle: Any) -> None:
+        """Commit and release a transaction handle."""
+        raise NotImplementedError("Transactions not supported by this adapter")
+    
+    async def _rollback_transaction(self, handle: Any) -> None:
+        """Roll back and release a transaction handle."""
+        raise NotImplementedError("Transactions not supported by this adapter")
+    
+    def _begin_transaction_sync(self) -> Any:
+        """Synchronous version of _begin_transaction."""
+        raise NotImplementedError("Synchronous transactions not supported by this adapter")
+    
+    def _commit_transaction_sync(self, handle: Any) -> None:
+        """Synchronous version of _commit_transaction."""
+        raise NotImplementedError("Synchronous transactions not supported by this adapter")
+    
+    def _rollback_transaction_sync(self, handle: Any) -> None:
+        """Synchronous version of _rollback_transaction."""
+        raise NotImplementedError("Synchronous transactions not supported by this adapter")
+    
     # Synchronous versions of methods for backward compatibility
     
     def insert_sync(self, model: T) -> T:
         """Synchronous version of insert."""
         raise NotImplementedError("Synchronous operations not supported by this adapter")
     
-    def update_sync(self, model: T) -> T:
+    def insert_many_sync(self, models: Sequence[T], batch_size: int = 1000) -> List[T]:
+        """Synchronous version of insert_many."""
+        raise NotImplementedError("Synchronous operations not supported by this adapter")
+    
+    def upsert_sync(self, model: T, conflict_fields: Optional[Sequence[str]] = None) -> T:
+        """Synchronous version of upsert."""
+        raise NotImplementedError("Synchronous operations not supported by this adapter")
+    
+    def upsert_many_sync(
+        self,
+        models: Sequence[T],
+        batch_size: int = 1000,
+        conflict_fields: Optional[Sequence[str]] = None
+    ) -> List[T]:
+        """Synchronous version of upsert_many."""
+        raise NotImplementedError("Synchronous operations not supported by this adapter")
+    
+    def update_sync(self, model: T, full: bool = False) -> T:
         """Synchronous version of update."""
         raise NotImplementedError("Synchronous operations not supported by this adapter")
     
-    def find_by_id_sync(self, model_class: Type[T], id_value: Any) -> Optional[T]:
+    def find_by_id_sync(
+        self,
+        model_class: Type[T],
+        id_value: Any,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Optional[T]:
         """Synchronous version of find_by_id."""
         raise NotImplementedError("Synchronous operations not supported by this adapter")
     
@@ -214,15 +750,128 @@ class BaseAdapter(ABC):
         filters: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        order_by: Optional[List[str]] = None
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
     ) -> List[T]:
         """Synchronous version of find_many."""
         raise NotImplementedError("Synchronous operations not supported by this adapter")
     
+    def find_by_ids_sync(
+        self,
+        model_class: Type[T],
+        ids: Sequence[Any],
+        preserve_order: bool = True,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        batch_size: int = 1000
+    ) -> Union[List[Optional[T]], Dict[Any, T]]:
+        """Synchronous version of find_by_ids."""
+        pk_field = self.get_primary_key_field(model_class)
+        found: Dict[Any, T] = {}
+        for _, batch in self._batches(self._unique_ids(ids), batch_size):
+            models = self.find_many_sync(
+                model_class, {pk_field: {"$in": list(batch)}}, fields=fields, exclude=exclude
+            )
+            found.update((model.get_primary_key_value(), model) for model in models)
+        return self._finish_find_by_ids(ids, found, preserve_order)
+    
+    def load_related_sync(
+        self,
+        model_class: Type[T],
+        models: Sequence[T],
+        include: Union[Sequence[str], IncludeTree]
+    ) -> None:
+        """Synchronous version of load_related."""
+        tree = include if isinstance(include, dict) else parse_include(include)
+        for name, children in tree.items():
+            relation = get_relation(model_class, name)
+            keys = relation_keys(relation, models)
+            targets: List[BaseModel] = []
+            if keys and relation.remote_field == self.get_primary_key_field(relation.target):
+                targets = list(self.find_by_ids_sync(relation.target, keys, preserve_order=False).values())
+            elif keys:
+                for _, batch in self._batches(keys, 1000):
+                    targets.extend(self.find_many_sync(relation.target, {relation.remote_field: {"$in": list(batch)}}))
+            assign_related(relation, models, targets)
+            bind_lazy(self, relation.target, targets)
+            if children and targets:
+                self.load_related_sync(relation.target, targets, children)
+    
+    def stream_sync(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Iterator[T]:
+        """Synchronous version of stream."""
+        raise NotImplementedError("Synchronous operations not supported by this adapter")
+    
+    def find_page_sync(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Page[T]:
+        """Synchronous version of find_page."""
+        sort_key, page_filters, page_order = self._page_query(model_class, filters, order_by, after, limit)
+        fields, exclude = self._page_projection(sort_key, fields, exclude)
+        items = self.find_many_sync(
+            model_class, page_filters, limit=limit + 1, order_by=page_order, fields=fields, exclude=exclude
+        )
+        return self._finish_page(items, sort_key, limit)
+    
+    def iter_pages_sync(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Iterator[Page[T]]:
+        """Synchronous version of iter_pages."""
+        while True:
+            page = self.find_page_sync(model_class, filters, order_by, after, limit, fields, exclude)
+            yield page
+            if page.next_cursor is None:
+                return
+            after = page.next_cursor
+    
     def delete_by_id_sync(self, model_class: Type[T], id_value: Any) -> bool:
         """Synchronous version of delete_by_id."""
         raise NotImplementedError("Synchronous operations not supported by this adapter")
     
+    def update_many_sync(
+        self,
+        model_class: Type[T],
+        filters: Dict[str, Any],
+        changes: Dict[str, Any]
+    ) -> int:
+        """Synchronous version of update_many."""
+        raise NotImplementedError("Synchronous operations not supported by this adapter")
+    
+    def delete_many_sync(self, model_class: Type[T], filters: Dict[str, Any]) -> int:
+        """Synchronous version of delete_many."""
+        raise NotImplementedError("Synchronous operations not supported by this adapter")
+    
+    def delete_many_by_ids_sync(self, model_class: Type[T], ids: Sequence[Any], batch_size: int = 1000) -> int:
+        """Synchronous version of delete_many_by_ids."""
+        pk_field = self.get_primary_key_field(model_class)
+        deleted = 0
+        for _, batch in self._batches(self._unique_ids(ids), batch_size):
+            deleted += self.delete_many_sync(model_class, {pk_field: {"$in": list(batch)}})
+        return deleted
+    
     def count_sync(
         self, 
         model_class: Type[T], 
@@ -231,8 +880,27 @@ class BaseAdapter(ABC):
         """Synchronous version of count."""
         raise NotImplementedError("Synchronous operations not supported by this adapter")
     
+    def aggregate_sync(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        group_by: Optional[Sequence[str]] = None,
+        metrics: Optional[Mapping[str, Aggregate]] = None
+    ) -> List[Dict[str, Any]]:
+        """Synchronous version of aggregate."""
+        groups, measures = self._aggregate_spec(model_class, group_by, metrics)
+        aggregator = Aggregator(groups, measures)
+        fields = self._aggregate_fields(model_class, groups, measures)
+        for model in self.stream_sync(model_class, filters, fields=fields):
+            aggregator.add(self._aggregate_row(model_class, model, fields))
+        return aggregator.results()
+    
     # Utility methods
     
+    def get_model_meta(self, model_class: Type[BaseModel]) -> ModelMeta:
+        """Get the cached metadata for a model class."""
+        return get_model_meta(model_class)
+    
     def get_table_name(self, model_class: Type[BaseModel]) -> str:
         """
         Get the table/collection name for a model class.
@@ -240,11 +908,11 @@ class BaseAdapter(ABC):
         Default implementation uses the lowercase class name.
         Can be overridden in subclasses for custom naming conventions.
         """
-        return model_class.__name__.lower()
+        return get_model_meta(model_class).table_name
     
     def get_primary_key_field(self, model_class: Type[BaseModel]) -> str:
         """Get the primary key field name for a model class."""
-        pk_field = model_class.get_primary_key_field()
+        pk_field = get_model_meta(model_class).primary_key
         if not pk_field:
             raise ValueError(f"Model {model_class.__name__} has no primary key field")
         return pk_field
@@ -256,13 +924,317 @@ class BaseAdapter(ABC):
         except Exception as e:
             raise QueryError(f"Model validation failed: {str(e)}")
     
+    def _column_name(self, model_class: Type[BaseModel], field_name: str) -> str:
+        """Get the database column name for a field (unknown names pass through)."""
+        return get_model_meta(model_class).field_to_column.get(field_name, field_name)
+    
+    def _generate_primary_key(self, model: BaseModel) -> Any:
+        """Generate a primary key value for a model being inserted."""
+        return model.generate_id()
+    
+    def _prepare_insert_data(self, model: BaseModel) -> Dict[str, Any]:
+        """
+        Get the column-keyed values to insert for a model.
+        
+        A primary key is generated (and set on the model) if it is empty.
+        """
+        data = model.to_db_dict()
+        
+        pk_field = self.get_primary_key_field(model.__class__)
+        pk_column = self._column_name(model.__class__, pk_field)
+        if not data.get(pk_column):
+            data[pk_column] = self._generate_primary_key(model)
+            setattr(model, pk_field, data[pk_column])
+        
+        return data
+    
+    def _bulk_model_class(self, models: Sequence[BaseModel]) -> Type[BaseModel]:
+        """Get the single model class shared by a bulk write's models."""
+        model_class = models[0].__class__
+        for model in models:
+            if model.__class__ is not model_class:
+                raise QueryError(
+                    f"Bulk writes require models of one class, got {model_class.__name__} "
+                    f"and {model.__class__.__name__}"
+                )
+        return model_class
+    
+    @staticmethod
+    def _batches(items: Sequence[Any], batch_size: int) -> Iterable[Tuple[int, Sequence[Any]]]:
+        """Split a sequence into (start index, batch) chunks."""
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        for start in range(0, len(items), batch_size):
+            yield start, items[start:start + batch_size]
+    
+    @staticmethod
+    def _bulk_error(batch_number: int, index: int, error: Any, size: int = 1) -> Dict[str, Any]:
+        """Describe one failed batch (or record) of a bulk write."""
+        message = str(error)
+        lowered = message.lower()
+        return {
+            "batch": batch_number,
+            "index": index,
+            "size": size,
+            "duplicate": "duplicate" in lowered or "unique" in lowered,
+            "message": message,
+        }
+    
+    @staticmethod
+    def _check_bulk_errors(errors: List[Dict[str, Any]], inserted_count: int) -> None:
+        """Raise BulkWriteError if a bulk write reported any failures."""
+        if errors:
+            failed = sum(error["size"] for error in errors)
+            raise BulkWriteError(
+                f"Bulk write failed for {failed} record(s) in {len({e['batch'] for e in errors})} batch(es)",
+                errors,
+                inserted_count,
+            )
+    
+    def _finish_insert_many(self, models: Sequence[T], errors: List[Dict[str, Any]]) -> List[T]:
+        """Mark models in committed batches clean and report failed batches."""
+        failed = set()
+        for error in errors:
+            failed.update(range(error["index"], error["index"] + error["size"]))
+        for index, model in enumerate(models):
+            if index not in failed:
+                self._mark_clean(model)
+        
+        self._check_bulk_errors(errors, len(models) - len(failed))
+        return list(models)
+    
+    def _conflict_columns(
+        self,
+        model_class: Type[BaseModel],
+        conflict_fields: Optional[Sequence[str]] = None
+    ) -> Tuple[str, ...]:
+        """
+        Get the column names an upsert matches existing records on.
+        
+        Raises:
+            QueryError: If a field is not the primary key or a unique field
+        """
+        meta = get_model_meta(model_class)
+        if not conflict_fields:
+            conflict_fields = (self.get_primary_key_field(model_class),)
+        for field_name in conflict_fields:
+            if field_name not in meta.unique_fields:
+                raise QueryError(
+                    f"Conflict field '{field_name}' of {model_class.__name__} must be the primary key or unique"
+                )
+        return tuple(meta.field_to_column[name] for name in conflict_fields)
+    
+    @staticmethod
+    def _id_key(id_value: Any) -> Any:
+        """Get a hashable form of an ID: composite keys given as lists become tuples."""
+        return tuple(id_value) if isinstance(id_value, list) else id_value
+    
+    @staticmethod
+    def _unique_ids(ids: Sequence[Any]) -> List[Any]:
+        """Get the distinct IDs (see _id_key) in their first-seen order."""
+        return list(dict.fromkeys(BaseAdapter._id_key(id_value) for id_value in ids))
+    
+    @staticmethod
+    def _finish_find_by_ids(
+        ids: Sequence[Any],
+        found: Dict[Any, T],
+        preserve_order: bool
+    ) -> Union[List[Optional[T]], Dict[Any, T]]:
+        """Shape find_by_ids results as an ID-aligned list or a dict keyed by ID (see _id_key)."""
+        if preserve_order:
+            return [found.get(BaseAdapter._id_key(id_value)) for id_value in ids]
+        return found
+    
+    def _page_query(
+        self,
+        model_class: Type[BaseModel],
+        filters: Optional[Dict[str, Any]],
+        order_by: Optional[List[str]],
+        after: Optional[str],
+        limit: int
+    ) -> Tuple[SortKey, Dict[str, Any], List[str]]:
+        """Get the sort key, keyset-restricted filters and order_by for a page."""
+        if limit < 1:
+            raise QueryError("Page limit must be at least 1")
+        sort_key = page_sort_key(order_by, self.get_primary_key_field(model_class))
+        page_filters = dict(filters or {})
+        if after is not None:
+            seek = keyset_filter(sort_key, decode_keyset_cursor(after, sort_key))
+            page_filters = {"$and": [page_filters, seek]} if page_filters else seek
+        page_order = [f"-{name}" if descending else name for name, descending in sort_key]
+        return sort_key, page_filters, page_order
+    
+    @staticmethod
+    def _page_projection(
+        sort_key: SortKey,
+        fields: Optional[Sequence[str]],
+        exclude: Optional[Sequence[str]]
+    ) -> Tuple[Optional[List[str]], Optional[List[str]]]:
+        """Keep the sort key fields in a page's projection; the next cursor needs them."""
+        sort_fields = [name for name, _ in sort_key]
+        if fields is not None:
+            fields = list(fields) + sort_fields
+        if exclude is not None:
+            exclude = [name for name in exclude if name not in sort_fields]
+        return fields, exclude
+    
+    @staticmethod
+    def _finish_page(items: List[T], sort_key: SortKey, limit: int) -> Page[T]:
+        """Trim the look-ahead row fetched by find_page and build the next cursor."""
+        if len(items) <= limit:
+            return Page(items)
+        items = items[:limit]
+        return Page(items, encode_keyset_cursor(sort_key, items[-1]))
+    
+    def _projection(
+        self,
+        model_class: Type[BaseModel],
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Optional[Tuple[str, ...]]:
+        """
+        Resolve a read's fields/exclude options into the columns to load.
+        
+        Returns:
+            Column names in model field order, always including the primary
+            key, or None to load every column
+            
+        Raises:
+            QueryError: For unknown fields, or if both options are given
+        """
+        if fields is None and exclude is None:
+            return None
+        if fields is not None and exclude is not None:
+            raise QueryError("Pass either fields or exclude, not both")
+        
+        meta = get_model_meta(model_class)
+        names = set(fields if fields is not None else exclude)
+        unknown = names - meta.field_set
+        if unknown:
+            raise QueryError(f"Unknown field(s) {', '.join(sorted(unknown))} for {model_class.__name__}")
+        if exclude is not None:
+            names = set(meta.field_set) - names
+        names.update(meta.primary_key_fields)
+        return tuple(meta.field_to_column[name] for name in meta.field_names if name in names)
+    
+    def _aggregate_spec(
+        self,
+        model_class: Type[BaseModel],
+        group_by: Optional[Sequence[str]],
+        metrics: Optional[Mapping[str, Aggregate]]
+    ) -> Tuple[Tuple[Tuple[str, str], ...], Tuple[Measure, ...]]:
+        """Validate an aggregate() call into hashable group keys and measures."""
+        meta = self.get_model_meta(model_class)
+        return resolve_aggregate(group_by, metrics, meta.field_to_column, model_class.__name__)
+    
+    def _aggregate_fields(
+        self,
+        model_class: Type[BaseModel],
+        groups: Sequence[Tuple[str, str]],
+        measures: Sequence[Measure]
+    ) -> List[str]:
+        """Get the fields a Python-side aggregation has to load."""
+        column_to_field = self.get_model_meta(model_class).column_to_field
+        columns = [column for _, column in groups] + [column for _, _, column in measures if column]
+        return list(dict.fromkeys(column_to_field[column] for column in columns))
+    
+    def _aggregate_row(self, model_class: Type[BaseModel], model: BaseModel, fields: Sequence[str]) -> Dict[str, Any]:
+        """Read the aggregated fields of a model as a row keyed by column."""
+        field_to_column = self.get_model_meta(model_class).field_to_column
+        return {field_to_column[field]: getattr(model, field) for field in fields}
+    
+    def _get_bulk_changes(self, model_class: Type[BaseModel], changes: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Re-key update_many changes by column name, rejecting invalid fields.
+        
+        Raises:
+            QueryError: If changes is empty or names an unknown or primary key field
+        """
+        if not changes:
+            raise QueryError("update_many requires at least one change")
+        
+        meta = get_model_meta(model_class)
+        for field_name in changes:
+            if field_name not in meta.field_set:
+                raise QueryError(f"Unknown field '{field_name}' for {model_class.__name__}")
+            if field_name in meta.primary_key_fields:
+                raise QueryError(f"Primary key field '{field_name}' cannot be changed by update_many")
+        return {meta.field_to_column[k]: v for k, v in changes.items()}
+    
+    def _get_update_data(self, model: BaseModel, full: bool = False) -> Dict[str, Any]:
+        """
+        Get the column-keyed values an update should write.
+        
+        Args:
+            model: The model being updated
+            full: Include every loaded non-primary-key column, not just
+                changed ones
+            
+        Returns:
+            Dictionary of column names to values (empty if nothing changed)
+        """
+        meta = get_model_meta(model.__class__)
+        if full:
+            # Fields a projected read skipped are only written once assigned
+            unloaded = getattr(model, '_norma_unloaded', None)
+            if unloaded:
+                unloaded = unloaded.difference(model.get_dirty_fields())
+            field_names = [name for name in meta.field_names if not unloaded or name not in unloaded]
+        else:
+            field_names = model.get_dirty_fields()
+        if not field_names:
+            return {}
+        
+        data = model.to_db_dict()
+        columns = (
+            meta.field_to_column[name] for name in field_names
+            if name not in meta.primary_key_fields
+        )
+        return {column: data[column] for column in columns}
+    
+    def _model_from_mapping(self, model_class: Type[T], data: Mapping[str, Any]) -> T:
+        """
+        Build a model from a column-keyed mapping read from the database.
+        
+        Uses the trusted hydration path unless trusted_reads is disabled,
+        in which case the row goes through from_dict() and validation.
+        """
+        if self.trusted_reads:
+            return model_class._hydrate(data)
+        column_to_field = get_model_meta(model_class).column_to_field
+        model = model_class.from_dict({column_to_field.get(k, k): v for k, v in data.items()})
+        model.mark_clean()
+        return model
+    
+    def _models_from_rows(
+        self,
+        model_class: Type[T],
+        rows: Iterable[Sequence[Any]],
+        columns: Sequence[str],
+        partial: bool = False
+    ) -> List[T]:
+        """
+        Build models from positional rows read from the database.
+        
+        Args:
+            model_class: The model class to build
+            rows: Row values (tuples, driver rows or namedtuples)
+            columns: Database column names, in row order
+            partial: The rows come from a projected read; partial models
+                are always hydrated without validation
+        """
+        if self.trusted_reads or partial:
+            hydrate = get_model_meta(model_class).row_hydrator(columns)
+            return [hydrate(row) for row in rows]
+        return [self._model_from_mapping(model_class, dict(zip(columns, row))) for row in rows]
+    
     def _get_field_names(self, model_class: Type[BaseModel]) -> List[str]:
         """Get all field names for a model class."""
-        return [field.name for field in fields(model_class)]
+        return list(get_model_meta(model_class).field_names)
     
     def _filter_model_data(self, data: Dict[str, Any], model_class: Type[BaseModel]) -> Dict[str, Any]:
         """Filter dictionary to only include fields that exist in the model."""
-        valid_fields = set(self._get_field_names(model_class))
+        valid_fields = get_model_meta(model_class).field_set
         return {k: v for k, v in data.items() if k in valid_fields}
     
     @property
@@ -6,15 +6,14 @@ Supports CQL queries and Cassandra-specific features.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional, Type, TypeVar
-from dataclasses import fields
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar, Union
 from datetime import datetime
 import uuid
 
 try:
     from cassandra.cluster import Cluster, Session
     from cassandra.auth import PlainTextAuthProvider
-    from cassandra.query import SimpleStatement, PreparedStatement
+    from cassandra.query import BatchStatement, BatchType, SimpleStatement, PreparedStatement
     from cassandra.policies import DCAwareRoundRobinPolicy
     from cassandra import InvalidRequest, AlreadyExists
     CASSANDRA_AVAILABLE = True
@@ -25,8 +24,11 @@ except ImportError:
     PlainTextAuthProvider = None
 
 from .base_adapter import BaseAdapter
+from ..core.aggregates import Aggregate, Aggregator, Measure, aggregate_result
 from ..core.base_model import BaseModel
 from ..core.field import FieldConfig
+from ..core.filters import Node, comparisons, is_conjunction, parse_filters
+from ..core.pagination import Page, decode_cursor, encode_cursor
 from ..exceptions import (
     ConnectionError, 
     NotFoundError, 
@@ -40,6 +42,48 @@ from ..exceptions import (
 T = TypeVar('T', bound=BaseModel)
 
 
+def _resolve(future: "asyncio.Future[Any]", response: Any, error: Optional[BaseException]) -> None:
+    """
+    Settle an asyncio future from a driver ResponseFuture (on the loop's thread).
+    
+    A ResponseFuture runs its callbacks again for every page fetched after
+    the first, so an already settled future is left alone.
+    """
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        # The response is complete, so result() returns the ResultSet without blocking
+        future.set_result(response.result())
+
+
+class _WriteBatch:
+    """Writes queued by a Cassandra transaction, sent as one batch on commit."""
+    
+    def __init__(self):
+        self.writes: List[Tuple["PreparedStatement", Sequence[Any]]] = []
+        self.partitions = set()
+    
+    def add(self, statement: "PreparedStatement", values: Sequence[Any], table_name: str, partition_key: Any) -> None:
+        self.writes.append((statement, values))
+        self.partitions.add((table_name, partition_key))
+    
+    def to_statement(self) -> "BatchStatement":
+        """
+        Build the batch statement.
+        
+        Writes to a single partition are applied atomically and in isolation
+        without the batch log, so they are sent UNLOGGED; writes spanning
+        partitions use a LOGGED batch to keep them atomic.
+        """
+        batch_type = BatchType.UNLOGGED if len(self.partitions) <= 1 else BatchType.LOGGED
+        batch = BatchStatement(batch_type=batch_type)
+        for statement, values in self.writes:
+            batch.add(statement, values)
+        return batch
+
+
 class CassandraAdapter(BaseAdapter):
     """
     Cassandra adapter using cassandra-driver.
@@ -83,7 +127,6 @@ class CassandraAdapter(BaseAdapter):
         
         # Table tracking
         self.tables: Dict[str, str] = {}  # model_name -> table_name
-        self.prepared_statements: Dict[str, PreparedStatement] = {}
     
     async def connect(self) -> None:
         """Establish connection to Cassandra cluster."""
@@ -112,21 +155,162 @@ class CassandraAdapter(BaseAdapter):
                 control_connection_timeout=self.control_connection_timeout,
             )
             
-            # Connect to cluster
-            self.session = self.cluster.connect()
+            # Connect to cluster (blocking, so off the event loop); statements
+            # prepared on an earlier session are unusable
+            self.statement_cache.clear()
+            self.session = await asyncio.get_running_loop().run_in_executor(None, self.cluster.connect)
             self.session.default_timeout = self.request_timeout
             
             # Create keyspace if it doesn't exist
             await self._create_keyspace_if_not_exists()
             
             # Use the keyspace
-            self.session.set_keyspace(self.keyspace)
+            await self._execute(f"USE {self.keyspace}")
             
             self._is_connected = True
             
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Cassandra: {str(e)}", self.connection_string)
     
+    def _generate_primary_key(self, model: BaseModel) -> Any:
+        """Generate a UUID string for `id` primary keys, else model.generate_id()."""
+        if self.get_primary_key_field(model.__class__) == 'id':
+            return str(uuid.uuid4())
+        return model.generate_id()
+    
+    async def _execute(self, statement: Any, values: Optional[Sequence[Any]] = None, **kwargs: Any) -> Any:
+        """
+        Execute a statement without blocking the event loop.
+        
+        session.execute_async() sends the request from the driver's I/O
+        thread; its callbacks resolve an asyncio future on this loop, so any
+        number of queries can be in flight at once.
+        
+        Returns:
+            The driver's ResultSet (holding the first page of rows)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        response = self.session.execute_async(statement, values, **kwargs)
+        response.add_callbacks(
+            callback=lambda _: loop.call_soon_threadsafe(_resolve, future, response, None),
+            errback=lambda error: loop.call_soon_threadsafe(_resolve, future, response, error),
+        )
+        return await future
+    
+    async def _execute_pages(
+        self,
+        statement: "PreparedStatement",
+        values: Sequence[Any],
+        fetch_size: Optional[int] = None,
+        paging_state: Optional[bytes] = None,
+        prefetch: bool = True
+    ) -> AsyncIterator[Any]:
+        """
+        Yield the ResultSet of each page of a query.
+        
+        Iterating a ResultSet past its first page would fetch the next page
+        with a blocking call, so each page is requested with _execute() and
+        the previous page's paging_state instead. With prefetch, the next
+        page is requested before the current one is yielded, so it arrives
+        while the caller processes this one; at most two pages are held.
+        
+        Args:
+            statement: The prepared SELECT
+            values: Its bind values
+            fetch_size: Rows per page (default: the `fetch_size` option, else
+                the driver's 5000)
+            paging_state: Paging state to resume the scan from
+            prefetch: Whether to fetch the next page in the background
+        """
+        bound = statement.bind(values)
+        fetch_size = fetch_size or self.config.get('fetch_size')
+        if fetch_size:
+            bound.fetch_size = fetch_size
+        pending: Optional["asyncio.Future[Any]"] = asyncio.ensure_future(
+            self._execute(bound, paging_state=paging_state)
+        )
+        try:
+            while pending is not None:
+                result = await pending
+                pending = None
+                if not result.has_more_pages:
+                    yield result
+                    return
+                if prefetch:
+                    pending = asyncio.ensure_future(self._execute(bound, paging_state=result.paging_state))
+                yield result
+                if pending is None:
+                    pending = asyncio.ensure_future(self._execute(bound, paging_state=result.paging_state))
+        finally:
+            if pending is not None:
+                pending.cancel()
+    
+    async def _prepare(self, table_name: str, cql: str) -> "PreparedStatement":
+        """Prepare a CQL statement on a table once and reuse it."""
+        return await self._prepare_shape((table_name, "cql", cql), lambda: cql)
+    
+    async def _prepare_shape(self, key: Tuple[Hashable, ...], build_cql: Callable[[], str]) -> "PreparedStatement":
+        """
+        Prepare the statement for a shape key (table first, then operation
+        and columns), rendering its CQL only the first time.
+        
+        session.prepare() waits for a server round trip and the driver has
+        no asynchronous form, so it runs in the loop's default executor.
+        Prepared statements live in the statement cache, so create_table()
+        and drop_table() invalidate a table's statements and they are
+        prepared again against the new schema.
+        """
+        loop = asyncio.get_running_loop()
+        return await self.statement_cache.get_async(
+            key, lambda: loop.run_in_executor(None, self.session.prepare, build_cql())
+        )
+    
+    def _prepare_sync(self, table_name: str, cql: str) -> "PreparedStatement":
+        """Synchronous version of _prepare, for the *_sync paths that do not run a loop."""
+        return self.statement_cache.get((table_name, "cql", cql), lambda: self.session.prepare(cql))
+    
+    async def _begin_transaction(self) -> _WriteBatch:
+        """
+        Start queuing writes into a batch.
+        
+        Cassandra has no multi-statement transactions: writes in the block
+        are sent together as one batch on exit and are not visible to reads
+        inside the block. Keep such blocks small, as large batches are
+        rejected by the server.
+        """
+        return self._begin_transaction_sync()
+    
+    async def _commit_transaction(self, batch: _WriteBatch) -> None:
+        """Send the queued writes as one batch."""
+        if not batch.writes:
+            return
+        try:
+            await self._execute(batch.to_statement())
+        except Exception as e:
+            raise QueryError(f"Failed to commit transaction: {str(e)}")
+    
+    async def _rollback_transaction(self, batch: _WriteBatch) -> None:
+        """Discard the queued writes."""
+        self._rollback_transaction_sync(batch)
+    
+    def _begin_transaction_sync(self) -> _WriteBatch:
+        """Synchronous version of _begin_transaction."""
+        return _WriteBatch()
+    
+    def _commit_transaction_sync(self, batch: _WriteBatch) -> None:
+        """Synchronous version of _commit_transaction."""
+        if not batch.writes:
+            return
+        try:
+            self.session.execute(batch.to_statement())
+        except Exception as e:
+            raise QueryError(f"Failed to commit transaction: {str(e)}")
+    
+    def _rollback_transaction_sync(self, batch: _WriteBatch) -> None:
+        """Synchronous version of _rollback_transaction."""
+        batch.writes.clear()
+    
     async def disconnect(self) -> None:
         """Close Cassandra connections."""
         try:
@@ -150,7 +334,7 @@ class CassandraAdapter(BaseAdapter):
         """
         
         try:
-            self.session.execute(create_keyspace_cql)
+            await self._execute(create_keyspace_cql)
         except Exception as e:
             raise QueryError(f"Failed to create keyspace {self.keyspace}: {str(e)}")
     
@@ -165,8 +349,9 @@ class CassandraAdapter(BaseAdapter):
         cql = self._build_create_table_cql(model_class, table_name)
         
         try:
-            self.session.execute(cql)
+            await self._execute(cql)
             self.tables[table_name] = table_name
+            self.statement_cache.invalidate(table_name)
             
             # Create indexes
             await self._create_indexes(model_class, table_name)
@@ -178,45 +363,36 @@ class CassandraAdapter(BaseAdapter):
             raise QueryError(f"Failed to create table {table_name}: {str(e)}")
     
     def _build_create_table_cql(self, model_class: Type[BaseModel], table_name: str) -> str:
-        """Build CREATE TABLE CQL statement."""
+        """
+        Build CREATE TABLE CQL statement.
+        
+        The primary key, clustering order and table options follow the
+        model's __table_options__ (see _key_layout() and _table_options_cql()).
+        """
         columns = []
-        primary_key_fields = []
+        meta = self.get_model_meta(model_class)
+        partition_key, clustering = self._key_layout(model_class)
         
-        for field_info in fields(model_class):
-            field_name = field_info.name
-            field_type = field_info.type
-            config = field_info.metadata.get("norma_config")
+        for field_name in meta.field_names:
+            field_type = meta.field_types[field_name]
+            config = meta.field_configs[field_name]
             
             # Convert Python type to Cassandra type
             cql_type = self._python_type_to_cassandra(field_type, config)
             
             # Add column definition
-            column_def = f"{field_name} {cql_type}"
+            column_def = f"{meta.field_to_column[field_name]} {cql_type}"
             columns.append(column_def)
-            
-            # Track primary key fields
-            if config and config.primary_key:
-                primary_key_fields.append(field_name)
         
-        # Ensure we have at least one primary key
-        if not primary_key_fields:
-            # If no explicit primary key, use 'id' field or create one
-            id_field_exists = any(f.name == 'id' for f in fields(model_class))
-            if id_field_exists:
-                primary_key_fields = ['id']
-            else:
-                # Add a default primary key
-                columns.append("id UUID")
-                primary_key_fields = ['id']
-        
-        # Build primary key clause
-        if len(primary_key_fields) == 1:
-            primary_key_clause = f"PRIMARY KEY ({primary_key_fields[0]})"
-        else:
-            # For composite keys, first field is partition key, others are clustering keys
-            partition_key = primary_key_fields[0]
-            clustering_keys = ', '.join(primary_key_fields[1:])
-            primary_key_clause = f"PRIMARY KEY ({partition_key}, {clustering_keys})"
+        # Without an explicit primary key, use the 'id' column, adding one if needed
+        if not meta.primary_key_fields and 'id' not in meta.column_to_field:
+            columns.append("id UUID")
+        
+        # Build primary key clause: ((partition columns), clustering columns)
+        partition_clause = ", ".join(partition_key)
+        if len(partition_key) > 1:
+            partition_clause = f"({partition_clause})"
+        primary_key_clause = f"PRIMARY KEY ({', '.join([partition_clause] + [column for column, _ in clustering])})"
         
         # Build complete CQL
         columns_clause = ',\n    '.join(columns)
@@ -224,11 +400,119 @@ class CassandraAdapter(BaseAdapter):
         CREATE TABLE IF NOT EXISTS {table_name} (
             {columns_clause},
             {primary_key_clause}
-        )
-        """
+        )"""
         
+        table_options = self._table_options_cql(model_class, clustering)
+        if table_options:
+            cql += f" WITH {table_options}"
         return cql
     
+    # Options consumed by the key layout rather than rendered as table options
+    _KEY_OPTIONS = ("partition_key", "clustering_order")
+    
+    def _key_layout(self, model_class: Type[BaseModel]) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]:
+        """
+        Get a table's partition key columns and its clustering columns.
+        
+        Primary key fields form the partition key given by the
+        `partition_key` table option (a field name or a sequence of them,
+        by default the first primary key field); the remaining primary key
+        fields are clustering columns in declaration order, sorted as the
+        `clustering_order` option maps them ("ASC" by default).
+        
+        Example:
+            ```python
+            @dataclass
+            class Reading(BaseModel):
+                __table_options__ = {
+                    "partition_key": ("sensor", "day"),
+                    "clustering_order": {"ts": "DESC"},
+                    "default_time_to_live": 86400,
+                }
+                
+                sensor: str = Field(primary_key=True)
+                day: str = Field(primary_key=True)
+                ts: datetime = Field(primary_key=True)
+                value: float = Field(default=0.0)
+            ```
+        
+        Returns:
+            The partition key columns and (column, "ASC"/"DESC") pairs for
+            the clustering columns
+        
+        Raises:
+            ConfigurationError: If the options name fields that are not
+                primary key fields, or an unknown sort order
+        """
+        meta = self.get_model_meta(model_class)
+        options = meta.table_options
+        primary_key_fields = meta.primary_key_fields
+        if not primary_key_fields:
+            return ('id',), ()
+        
+        partition_fields = options.get('partition_key') or primary_key_fields[:1]
+        if isinstance(partition_fields, str):
+            partition_fields = (partition_fields,)
+        clustering_order = options.get('clustering_order') or {}
+        for name in list(partition_fields) + list(clustering_order):
+            if name not in primary_key_fields:
+                raise ConfigurationError(
+                    f"{model_class.__name__}.{name} is used in the table key but is not a primary key field"
+                )
+            if name in partition_fields and name in clustering_order:
+                raise ConfigurationError(f"{model_class.__name__}.{name} cannot be both a partition and a clustering column")
+        
+        clustering = []
+        for name in primary_key_fields:
+            if name in partition_fields:
+                continue
+            order = str(clustering_order.get(name, 'ASC')).upper()
+            if order not in ('ASC', 'DESC'):
+                raise ConfigurationError(f"Invalid clustering order '{order}' for {model_class.__name__}.{name}")
+            clustering.append((meta.field_to_column[name], order))
+        
+        partition_key = tuple(meta.field_to_column[name] for name in partition_fields)
+        return partition_key, tuple(clustering)
+    
+    def _table_options_cql(self, model_class: Type[BaseModel], clustering: Tuple[Tuple[str, str], ...]) -> str:
+        """
+        Render the WITH options of a model's table.
+        
+        Every __table_options__ entry other than the key layout is rendered
+        as `name = value`, so default_time_to_live, compaction, caching,
+        gc_grace_seconds and the like pass through to Cassandra. Mapping
+        values (compaction, caching) become CQL maps; a string compaction
+        names the strategy class.
+        """
+        table_options = self.get_model_meta(model_class).table_options
+        options = []
+        if clustering and table_options.get('clustering_order'):
+            options.append(f"CLUSTERING ORDER BY ({', '.join(f'{column} {order}' for column, order in clustering)})")
+        
+        for name, value in table_options.items():
+            if name in self._KEY_OPTIONS:
+                continue
+            if name == 'compaction' and isinstance(value, str):
+                value = {'class': value}
+            options.append(f"{name} = {self._cql_option_value(value)}")
+        return " AND ".join(options)
+    
+    @staticmethod
+    def _cql_option_value(value: Any) -> str:
+        """Render a table option value as a CQL literal (maps hold text values)."""
+        if isinstance(value, Mapping):
+            entries = ", ".join(
+                f"{CassandraAdapter._cql_option_value(str(key))}: "
+                f"{CassandraAdapter._cql_option_value(str(item).lower() if isinstance(item, bool) else str(item))}"
+                for key, item in value.items()
+            )
+            return f"{{{entries}}}"
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, (int, float)):
+            return str(value)
+        return "'" + str(value).replace("'", "''") + "'"
+    
     def _python_type_to_cassandra(self, python_type: Type, config: Optional[FieldConfig] = None) -> str:
         """Convert Python type to Cassandra CQL type."""
         # Handle Optional types
@@ -265,20 +549,19 @@ class CassandraAdapter(BaseAdapter):
     
     async def _create_indexes(self, model_class: Type[BaseModel], table_name: str) -> None:
         """Create secondary indexes for indexed fields."""
-        for field_info in fields(model_class):
-            config = field_info.metadata.get("norma_config")
-            if not config:
-                continue
-            
-            field_name = field_info.name
+        meta = self.get_model_meta(model_class)
+        
+        for field_name in meta.indexed_fields:
+            config = meta.field_configs[field_name]
             
             # Create secondary indexes (not for primary key fields)
             if config.index and not config.primary_key:
-                index_name = f"{table_name}_{field_name}_idx"
-                create_index_cql = f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({field_name})"
+                column = meta.field_to_column[field_name]
+                index_name = f"{table_name}_{column}_idx"
+                create_index_cql = f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({column})"
                 
                 try:
-                    self.session.execute(create_index_cql)
+                    await self._execute(create_index_cql)
                 except Exception as e:
                     # Index creation failures are usually not critical
                     pass
@@ -289,11 +572,12 @@ class CassandraAdapter(BaseAdapter):
         
         try:
             drop_cql = f"DROP TABLE IF EXISTS {table_name}"
-            self.session.execute(drop_cql)
+            await self._execute(drop_cql)
             
             # Remove from our table registry
             if table_name in self.tables:
                 del self.tables[table_name]
+            self.statement_cache.invalidate(table_name)
                 
         except Exception as e:
             raise QueryError(f"Failed to drop table {table_name}: {str(e)}")
@@ -308,27 +592,15 @@ class CassandraAdapter(BaseAdapter):
         if table_name not in self.tables:
             await self.create_table(model.__class__)
         
-        # Prepare data for insertion
-        data = model.to_dict(exclude_none=False)
-        
-        # Generate primary key if needed
-        pk_field = self.get_primary_key_field(model.__class__)
-        if not data.get(pk_field):
-            if pk_field == 'id':
-                # Generate UUID for id field
-                data[pk_field] = str(uuid.uuid4())
-                setattr(model, pk_field, data[pk_field])
-            else:
-                data[pk_field] = model.generate_id()
-                setattr(model, pk_field, data[pk_field])
-        
-        # Build INSERT statement
-        fields_str = ', '.join(data.keys())
-        placeholders = ', '.join(['?' for _ in data.keys()])
-        insert_cql = f"INSERT INTO {table_name} ({fields_str}) VALUES ({placeholders})"
+        # Prepare data for insertion, generating the primary key if needed
+        data = self._prepare_insert_data(model)
+        statement = await self._insert_statement(table_name, tuple(data))
+        values = list(data.values())
+        partition_key = self._partition_key(values, self._key_positions(model.__class__, tuple(data)))
         
         try:
-            self.session.execute(insert_cql, list(data.values()))
+            await self._execute_write(table_name, statement, values, partition_key)
+            self._mark_clean(model)
             return model
             
         except InvalidRequest as e:
@@ -338,8 +610,76 @@ class CassandraAdapter(BaseAdapter):
         except Exception as e:
             raise QueryError(f"Failed to insert record: {str(e)}")
     
-    async def update(self, model: T) -> T:
-        """Update an existing record."""
+    async def insert_many(self, models: Sequence[T], batch_size: int = 1000) -> List[T]:
+        """
+        Insert many records with concurrent prepared INSERTs.
+        
+        At most `concurrency` requests (default 100) are in flight; with the
+        `partition_batch_size` option, rows sharing a partition key are sent
+        together as UNLOGGED BATCHes (see _write_rows). Cassandra inserts are
+        upserts, so failures are driver errors (e.g. timeouts), reported per
+        record.
+        """
+        if not models:
+            return []
+        
+        model_class = self._bulk_model_class(models)
+        for model in models:
+            self.validate_model(model)
+        
+        table_name = self.get_table_name(model_class)
+        if table_name not in self.tables:
+            await self.create_table(model_class)
+        
+        meta = self.get_model_meta(model_class)
+        columns = meta.column_names
+        statement = await self._insert_statement(table_name, tuple(columns))
+        
+        rows = []
+        for model in models:
+            data = self._prepare_insert_data(model)
+            rows.append([data[column] for column in columns])
+        
+        errors = await self._write_rows(table_name, statement, rows, self._key_positions(model_class, columns), batch_size)
+        return self._finish_insert_many(models, errors)
+    
+    async def _insert_statement(self, table_name: str, columns: Tuple[str, ...]) -> "PreparedStatement":
+        """Get the prepared INSERT of these columns."""
+        return await self._prepare_shape(
+            (table_name, "insert", columns),
+            lambda: f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+        )
+    
+    async def upsert(self, model: T, conflict_fields: Optional[Sequence[str]] = None) -> T:
+        """
+        Insert or overwrite a record.
+        
+        CQL INSERT already overwrites an existing row with the same primary
+        key, so this is a plain insert. Cassandra has no other unique
+        constraints, so only the primary key can be the conflict target.
+        """
+        self._check_upsert_target(model.__class__, conflict_fields)
+        return await self.insert(model)
+    
+    async def upsert_many(
+        self,
+        models: Sequence[T],
+        batch_size: int = 1000,
+        conflict_fields: Optional[Sequence[str]] = None
+    ) -> List[T]:
+        """Insert or overwrite many records (see upsert and insert_many)."""
+        if not models:
+            return []
+        self._check_upsert_target(models[0].__class__, conflict_fields)
+        return await self.insert_many(models, batch_size)
+    
+    def _check_upsert_target(self, model_class: Type[BaseModel], conflict_fields: Optional[Sequence[str]]) -> None:
+        """Reject upsert conflict targets other than the (full) primary key."""
+        if conflict_fields and self._conflict_columns(model_class, conflict_fields) != self._key_columns(model_class):
+            raise QueryError("Cassandra can only upsert by primary key")
+    
+    async def update(self, model: T, full: bool = False) -> T:
+        """Update an existing record, writing only changed columns unless full=True."""
         self.validate_model(model)
         
         table_name = self.get_table_name(model.__class__)
@@ -347,49 +687,61 @@ class CassandraAdapter(BaseAdapter):
         if table_name not in self.tables:
             raise QueryError(f"Table {table_name} not found")
         
-        pk_field = self.get_primary_key_field(model.__class__)
-        pk_value = getattr(model, pk_field)
-        
-        if not pk_value:
-            raise ValidationError(f"Primary key field '{pk_field}' is required for update")
+        model_class = model.__class__
+        for pk_field in self.get_model_meta(model_class).primary_key_fields:
+            if getattr(model, pk_field) in (None, ""):
+                raise ValidationError(f"Primary key field '{pk_field}' is required for update")
         
-        # Prepare data for update (exclude primary key)
-        data = model.to_dict(exclude_none=False)
-        update_data = {k: v for k, v in data.items() if k != pk_field}
+        # Prepare data for update (changed columns only, excluding primary key).
+        # Rewriting unchanged columns would also write tombstones for Nones.
+        update_data = self._get_update_data(model, full)
         
         if not update_data:
             return model  # Nothing to update
         
-        # Build UPDATE statement
-        set_clause = ', '.join([f"{k} = ?" for k in update_data.keys()])
-        update_cql = f"UPDATE {table_name} SET {set_clause} WHERE {pk_field} = ?"
+        key_columns = self._key_columns(model_class)
+        statement = await self._update_statement(table_name, tuple(update_data), key_columns)
         
         try:
-            values = list(update_data.values()) + [pk_value]
-            self.session.execute(update_cql, values)
+            values = list(update_data.values()) + self._key_values(model_class, self._model_key(model))
+            partition_key = self._partition_key(values, self._key_positions(model_class, tuple(update_data) + key_columns))
+            await self._execute_write(table_name, statement, values, partition_key)
+            self._mark_clean(model)
             return model
             
         except Exception as e:
             raise QueryError(f"Failed to update record: {str(e)}")
     
-    async def find_by_id(self, model_class: Type[T], id_value: Any) -> Optional[T]:
-        """Find a record by primary key."""
+    async def _update_statement(self, table_name: str, columns: Tuple[str, ...], key_columns: Tuple[str, ...]) -> "PreparedStatement":
+        """Get the prepared single-row UPDATE of these columns."""
+        return await self._prepare_shape(
+            (table_name, "update", columns),
+            lambda: f"UPDATE {table_name} SET {', '.join(f'{column} = ?' for column in columns)} WHERE {self._key_condition(key_columns)}",
+        )
+    
+    async def find_by_id(
+        self,
+        model_class: Type[T],
+        id_value: Any,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Optional[T]:
+        """Find a record by primary key (a tuple of values for composite keys, see _key_values)."""
         table_name = self.get_table_name(model_class)
         
         if table_name not in self.tables:
             return None
         
-        pk_field = self.get_primary_key_field(model_class)
+        key_values = self._key_values(model_class, id_value)
+        projection = self._projection(model_class, fields, exclude)
+        statement = await self._find_by_id_statement(table_name, self._key_columns(model_class), projection)
         
         try:
-            select_cql = f"SELECT * FROM {table_name} WHERE {pk_field} = ?"
-            result = self.session.execute(select_cql, [id_value])
+            result = await self._execute(statement, key_values)
             row = result.one()
             
             if row:
-                # Convert row to dictionary
-                row_dict = dict(row._asdict())
-                return model_class.from_dict(row_dict)
+                return self._models_from_rows(model_class, [row], result.column_names, bool(projection))[0]
             
             return None
             
@@ -398,77 +750,673 @@ class CassandraAdapter(BaseAdapter):
                 return None
             raise QueryError(f"Failed to find record: {str(e)}")
     
+    async def find_by_ids(
+        self,
+        model_class: Type[T],
+        ids: Sequence[Any],
+        preserve_order: bool = True,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        batch_size: int = 1000
+    ) -> Union[List[Optional[T]], Dict[Any, T]]:
+        """
+        Find many records by primary key with concurrent single-partition reads.
+        
+        A multi-partition IN query makes one coordinator wait on every
+        partition, so each distinct key is read with its own prepared SELECT
+        instead, routed straight to a replica; at most `concurrency` reads
+        (default 100) are in flight.
+        """
+        table_name = self.get_table_name(model_class)
+        
+        if table_name not in self.tables:
+            return self._finish_find_by_ids(ids, {}, preserve_order)
+        
+        projection = self._projection(model_class, fields, exclude)
+        statement = await self._find_by_id_statement(table_name, self._key_columns(model_class), projection)
+        
+        rows = []
+        column_names = None
+        for _, batch in self._batches(self._unique_ids(ids), batch_size):
+            results = await self._execute_concurrent([
+                (statement, self._key_values(model_class, id_value)) for id_value in batch
+            ])
+            failed = [(id_value, result) for id_value, (success, result) in zip(batch, results) if not success]
+            if failed:
+                raise QueryError(
+                    f"Failed to find {len(failed)} of {len(batch)} records: {failed[0][1]}",
+                    params={"ids": [id_value for id_value, _ in failed]},
+                )
+            for _, result in results:
+                row = result.one()
+                if row is not None:
+                    rows.append(row)
+                    column_names = result.column_names
+        
+        models = self._models_from_rows(model_class, rows, column_names, bool(projection)) if rows else []
+        found = {self._model_key(model): model for model in models}
+        return self._finish_find_by_ids(ids, found, preserve_order)
+    
+    async def _find_by_id_statement(
+        self,
+        table_name: str,
+        key_columns: Tuple[str, ...],
+        projection: Optional[Tuple[str, ...]]
+    ) -> "PreparedStatement":
+        """Get the prepared single-row SELECT of find_by_id/find_by_ids."""
+        return await self._prepare_shape(
+            (table_name, "find_by_id", projection),
+            lambda: f"SELECT {self._select_list(projection)} FROM {table_name} WHERE {self._key_condition(key_columns)}",
+        )
+    
     async def find_many(
         self, 
         model_class: Type[T], 
         filters: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        order_by: Optional[List[str]] = None
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
     ) -> List[T]:
-        """Find multiple records."""
+        """
+        Find multiple records, reading every page of the result.
+        
+        CQL has no OFFSET, so `offset` rows are read and discarded; use
+        find_page() or iter_pages() cursors to page deep into a table. The
+        `fetch_size` option sets the rows per page.
+        """
         table_name = self.get_table_name(model_class)
         
         if table_name not in self.tables:
             return []
         
-        # Build SELECT statement
-        select_cql = f"SELECT * FROM {table_name}"
-        values = []
-        
-        # Add WHERE clause
-        if filters:
-            where_conditions = []
-            for field, value in filters.items():
-                if isinstance(value, dict):
-                    # Handle operators - Cassandra has limited operator support
-                    for op, op_value in value.items():
-                        if op == "$eq" or op == "=":
-                            where_conditions.append(f"{field} = ?")
-                            values.append(op_value)
-                        # Note: Cassandra doesn't support range queries without proper modeling
-                        # This is a simplified implementation
+        projection = self._projection(model_class, fields, exclude)
+        skip = offset or 0
+        select_cql, values = self._select_query(model_class, filters, order_by, limit and limit + skip, projection)
+        
+        try:
+            models = []
+            statement = await self._prepare(table_name, select_cql)
+            async for result in self._execute_pages(statement, values):
+                rows = result.current_rows
+                if skip:
+                    skipped = min(skip, len(rows))
+                    rows, skip = rows[skipped:], skip - skipped
+                models.extend(self._models_from_rows(model_class, rows, result.column_names, bool(projection)))
+            
+        except Exception as e:
+            raise QueryError(f"Failed to find records: {str(e)}")
+        
+        if include:
+            await self.load_related(model_class, models, include)
+        return models
+    
+    async def stream(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[T]:
+        """Stream records page by page, fetching batch_size rows per page."""
+        table_name = self.get_table_name(model_class)
+        if table_name not in self.tables:
+            return
+        
+        projection = self._projection(model_class, fields, exclude)
+        select_cql, values = self._select_query(model_class, filters, order_by, columns=projection)
+        try:
+            statement = await self._prepare(table_name, select_cql)
+            async for result in self._execute_pages(statement, values, batch_size):
+                for model in self._models_from_rows(model_class, result.current_rows, result.column_names, bool(projection)):
+                    yield model
+            
+        except Exception as e:
+            raise QueryError(f"Failed to stream records: {str(e)}")
+    
+    async def find_page(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Page[T]:
+        """
+        Find one page of records, using the driver's paging state as the cursor.
+        
+        Cassandra pages natively, so no keyset predicate is added and rows come
+        back in partition/clustering order; `order_by` may only name
+        clustering columns.
+        """
+        pages = self._scan_pages(model_class, filters, order_by, after, limit, fields, exclude, prefetch=False)
+        try:
+            return await pages.__anext__()
+        except StopAsyncIteration:
+            return Page()
+        finally:
+            await pages.aclose()
+    
+    async def iter_pages(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[Page[T]]:
+        """
+        Iterate over pages of `limit` records, fetching each next page in the
+        background while the current one is processed.
+        
+        Pages carry the cursor (the driver's paging state) of the following
+        page, so an interrupted scan can resume from after=page.next_cursor.
+        """
+        async for page in self._scan_pages(model_class, filters, order_by, after, limit, fields, exclude, prefetch=True):
+            yield page
+    
+    async def _scan_pages(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]],
+        order_by: Optional[List[str]],
+        after: Optional[str],
+        limit: int,
+        fields: Optional[Sequence[str]],
+        exclude: Optional[Sequence[str]],
+        prefetch: bool
+    ) -> AsyncIterator[Page[T]]:
+        """Yield the pages of find_page()/iter_pages(), resuming from the cursor `after`."""
+        if limit < 1:
+            raise QueryError("Page limit must be at least 1")
+        table_name = self.get_table_name(model_class)
+        if table_name not in self.tables:
+            return
+        
+        projection = self._projection(model_class, fields, exclude)
+        select_cql, values = self._select_query(model_class, filters, order_by, columns=projection)
+        paging_state = None
+        if after is not None:
+            paging_state = decode_cursor(after).get("paging_state")
+            if not isinstance(paging_state, bytes):
+                raise QueryError("Invalid page cursor")
+        
+        statement = await self._prepare(table_name, select_cql)
+        pages = self._execute_pages(statement, values, limit, paging_state, prefetch)
+        try:
+            async for result in pages:
+                items = self._models_from_rows(model_class, result.current_rows, result.column_names, bool(projection))
+                if not result.has_more_pages:
+                    yield Page(items)
                 else:
-                    where_conditions.append(f"{field} = ?")
-                    values.append(value)
+                    yield Page(items, encode_cursor({"paging_state": result.paging_state}))
             
-            if where_conditions:
-                select_cql += " WHERE " + " AND ".join(where_conditions)
+        except QueryError:
+            raise
+        except Exception as e:
+            raise QueryError(f"Failed to find records: {str(e)}")
+        finally:
+            await pages.aclose()
+    
+    def _select_query(
+        self,
+        model_class: Type[BaseModel],
+        filters: Optional[Dict[str, Any]],
+        order_by: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        columns: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        """Build the SELECT for find_many/stream and its bind values."""
+        table_name = self.get_table_name(model_class)
+        where, values, allow_filtering = self._where_clause(model_class, filters)
+        select_cql = f"SELECT {self._select_list(columns)} FROM {table_name}"
+        if where:
+            select_cql += f" WHERE {where}"
         
         # Add ordering (limited in Cassandra)
         if order_by:
-            # Cassandra only allows ordering by clustering columns
-            # This is a simplified implementation
-            order_clause = []
-            for field in order_by:
-                if field.startswith('-'):
-                    order_clause.append(f"{field[1:]} DESC")
-                else:
-                    order_clause.append(f"{field} ASC")
-            if order_clause:
-                select_cql += " ORDER BY " + ", ".join(order_clause)
+            select_cql += " ORDER BY " + self._order_clause(model_class, order_by)
         
         # Add limit
         if limit:
-            select_cql += f" LIMIT {limit}"
+            select_cql += " LIMIT ?"
+            values = values + (limit,)
         
-        # Note: Cassandra doesn't support OFFSET, this is a limitation
-        if offset:
-            # In real implementation, you'd need to implement pagination differently
-            pass
+        if allow_filtering:
+            select_cql += " ALLOW FILTERING"
+        return select_cql, values
+    
+    def _order_clause(self, model_class: Type[BaseModel], order_by: List[str]) -> str:
+        """
+        Render an ORDER BY clause, which Cassandra only accepts for a prefix
+        of the clustering columns sorted in their declared order or all
+        reversed.
+        
+        Raises:
+            QueryError: If the ordering is not one the table can serve
+        """
+        _, clustering = self._key_layout(model_class)
+        order_clause = []
+        reversed_order = set()
+        for position, field in enumerate(order_by):
+            descending = field.startswith('-')
+            column = self._column_name(model_class, field[1:] if descending else field)
+            if position >= len(clustering) or clustering[position][0] != column:
+                raise QueryError(
+                    f"Cannot order {model_class.__name__} by '{field}': Cassandra only orders by "
+                    f"clustering columns, in key order"
+                )
+            order = "DESC" if descending else "ASC"
+            reversed_order.add(order != clustering[position][1])
+            order_clause.append(f"{column} {order}")
+        
+        if len(reversed_order) > 1:
+            raise QueryError(
+                f"Cannot order {model_class.__name__} by {order_by}: clustering columns must all follow "
+                f"or all reverse the table's clustering order"
+            )
+        return ", ".join(order_clause)
+    
+    @staticmethod
+    def _select_list(columns: Optional[Tuple[str, ...]]) -> str:
+        """Render the selected columns, or * for a whole row."""
+        return ", ".join(columns) if columns else "*"
+    
+    def _pages(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]],
+        batch_size: int,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Iterator[List[T]]:
+        """Yield the models of each driver page, fetching the next page on demand."""
+        table_name = self.get_table_name(model_class)
+        if table_name not in self.tables:
+            return
+        
+        projection = self._projection(model_class, fields, exclude)
+        select_cql, values = self._select_query(model_class, filters, order_by, columns=projection)
         
         try:
-            result = self.session.execute(select_cql, values)
+            statement = self._prepare_sync(table_name, select_cql).bind(values)
+            statement.fetch_size = batch_size
+            result = self.session.execute(statement)
+            while True:
+                yield self._models_from_rows(model_class, result.current_rows, result.column_names, bool(projection))
+                if not result.has_more_pages:
+                    break
+                result.fetch_next_page()
             
-            models = []
-            for row in result:
-                row_dict = dict(row._asdict())
-                models.append(model_class.from_dict(row_dict))
-            
-            return models
+        except Exception as e:
+            raise QueryError(f"Failed to stream records: {str(e)}")
+    
+    async def update_many(
+        self,
+        model_class: Type[T],
+        filters: Dict[str, Any],
+        changes: Dict[str, Any]
+    ) -> int:
+        """
+        Update all matching rows.
+        
+        CQL can only update rows by primary key, so matching keys are read
+        first (see _matching_keys) and one prepared single-partition UPDATE
+        per key is executed concurrently.
+        """
+        table_name = self.get_table_name(model_class)
+        
+        if table_name not in self.tables:
+            return 0
+        
+        update_data = self._get_bulk_changes(model_class, changes)
+        key_columns = self._key_columns(model_class)
+        keys = await self._matching_keys(model_class, filters)
+        
+        statement = await self._update_statement(table_name, tuple(update_data), key_columns)
+        values = list(update_data.values())
+        key_positions = self._key_positions(model_class, tuple(update_data) + key_columns)
+        return await self._write_partitions(table_name, statement, [values + key for key in keys], key_positions, "update")
+    
+    async def delete_many(self, model_class: Type[T], filters: Dict[str, Any]) -> int:
+        """
+        Delete all matching rows.
+        
+        Matching keys are read first (see _matching_keys) and one prepared
+        single-partition DELETE per key is executed concurrently.
+        """
+        table_name = self.get_table_name(model_class)
+        
+        if table_name not in self.tables:
+            return 0
+        
+        key_columns = self._key_columns(model_class)
+        keys = await self._matching_keys(model_class, filters)
+        
+        statement = await self._delete_statement(table_name, key_columns)
+        key_positions = self._key_positions(model_class, key_columns)
+        return await self._write_partitions(table_name, statement, keys, key_positions, "delete")
+    
+    async def delete_many_by_ids(self, model_class: Type[T], ids: Sequence[Any], batch_size: int = 1000) -> int:
+        """
+        Delete many records by primary key with concurrent prepared DELETEs.
+        
+        Requests are bounded and grouped like insert_many(). Cassandra does
+        not report whether a row existed, so every distinct ID counts as
+        deleted.
+        
+        Raises:
+            BulkWriteError: With one error per ID whose delete failed; the
+                other IDs are still deleted
+        """
+        table_name = self.get_table_name(model_class)
+        
+        if table_name not in self.tables:
+            return 0
+        
+        key_columns = self._key_columns(model_class)
+        rows = [self._key_values(model_class, id_value) for id_value in self._unique_ids(ids)]
+        statement = await self._delete_statement(table_name, key_columns)
+        errors = await self._write_rows(table_name, statement, rows, self._key_positions(model_class, key_columns), batch_size)
+        self._check_bulk_errors(errors, len(rows) - len(errors))
+        return len(rows)
+    
+    # CQL relation for each supported filter operator ($ne, $nin and null
+    # checks have no CQL equivalent; $like needs a SASI index)
+    _FILTER_OPERATORS = {
+        "$eq": "=",
+        "$gt": ">",
+        "$gte": ">=",
+        "$lt": "<",
+        "$lte": "<=",
+        "$in": "IN",
+        "$like": "LIKE",
+    }
+    
+    def _where_clause(
+        self,
+        model_class: Type[BaseModel],
+        filters: Optional[Dict[str, Any]]
+    ) -> Tuple[str, Tuple[Any, ...], bool]:
+        """
+        Compile a filter dictionary into a CQL WHERE clause and bind values.
+        
+        The clause is cached by filter shape. Filters that only restrict the
+        partition key by equality or IN are answered directly from those
+        partitions; any other filter needs ALLOW FILTERING.
+        
+        Returns:
+            The clause (empty without filters), its bind values and whether
+            the query needs ALLOW FILTERING
+        
+        Raises:
+            QueryError: For unknown fields, $or, or operators CQL cannot express
+        """
+        if not filters:
+            return "", (), False
+        shape, values = parse_filters(filters, self.get_model_meta(model_class).field_to_column)
+        key = (self.get_table_name(model_class), "where", shape)
+        where, allow_filtering = self.statement_cache.get(key, lambda: self._compile_where(model_class, shape))
+        return where, values, allow_filtering
+    
+    def _compile_where(self, model_class: Type[BaseModel], node: Node) -> Tuple[str, bool]:
+        """Render a filter AST as a CQL conjunction."""
+        if not is_conjunction(node):
+            raise QueryError("Cassandra does not support $or filters")
+        
+        column_to_field = self.get_model_meta(model_class).column_to_field
+        conditions = []
+        restrictions: Dict[str, List[str]] = {}
+        for comparison in comparisons(node):
+            if comparison.column not in column_to_field:
+                raise QueryError(f"Unknown filter field '{comparison.column or comparison.op}' for {model_class.__name__}")
+            relation = self._FILTER_OPERATORS.get(comparison.op)
+            if relation is None:
+                raise QueryError(f"Unsupported filter operator '{comparison.op}' for Cassandra")
+            conditions.append(f"{comparison.column} {relation} ?")
+            restrictions.setdefault(comparison.column, []).append(comparison.op)
+        
+        return " AND ".join(conditions), self._needs_filtering(model_class, restrictions)
+    
+    def _needs_filtering(self, model_class: Type[BaseModel], restrictions: Mapping[str, Sequence[str]]) -> bool:
+        """
+        Check whether restrictions on columns (their filter operators) need
+        ALLOW FILTERING.
+        
+        Cassandra serves a query from the primary key when every partition
+        key column is restricted by equality or IN and the clustering
+        columns are restricted in order: equality or IN on a prefix,
+        optionally followed by a range on the next clustering column.
+        """
+        partition_key, clustering = self._key_layout(model_class)
+        for column in partition_key:
+            if column not in restrictions or any(op not in ("$eq", "$in") for op in restrictions[column]):
+                return True
+        
+        remaining = len(restrictions) - len(partition_key)
+        for column, _ in clustering:
+            if remaining == 0:
+                break
+            if column not in restrictions:
+                return True  # a later clustering column skips this one
+            ops = restrictions[column]
+            remaining -= 1
+            if all(op in ("$eq", "$in") for op in ops) and len(ops) == 1:
+                continue
+            # A range must be the last restricted clustering column
+            return remaining > 0 or any(op not in ("$gt", "$gte", "$lt", "$lte") for op in ops)
+        return remaining > 0
+    
+    async def _matching_keys(self, model_class: Type[BaseModel], filters: Dict[str, Any]) -> List[List[Any]]:
+        """
+        Plan a set-based write by reading the primary keys of matching rows.
+        
+        Returns:
+            The values of every primary key column (see _key_columns) per row
+        """
+        table_name = self.get_table_name(model_class)
+        where, values, allow_filtering = self._where_clause(model_class, filters)
+        
+        select_cql = f"SELECT {', '.join(self._key_columns(model_class))} FROM {table_name}"
+        if where:
+            select_cql += f" WHERE {where}"
+        if allow_filtering:
+            select_cql += " ALLOW FILTERING"
+        
+        try:
+            statement = await self._prepare(table_name, select_cql)
+            return [
+                list(row)
+                async for result in self._execute_pages(statement, values)
+                for row in result.current_rows
+            ]
             
         except Exception as e:
-            raise QueryError(f"Failed to find records: {str(e)}")
+            raise QueryError(f"Failed to find matching records: {str(e)}")
+    
+    async def _execute_write(
+        self,
+        table_name: str,
+        statement: "PreparedStatement",
+        values: Sequence[Any],
+        partition_key: Any
+    ) -> None:
+        """Execute a prepared single-partition write, or queue it in the active transaction."""
+        batch = self._active_transaction.get()
+        if batch is not None:
+            batch.add(statement, values, table_name, partition_key)
+        else:
+            await self._execute(statement, values)
+    
+    async def _write_partitions(
+        self,
+        table_name: str,
+        statement: "PreparedStatement",
+        parameters: List[List[Any]],
+        key_positions: Tuple[int, ...],
+        action: str
+    ) -> int:
+        """
+        Execute a prepared single-row write once per parameter list,
+        concurrently. The partition key is the parameters at key_positions.
+        """
+        errors = await self._write_rows(table_name, statement, parameters, key_positions, len(parameters) or 1)
+        if errors:
+            raise QueryError(f"Failed to {action} {len(errors)} record(s): {errors[0]['message']}")
+        return len(parameters)
+    
+    async def _write_rows(
+        self,
+        table_name: str,
+        statement: "PreparedStatement",
+        rows: Sequence[Sequence[Any]],
+        key_positions: Tuple[int, ...],
+        batch_size: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a prepared write once per row, batch_size rows at a time.
+        
+        Rows are queued in the active transaction if there is one. Otherwise
+        each row is its own request, at most `concurrency` in flight; with
+        the `partition_batch_size` option, rows sharing a partition key (the
+        values at key_positions) are grouped into UNLOGGED BATCHes of up to
+        that many rows. Such a batch goes to one replica set and is applied
+        atomically without the batch log; batching rows of different
+        partitions would only add coordinator work.
+        
+        Returns:
+            One error (see _bulk_error) per failed row, indexed into `rows`
+        """
+        batch = self._active_transaction.get()
+        if batch is not None:
+            for values in rows:
+                batch.add(statement, values, table_name, self._partition_key(values, key_positions))
+            return []
+        
+        partition_batch_size = self.config.get('partition_batch_size', 0)
+        errors: List[Dict[str, Any]] = []
+        for batch_number, (start, chunk) in enumerate(self._batches(rows, batch_size)):
+            groups = self._partition_groups(chunk, key_positions, partition_batch_size)
+            statements = []
+            for group in groups:
+                if len(group) == 1:
+                    statements.append((statement, chunk[group[0]]))
+                else:
+                    unlogged = BatchStatement(batch_type=BatchType.UNLOGGED)
+                    for index in group:
+                        unlogged.add(statement, chunk[index])
+                    statements.append((unlogged, None))
+            
+            results = await self._execute_concurrent(statements)
+            for group, (success, result) in zip(groups, results):
+                if not success:
+                    errors.extend(self._bulk_error(batch_number, start + index, result) for index in group)
+        return errors
+    
+    @staticmethod
+    def _partition_groups(
+        rows: Sequence[Sequence[Any]],
+        key_positions: Tuple[int, ...],
+        partition_batch_size: int
+    ) -> List[List[int]]:
+        """Group row indexes by partition key, up to partition_batch_size rows per group."""
+        if partition_batch_size <= 1:
+            return [[index] for index in range(len(rows))]
+        partitions: Dict[Any, List[int]] = {}
+        for index, values in enumerate(rows):
+            partitions.setdefault(CassandraAdapter._partition_key(values, key_positions), []).append(index)
+        return [
+            indexes[offset:offset + partition_batch_size]
+            for indexes in partitions.values()
+            for offset in range(0, len(indexes), partition_batch_size)
+        ]
+    
+    @staticmethod
+    def _partition_key(values: Sequence[Any], key_positions: Tuple[int, ...]) -> Any:
+        """Get a row's partition key: a single value, or a tuple for composite keys."""
+        if len(key_positions) == 1:
+            return values[key_positions[0]]
+        return tuple(values[position] for position in key_positions)
+    
+    async def _execute_concurrent(self, statements: Sequence[Tuple[Any, Optional[Sequence[Any]]]]) -> List[Tuple[bool, Any]]:
+        """
+        Execute (statement, values) pairs with at most `concurrency` (default
+        100) in flight.
+        
+        Like the driver's execute_concurrent(raise_on_first_error=False), but
+        without blocking the event loop: results come back in input order as
+        (True, ResultSet) or (False, exception).
+        """
+        results: List[Tuple[bool, Any]] = [(False, None)] * len(statements)
+        positions = iter(range(len(statements)))
+        
+        async def worker() -> None:
+            for position in positions:
+                statement, values = statements[position]
+                try:
+                    results[position] = (True, await self._execute(statement, values))
+                except Exception as e:
+                    results[position] = (False, e)
+        
+        concurrency = self.config.get('concurrency', 100)
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(statements)))))
+        return results
+    
+    def _partition_key_columns(self, model_class: Type[BaseModel]) -> Tuple[str, ...]:
+        """Get the columns of a table's partition key."""
+        return self._key_layout(model_class)[0]
+    
+    def _key_positions(self, model_class: Type[BaseModel], columns: Sequence[str]) -> Tuple[int, ...]:
+        """Get the positions of the partition key columns in a row of these columns."""
+        return tuple(columns.index(column) for column in self._partition_key_columns(model_class))
+    
+    def _key_columns(self, model_class: Type[BaseModel]) -> Tuple[str, ...]:
+        """Get the columns of a table's full primary key, in field declaration order."""
+        meta = self.get_model_meta(model_class)
+        if not meta.primary_key_fields:
+            return ('id',)
+        return tuple(meta.field_to_column[name] for name in meta.primary_key_fields)
+    
+    def _key_values(self, model_class: Type[BaseModel], id_value: Any) -> List[Any]:
+        """
+        Get the bind values of a primary key for _key_condition().
+        
+        Models with several primary key fields are identified by a tuple of
+        their values, in field declaration order.
+        
+        Raises:
+            QueryError: If a composite key is not given as such a tuple
+        """
+        key_columns = self._key_columns(model_class)
+        if len(key_columns) == 1:
+            return [id_value]
+        if not isinstance(id_value, (tuple, list)) or len(id_value) != len(key_columns):
+            raise QueryError(
+                f"{model_class.__name__} has a composite primary key; identify records by a "
+                f"({', '.join(key_columns)}) tuple"
+            )
+        return list(id_value)
+    
+    def _model_key(self, model: BaseModel) -> Any:
+        """Get a model's primary key: its value, or a tuple for composite keys."""
+        primary_key_fields = self.get_model_meta(model.__class__).primary_key_fields
+        if len(primary_key_fields) > 1:
+            return tuple(getattr(model, name) for name in primary_key_fields)
+        return model.get_primary_key_value()
+    
+    @staticmethod
+    def _key_condition(key_columns: Tuple[str, ...]) -> str:
+        """Render the WHERE condition restricting every primary key column."""
+        return " AND ".join(f"{column} = ?" for column in key_columns)
     
     async def delete_by_id(self, model_class: Type[T], id_value: Any) -> bool:
         """Delete a record by primary key."""
@@ -477,11 +1425,13 @@ class CassandraAdapter(BaseAdapter):
         if table_name not in self.tables:
             return False
         
-        pk_field = self.get_primary_key_field(model_class)
+        key_columns = self._key_columns(model_class)
+        key_values = self._key_values(model_class, id_value)
+        statement = await self._delete_statement(table_name, key_columns)
         
         try:
-            delete_cql = f"DELETE FROM {table_name} WHERE {pk_field} = ?"
-            self.session.execute(delete_cql, [id_value])
+            partition_key = self._partition_key(key_values, self._key_positions(model_class, key_columns))
+            await self._execute_write(table_name, statement, key_values, partition_key)
             
             # Cassandra doesn't return affected row count, so we assume success
             return True
@@ -489,6 +1439,12 @@ class CassandraAdapter(BaseAdapter):
         except Exception as e:
             raise QueryError(f"Failed to delete record: {str(e)}")
     
+    async def _delete_statement(self, table_name: str, key_columns: Tuple[str, ...]) -> "PreparedStatement":
+        """Get the prepared single-row DELETE."""
+        return await self._prepare_shape(
+            (table_name, "delete"), lambda: f"DELETE FROM {table_name} WHERE {self._key_condition(key_columns)}"
+        )
+    
     async def count(
         self, 
         model_class: Type[T], 
@@ -501,35 +1457,119 @@ class CassandraAdapter(BaseAdapter):
             return 0
         
         # Build COUNT query
+        where, values, allow_filtering = self._where_clause(model_class, filters)
         count_cql = f"SELECT COUNT(*) FROM {table_name}"
-        values = []
-        
-        # Add WHERE clause
-        if filters:
-            where_conditions = []
-            for field, value in filters.items():
-                where_conditions.append(f"{field} = ?")
-                values.append(value)
-            
-            if where_conditions:
-                count_cql += " WHERE " + " AND ".join(where_conditions)
+        if where:
+            count_cql += f" WHERE {where}"
+        if allow_filtering:
+            count_cql += " ALLOW FILTERING"
         
         try:
-            result = self.session.execute(count_cql, values)
+            result = await self._execute(await self._prepare(table_name, count_cql), values)
             row = result.one()
             return row.count if row else 0
                     
         except Exception as e:
             raise QueryError(f"Failed to count records: {str(e)}")
     
+    async def aggregate(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        group_by: Optional[Sequence[str]] = None,
+        metrics: Optional[Mapping[str, Aggregate]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Compute metrics per group with CQL aggregate functions.
+        
+        CQL can only GROUP BY a prefix of the primary key (the partition key,
+        then clustering columns). Other groupings are aggregated in Python
+        over a paged scan of just the needed columns. Note that CQL's avg()
+        keeps the column type, so the mean of an int column is truncated.
+        """
+        groups, measures = self._aggregate_spec(model_class, group_by, metrics)
+        table_name = self.get_table_name(model_class)
+        
+        if table_name not in self.tables:
+            return Aggregator(groups, measures).results()
+        
+        meta = self.get_model_meta(model_class)
+        key_columns = [meta.field_to_column[name] for name in meta.primary_key_fields]
+        group_columns = [column for _, column in groups]
+        if group_columns != key_columns[:len(group_columns)]:
+            return await super().aggregate(model_class, filters, group_by, metrics)
+        
+        where, values, allow_filtering = self._where_clause(model_class, filters)
+        aggregate_cql = f"SELECT {self._aggregate_list(groups, measures)} FROM {table_name}"
+        if where:
+            aggregate_cql += f" WHERE {where}"
+        if group_columns:
+            aggregate_cql += f" GROUP BY {', '.join(group_columns)}"
+        if allow_filtering:
+            aggregate_cql += " ALLOW FILTERING"
+        
+        try:
+            statement = await self._prepare(table_name, aggregate_cql)
+            return [
+                self._aggregate_result(row, groups, measures)
+                async for result in self._execute_pages(statement, values)
+                for row in result.current_rows
+            ]
+                    
+        except Exception as e:
+            raise QueryError(f"Failed to aggregate records: {str(e)}")
+    
+    @staticmethod
+    def _aggregate_list(groups: Tuple[Tuple[str, str], ...], measures: Tuple[Measure, ...]) -> str:
+        """
+        Render the select list of an aggregate query.
+        
+        CQL's sum() returns 0 rather than null when no value is present, so
+        each Sum is followed by a count of its column to tell the two apart.
+        """
+        selected = [column for _, column in groups]
+        for _, function, column in measures:
+            selected.append("count(*)" if column is None else f"{function}({column})")
+        selected.extend(f"count({column})" for _, function, column in measures if function == "sum")
+        return ", ".join(selected)
+    
+    @staticmethod
+    def _aggregate_result(row: Sequence[Any], groups: Tuple[Tuple[str, str], ...], measures: Tuple[Measure, ...]) -> Dict[str, Any]:
+        """Split an aggregate row into group keys and metric values."""
+        position = len(groups) + len(measures)
+        values = list(row[len(groups):position])
+        for index, (_, function, _) in enumerate(measures):
+            if function == "sum":
+                if not row[position]:
+                    values[index] = None
+                position += 1
+        return aggregate_result(groups, measures, row[:len(groups)], values)
+    
     async def exists(
         self, 
         model_class: Type[T], 
         filters: Dict[str, Any]
     ) -> bool:
-        """Check if records exist matching criteria."""
-        count = await self.count(model_class, filters)
-        return count > 0
+        """Check if records exist matching criteria by reading at most one key."""
+        table_name = self.get_table_name(model_class)
+        
+        if table_name not in self.tables:
+            return False
+        
+        where, values, allow_filtering = self._where_clause(model_class, filters)
+        exists_cql = f"SELECT {', '.join(self._key_columns(model_class))} FROM {table_name}"
+        if where:
+            exists_cql += f" WHERE {where}"
+        exists_cql += " LIMIT 1"
+        if allow_filtering:
+            exists_cql += " ALLOW FILTERING"
+        
+        try:
+            result = await self._execute(await self._prepare(table_name, exists_cql), values)
+            return result.one() is not None
+                    
+        except Exception as e:
+            raise QueryError(f"Failed to check records: {str(e)}")
     
     # Synchronous method implementations
     
@@ -542,13 +1582,48 @@ class CassandraAdapter(BaseAdapter):
         """Synchronous version of insert."""
         return asyncio.run(self.insert(model))
     
-    def update_sync(self, model: T) -> T:
+    def insert_many_sync(self, models: Sequence[T], batch_size: int = 1000) -> List[T]:
+        """Synchronous version of insert_many."""
+        return asyncio.run(self.insert_many(models, batch_size))
+    
+    def upsert_sync(self, model: T, conflict_fields: Optional[Sequence[str]] = None) -> T:
+        """Synchronous version of upsert."""
+        return asyncio.run(self.upsert(model, conflict_fields))
+    
+    def upsert_many_sync(
+        self,
+        models: Sequence[T],
+        batch_size: int = 1000,
+        conflict_fields: Optional[Sequence[str]] = None
+    ) -> List[T]:
+        """Synchronous version of upsert_many."""
+        return asyncio.run(self.upsert_many(models, batch_size, conflict_fields))
+    
+    def update_sync(self, model: T, full: bool = False) -> T:
         """Synchronous version of update."""
-        return asyncio.run(self.update(model))
+        return asyncio.run(self.update(model, full))
     
-    def find_by_id_sync(self, model_class: Type[T], id_value: Any) -> Optional[T]:
+    def find_by_id_sync(
+        self,
+        model_class: Type[T],
+        id_value: Any,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Optional[T]:
         """Synchronous version of find_by_id."""
-        return asyncio.run(self.find_by_id(model_class, id_value))
+        return asyncio.run(self.find_by_id(model_class, id_value, fields, exclude))
+    
+    def find_by_ids_sync(
+        self,
+        model_class: Type[T],
+        ids: Sequence[Any],
+        preserve_order: bool = True,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        batch_size: int = 1000
+    ) -> Union[List[Optional[T]], Dict[Any, T]]:
+        """Synchronous version of find_by_ids."""
+        return asyncio.run(self.find_by_ids(model_class, ids, preserve_order, fields, exclude, batch_size))
     
     def find_many_sync(
         self, 
@@ -556,15 +1631,61 @@ class CassandraAdapter(BaseAdapter):
         filters: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        order_by: Optional[List[str]] = None
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
     ) -> List[T]:
         """Synchronous version of find_many."""
-        return asyncio.run(self.find_many(model_class, filters, limit, offset, order_by))
+        return asyncio.run(self.find_many(model_class, filters, limit, offset, order_by, fields, exclude, include))
+    
+    def find_page_sync(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Page[T]:
+        """Synchronous version of find_page."""
+        return asyncio.run(self.find_page(model_class, filters, order_by, after, limit, fields, exclude))
+    
+    def stream_sync(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Iterator[T]:
+        """Synchronous version of stream."""
+        for page in self._pages(model_class, filters, batch_size, order_by, fields, exclude):
+            yield from page
     
     def delete_by_id_sync(self, model_class: Type[T], id_value: Any) -> bool:
         """Synchronous version of delete_by_id."""
         return asyncio.run(self.delete_by_id(model_class, id_value))
     
+    def update_many_sync(
+        self,
+        model_class: Type[T],
+        filters: Dict[str, Any],
+        changes: Dict[str, Any]
+    ) -> int:
+        """Synchronous version of update_many."""
+        return asyncio.run(self.update_many(model_class, filters, changes))
+    
+    def delete_many_sync(self, model_class: Type[T], filters: Dict[str, Any]) -> int:
+        """Synchronous version of delete_many."""
+        return asyncio.run(self.delete_many(model_class, filters))
+    
+    def delete_many_by_ids_sync(self, model_class: Type[T], ids: Sequence[Any], batch_size: int = 1000) -> int:
+        """Synchronous version of delete_many_by_ids."""
+        return asyncio.run(self.delete_many_by_ids(model_class, ids, batch_size))
+    
     def count_sync(
         self, 
         model_class: Type[T], 
@@ -573,6 +1694,16 @@ class CassandraAdapter(BaseAdapter):
         """Synchronous version of count."""
         return asyncio.run(self.count(model_class, filters))
     
+    def aggregate_sync(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        group_by: Optional[Sequence[str]] = None,
+        metrics: Optional[Mapping[str, Aggregate]] = None
+    ) -> List[Dict[str, Any]]:
+        """Synchronous version of aggregate."""
+        return asyncio.run(self.aggregate(model_class, filters, group_by, metrics))
+    
     def __enter__(self):
         """Sync context manager entry."""
         self.connect_sync()
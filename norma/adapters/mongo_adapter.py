@@ -5,17 +5,18 @@ Motor-based adapter for MongoDB with async operations.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional, Type, TypeVar
-from dataclasses import fields
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Type, TypeVar
 from datetime import datetime
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorCollection
-from pymongo import MongoClient, IndexModel, ASCENDING, DESCENDING
-from pymongo.errors import DuplicateKeyError, ConnectionFailure
+from pymongo import MongoClient, IndexModel, ReplaceOne, UpdateOne, ASCENDING, DESCENDING
+from pymongo.errors import BulkWriteError as PyMongoBulkWriteError, DuplicateKeyError, ConnectionFailure
 
 from .base_adapter import BaseAdapter
+from ..core.aggregates import Aggregate, Aggregator, Measure, aggregate_result
 from ..core.base_model import BaseModel
 from ..core.field import FieldConfig
+from ..core.filters import And, Comparison, Node, Or, like_to_regex, parse_filters
 from ..exceptions import (
     ConnectionError, 
     NotFoundError, 
@@ -28,6 +29,25 @@ from ..exceptions import (
 T = TypeVar('T', bound=BaseModel)
 
 
+class _Param(NamedTuple):
+    """Placeholder for a bound value in a compiled filter template."""
+    
+    index: int
+    convert: Optional[Callable[[Any], Any]] = None
+
+
+def _bind(template: Any, values: Sequence[Any]) -> Any:
+    """Substitute bound values into a compiled filter template."""
+    if isinstance(template, _Param):
+        value = values[template.index]
+        return template.convert(value) if template.convert else value
+    if isinstance(template, dict):
+        return {key: _bind(value, values) for key, value in template.items()}
+    if isinstance(template, list):
+        return [_bind(value, values) for value in template]
+    return template
+
+
 class MongoAdapter(BaseAdapter):
     """
     MongoDB adapter using Motor for async operations.
@@ -101,6 +121,33 @@ class MongoAdapter(BaseAdapter):
             # Log error but don't raise - we're cleaning up
             pass
     
+    async def _begin_transaction(self) -> Any:
+        """
+        Start a client session with a multi-document transaction.
+        
+        MongoDB only supports transactions on replica sets and sharded
+        clusters; on a standalone server the first operation fails.
+        """
+        session = await self.client.start_session()
+        session.start_transaction()
+        return session
+    
+    async def _commit_transaction(self, session: Any) -> None:
+        """Commit the session's transaction and end the session."""
+        try:
+            await session.commit_transaction()
+        except Exception as e:
+            raise QueryError(f"Failed to commit transaction: {str(e)}")
+        finally:
+            await session.end_session()
+    
+    async def _rollback_transaction(self, session: Any) -> None:
+        """Abort the session's transaction and end the session."""
+        try:
+            await session.abort_transaction()
+        finally:
+            await session.end_session()
+    
     async def create_table(self, model_class: Type[T]) -> None:
         """Create collection and indexes for the given model."""
         collection_name = self.get_table_name(model_class)
@@ -121,25 +168,23 @@ class MongoAdapter(BaseAdapter):
     async def _create_indexes(self, model_class: Type[BaseModel], collection: AsyncIOMotorCollection) -> None:
         """Create indexes for the model fields."""
         indexes = []
+        meta = self.get_model_meta(model_class)
         
-        for field_info in fields(model_class):
-            config = field_info.metadata.get("norma_config")
-            if not config:
-                continue
-            
-            field_name = field_info.name
+        for field_name in meta.indexed_fields:
+            config = meta.field_configs[field_name]
+            column = meta.field_to_column[field_name]
             
             # Primary key index (unique)
             if config.primary_key:
-                indexes.append(IndexModel([(field_name, ASCENDING)], unique=True, name=f"pk_{field_name}"))
+                indexes.append(IndexModel([(column, ASCENDING)], unique=True, name=f"pk_{column}"))
             
             # Unique indexes
             elif config.unique:
-                indexes.append(IndexModel([(field_name, ASCENDING)], unique=True, name=f"unique_{field_name}"))
+                indexes.append(IndexModel([(column, ASCENDING)], unique=True, name=f"unique_{column}"))
             
             # Regular indexes
             elif config.index:
-                indexes.append(IndexModel([(field_name, ASCENDING)], name=f"idx_{field_name}"))
+                indexes.append(IndexModel([(column, ASCENDING)], name=f"idx_{column}"))
         
         # Create indexes if any
         if indexes:
@@ -184,26 +229,18 @@ class MongoAdapter(BaseAdapter):
         
         collection = self.collections[collection_name]
         
-        # Prepare data for insertion
-        data = model.to_dict(exclude_none=False)
-        
-        # Generate primary key if needed
+        # Prepare data for insertion, generating the primary key if needed
+        data = self._prepare_insert_document(model)
         pk_field = self.get_primary_key_field(model.__class__)
-        if not data.get(pk_field):
-            data[pk_field] = model.generate_id()
-            setattr(model, pk_field, data[pk_field])
-        
-        # MongoDB uses _id as primary key, map from model's primary key
-        if pk_field != '_id':
-            data['_id'] = data[pk_field]
         
         try:
-            result = await collection.insert_one(data)
+            result = await collection.insert_one(data, session=self._active_transaction.get())
             
             # Update model with generated ID if applicable
             if not getattr(model, pk_field):
                 setattr(model, pk_field, str(result.inserted_id))
             
+            self._mark_clean(model)
             return model
             
         except DuplicateKeyError as e:
@@ -211,8 +248,146 @@ class MongoAdapter(BaseAdapter):
         except Exception as e:
             raise QueryError(f"Failed to insert document: {str(e)}")
     
-    async def update(self, model: T) -> T:
-        """Update an existing document."""
+    async def insert_many(self, models: Sequence[T], batch_size: int = 1000) -> List[T]:
+        """
+        Insert many documents with one unordered insert_many per batch.
+        
+        Unordered writes let the server continue past failing documents;
+        each failure is reported individually.
+        """
+        if not models:
+            return []
+        
+        model_class = self._bulk_model_class(models)
+        for model in models:
+            self.validate_model(model)
+        
+        collection_name = self.get_collection_name(model_class)
+        if collection_name not in self.collections:
+            await self.create_table(model_class)
+        collection = self.collections[collection_name]
+        
+        documents = [self._prepare_insert_document(model) for model in models]
+        errors: List[Dict[str, Any]] = []
+        for batch_number, (start, batch) in enumerate(self._batches(documents, batch_size)):
+            try:
+                await collection.insert_many(batch, ordered=False, session=self._active_transaction.get())
+            except PyMongoBulkWriteError as e:
+                errors.extend(self._write_errors(batch_number, start, e))
+            except Exception as e:
+                raise QueryError(f"Failed to insert documents: {str(e)}")
+        
+        return self._finish_insert_many(models, errors)
+    
+    async def upsert(self, model: T, conflict_fields: Optional[Sequence[str]] = None) -> T:
+        """Insert or update a document in a single upsert request."""
+        return (await self.upsert_many([model], conflict_fields=conflict_fields))[0]
+    
+    async def upsert_many(
+        self,
+        models: Sequence[T],
+        batch_size: int = 1000,
+        conflict_fields: Optional[Sequence[str]] = None
+    ) -> List[T]:
+        """
+        Upsert many documents with one unordered bulk_write per batch.
+        
+        Upserts by primary key replace the whole document (ReplaceOne).
+        Upserts by another unique field $set the fields and only set _id and
+        the primary key on insert, so matched documents keep their key; the
+        stored keys are then read back onto the models.
+        """
+        if not models:
+            return []
+        
+        model_class = self._bulk_model_class(models)
+        for model in models:
+            self.validate_model(model)
+        
+        collection_name = self.get_collection_name(model_class)
+        if collection_name not in self.collections:
+            await self.create_table(model_class)
+        collection = self.collections[collection_name]
+        
+        conflict_columns = self._conflict_columns(model_class, conflict_fields)
+        pk_column = self._column_name(model_class, self.get_primary_key_field(model_class))
+        requests = [self._upsert_request(model, conflict_columns, pk_column) for model in models]
+        
+        errors: List[Dict[str, Any]] = []
+        for batch_number, (start, batch) in enumerate(self._batches(requests, batch_size)):
+            try:
+                await collection.bulk_write(batch, ordered=False, session=self._active_transaction.get())
+            except PyMongoBulkWriteError as e:
+                errors.extend(self._write_errors(batch_number, start, e))
+            except Exception as e:
+                raise QueryError(f"Failed to upsert documents: {str(e)}")
+        
+        if conflict_columns != (pk_column,):
+            await self._restore_primary_keys(collection, models, conflict_columns, pk_column)
+        
+        return self._finish_insert_many(models, errors)
+    
+    def _upsert_request(self, model: BaseModel, conflict_columns: Tuple[str, ...], pk_column: str) -> Any:
+        """Build the bulk_write request upserting one model."""
+        document = self._prepare_insert_document(model)
+        query_filter = {column: document[column] for column in conflict_columns}
+        
+        if conflict_columns == (pk_column,):
+            return ReplaceOne(query_filter, document, upsert=True)
+        
+        on_insert = {'_id': document.pop('_id')}
+        if pk_column != '_id':
+            on_insert[pk_column] = document.pop(pk_column)
+        return UpdateOne(query_filter, {"$set": document, "$setOnInsert": on_insert}, upsert=True)
+    
+    async def _restore_primary_keys(
+        self,
+        collection: AsyncIOMotorCollection,
+        models: Sequence[BaseModel],
+        conflict_columns: Tuple[str, ...],
+        pk_column: str
+    ) -> None:
+        """Copy the stored primary keys of upserted documents back onto the models."""
+        meta = self.get_model_meta(models[0].__class__)
+        conflict_fields = [meta.column_to_field[column] for column in conflict_columns]
+        pk_field = meta.column_to_field[pk_column]
+        
+        keys = {}
+        projection = {column: 1 for column in (*conflict_columns, pk_column)}
+        query_filter = {"$or": [
+            {column: getattr(model, field) for column, field in zip(conflict_columns, conflict_fields)}
+            for model in models
+        ]}
+        async for document in collection.find(query_filter, projection, session=self._active_transaction.get()):
+            keys[tuple(document.get(column) for column in conflict_columns)] = document.get(pk_column)
+        
+        for model in models:
+            key = keys.get(tuple(getattr(model, field) for field in conflict_fields))
+            if key is not None and getattr(model, pk_field) != key:
+                setattr(model, pk_field, key)
+    
+    def _prepare_insert_document(self, model: BaseModel) -> Dict[str, Any]:
+        """Get the document to insert, with _id mirroring the primary key."""
+        data = self._prepare_insert_data(model)
+        
+        # MongoDB uses _id as primary key, map from model's primary key
+        pk_column = self._column_name(model.__class__, self.get_primary_key_field(model.__class__))
+        if pk_column != '_id':
+            data['_id'] = data[pk_column]
+        
+        return data
+    
+    def _write_errors(self, batch_number: int, start: int, error: PyMongoBulkWriteError) -> List[Dict[str, Any]]:
+        """Convert a driver bulk write error into per-document error entries."""
+        errors = []
+        for write_error in error.details.get('writeErrors', []):
+            entry = self._bulk_error(batch_number, start + write_error['index'], write_error.get('errmsg', ''))
+            entry['duplicate'] = write_error.get('code') == 11000
+            errors.append(entry)
+        return errors
+    
+    async def update(self, model: T, full: bool = False) -> T:
+        """Update an existing document, setting only changed fields unless full=True."""
         self.validate_model(model)
         
         collection_name = self.get_collection_name(model.__class__)
@@ -228,22 +403,27 @@ class MongoAdapter(BaseAdapter):
         if not pk_value:
             raise ValidationError(f"Primary key field '{pk_field}' is required for update")
         
-        # Prepare data for update (exclude primary key and _id)
-        data = model.to_dict(exclude_none=False)
-        update_data = {k: v for k, v in data.items() if k not in [pk_field, '_id']}
+        # Prepare data for update (changed fields only, excluding primary key and _id)
+        pk_column = self._column_name(model.__class__, pk_field)
+        data = self._get_update_data(model, full)
+        update_data = {k: v for k, v in data.items() if k != '_id'}
+        if not update_data:
+            return model
         
         # Determine query filter
-        query_filter = {pk_field: pk_value} if pk_field != '_id' else {'_id': pk_value}
+        query_filter = {pk_column: pk_value} if pk_column != '_id' else {'_id': pk_value}
         
         try:
             result = await collection.update_one(
                 query_filter,
-                {"$set": update_data}
+                {"$set": update_data},
+                session=self._active_transaction.get()
             )
             
             if result.matched_count == 0:
                 raise NotFoundError(f"Document with {pk_field}={pk_value} not found")
             
+            self._mark_clean(model)
             return model
             
         except NotFoundError:
@@ -251,7 +431,13 @@ class MongoAdapter(BaseAdapter):
         except Exception as e:
             raise QueryError(f"Failed to update document: {str(e)}")
     
-    async def find_by_id(self, model_class: Type[T], id_value: Any) -> Optional[T]:
+    async def find_by_id(
+        self,
+        model_class: Type[T],
+        id_value: Any,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Optional[T]:
         """Find a document by primary key."""
         collection_name = self.get_collection_name(model_class)
         
@@ -259,18 +445,21 @@ class MongoAdapter(BaseAdapter):
             return None
         
         collection = self.collections[collection_name]
-        pk_field = self.get_primary_key_field(model_class)
+        pk_field = self._column_name(model_class, self.get_primary_key_field(model_class))
         
         # Determine query filter
         query_filter = {pk_field: id_value} if pk_field != '_id' else {'_id': id_value}
         
+        projection = self._projection(model_class, fields, exclude)
+        
         try:
-            document = await collection.find_one(query_filter)
+            document = await collection.find_one(
+                query_filter, self._projection_document(projection), session=self._active_transaction.get()
+            )
             
             if document:
                 # Convert MongoDB document to model
-                document = self._prepare_document_for_model(document, pk_field)
-                return model_class.from_dict(document)
+                return self._model_from_document(model_class, document, pk_field, projection)
             
             return None
             
@@ -283,7 +472,10 @@ class MongoAdapter(BaseAdapter):
         filters: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        order_by: Optional[List[str]] = None
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
     ) -> List[T]:
         """Find multiple documents."""
         collection_name = self.get_collection_name(model_class)
@@ -292,23 +484,20 @@ class MongoAdapter(BaseAdapter):
             return []
         
         collection = self.collections[collection_name]
-        pk_field = self.get_primary_key_field(model_class)
+        pk_field = self._column_name(model_class, self.get_primary_key_field(model_class))
         
         # Build query
-        query_filter = filters or {}
+        query_filter = self._query_filter(model_class, filters)
+        projection = self._projection(model_class, fields, exclude)
         
         try:
-            cursor = collection.find(query_filter)
+            cursor = collection.find(
+                query_filter, self._projection_document(projection), session=self._active_transaction.get()
+            )
             
             # Apply sorting
             if order_by:
-                sort_spec = []
-                for field in order_by:
-                    if field.startswith('-'):
-                        sort_spec.append((field[1:], DESCENDING))
-                    else:
-                        sort_spec.append((field, ASCENDING))
-                cursor = cursor.sort(sort_spec)
+                cursor = cursor.sort(self._sort_spec(model_class, order_by))
             
             # Apply pagination
             if offset:
@@ -319,15 +508,99 @@ class MongoAdapter(BaseAdapter):
             documents = await cursor.to_list(length=limit)
             
             # Convert documents to models
-            models = []
-            for doc in documents:
-                doc = self._prepare_document_for_model(doc, pk_field)
-                models.append(model_class.from_dict(doc))
-            
-            return models
+            models = [self._model_from_document(model_class, doc, pk_field, projection) for doc in documents]
             
         except Exception as e:
             raise QueryError(f"Failed to find documents: {str(e)}")
+        
+        if include:
+            await self.load_related(model_class, models, include)
+        return models
+    
+    async def stream(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[T]:
+        """Stream documents from a cursor fetching batch_size documents per getMore."""
+        collection_name = self.get_collection_name(model_class)
+        
+        if collection_name not in self.collections:
+            return
+        
+        projection = self._projection(model_class, fields, exclude)
+        cursor = self.collections[collection_name].find(
+            self._query_filter(model_class, filters), self._projection_document(projection),
+            batch_size=batch_size, session=self._active_transaction.get()
+        )
+        if order_by:
+            cursor = cursor.sort(self._sort_spec(model_class, order_by))
+        pk_field = self._column_name(model_class, self.get_primary_key_field(model_class))
+        
+        try:
+            async for document in cursor:
+                yield self._model_from_document(model_class, document, pk_field, projection)
+            
+        except Exception as e:
+            raise QueryError(f"Failed to stream documents: {str(e)}")
+        finally:
+            await cursor.close()
+    
+    def _sort_spec(self, model_class: Type[BaseModel], order_by: List[str]) -> List[Tuple[str, int]]:
+        """Translate order_by field names ("-" prefix for descending) into a sort spec."""
+        sort_spec = []
+        for field in order_by:
+            if field.startswith('-'):
+                sort_spec.append((self._column_name(model_class, field[1:]), DESCENDING))
+            else:
+                sort_spec.append((self._column_name(model_class, field), ASCENDING))
+        return sort_spec
+    
+    async def update_many(
+        self,
+        model_class: Type[T],
+        filters: Dict[str, Any],
+        changes: Dict[str, Any]
+    ) -> int:
+        """Update all matching documents with a single update_many."""
+        collection_name = self.get_collection_name(model_class)
+        
+        if collection_name not in self.collections:
+            return 0
+        
+        update_data = self._get_bulk_changes(model_class, changes)
+        
+        try:
+            result = await self.collections[collection_name].update_many(
+                self._query_filter(model_class, filters),
+                {"$set": update_data},
+                session=self._active_transaction.get()
+            )
+            return result.matched_count
+            
+        except Exception as e:
+            raise QueryError(f"Failed to update documents: {str(e)}")
+    
+    async def delete_many(self, model_class: Type[T], filters: Dict[str, Any]) -> int:
+        """Delete all matching documents with a single delete_many."""
+        collection_name = self.get_collection_name(model_class)
+        
+        if collection_name not in self.collections:
+            return 0
+        
+        try:
+            result = await self.collections[collection_name].delete_many(
+                self._query_filter(model_class, filters),
+                session=self._active_transaction.get()
+            )
+            return result.deleted_count
+            
+        except Exception as e:
+            raise QueryError(f"Failed to delete documents: {str(e)}")
     
     async def delete_by_id(self, model_class: Type[T], id_value: Any) -> bool:
         """Delete a document by primary key."""
@@ -337,13 +610,13 @@ class MongoAdapter(BaseAdapter):
             return False
         
         collection = self.collections[collection_name]
-        pk_field = self.get_primary_key_field(model_class)
+        pk_field = self._column_name(model_class, self.get_primary_key_field(model_class))
         
         # Determine query filter
         query_filter = {pk_field: id_value} if pk_field != '_id' else {'_id': id_value}
         
         try:
-            result = await collection.delete_one(query_filter)
+            result = await collection.delete_one(query_filter, session=self._active_transaction.get())
             return result.deleted_count > 0
             
         except Exception as e:
@@ -361,10 +634,10 @@ class MongoAdapter(BaseAdapter):
             return 0
         
         collection = self.collections[collection_name]
-        query_filter = filters or {}
+        query_filter = self._query_filter(model_class, filters)
         
         try:
-            return await collection.count_documents(query_filter)
+            return await collection.count_documents(query_filter, session=self._active_transaction.get())
         except Exception as e:
             raise QueryError(f"Failed to count documents: {str(e)}")
     
@@ -373,9 +646,181 @@ class MongoAdapter(BaseAdapter):
         model_class: Type[T], 
         filters: Dict[str, Any]
     ) -> bool:
-        """Check if documents exist matching criteria."""
-        count = await self.count(model_class, filters)
-        return count > 0
+        """Check if documents exist matching criteria by fetching at most one _id."""
+        collection_name = self.get_collection_name(model_class)
+        
+        if collection_name not in self.collections:
+            return False
+        
+        collection = self.collections[collection_name]
+        query_filter = self._query_filter(model_class, filters)
+        
+        try:
+            return await collection.find_one(query_filter, {"_id": 1}, session=self._active_transaction.get()) is not None
+        except Exception as e:
+            raise QueryError(f"Failed to check documents: {str(e)}")
+    
+    async def aggregate(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        group_by: Optional[Sequence[str]] = None,
+        metrics: Optional[Mapping[str, Aggregate]] = None
+    ) -> List[Dict[str, Any]]:
+        """Compute metrics per group with a $match / $group pipeline."""
+        groups, measures = self._aggregate_spec(model_class, group_by, metrics)
+        collection_name = self.get_collection_name(model_class)
+        
+        if collection_name not in self.collections:
+            return Aggregator(groups, measures).results()
+        
+        pipeline = self._aggregate_pipeline(model_class, filters, groups, measures)
+        
+        try:
+            cursor = self.collections[collection_name].aggregate(pipeline, session=self._active_transaction.get())
+            return self._aggregate_results(await cursor.to_list(None), groups, measures)
+        except Exception as e:
+            raise QueryError(f"Failed to aggregate documents: {str(e)}")
+    
+    def _aggregate_pipeline(
+        self,
+        model_class: Type[BaseModel],
+        filters: Optional[Dict[str, Any]],
+        groups: Tuple[Tuple[str, str], ...],
+        measures: Tuple[Measure, ...]
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the aggregation pipeline; the $group stage is cached per call shape.
+        
+        Group keys are named g0, g1, ... and measures m0, m1, ..., so metric
+        names never clash with _id or need escaping. $sum yields 0 when no
+        value is present, so each Sum also counts its non-null values (n0,
+        n1, ...) to return None like the other backends.
+        """
+        def build() -> Dict[str, Any]:
+            stage: Dict[str, Any] = {
+                "_id": {f"g{index}": f"${column}" for index, (_, column) in enumerate(groups)} or None
+            }
+            for index, (_, function, column) in enumerate(measures):
+                if column is None:
+                    stage[f"m{index}"] = {"$sum": 1}
+                    continue
+                present = {"$cond": [{"$eq": [{"$ifNull": [f"${column}", None]}, None]}, 0, 1]}
+                if function == "count":
+                    stage[f"m{index}"] = {"$sum": present}
+                else:
+                    stage[f"m{index}"] = {f"${function}": f"${column}"}
+                if function == "sum":
+                    stage[f"n{index}"] = {"$sum": present}
+            return {"$group": stage}
+        
+        key = (self.get_collection_name(model_class), "aggregate", groups, measures)
+        group_stage = self.statement_cache.get(key, build)
+        query_filter = self._query_filter(model_class, filters)
+        return [{"$match": query_filter}, group_stage] if query_filter else [group_stage]
+    
+    @staticmethod
+    def _aggregate_results(
+        documents: List[Dict[str, Any]],
+        groups: Tuple[Tuple[str, str], ...],
+        measures: Tuple[Measure, ...]
+    ) -> List[Dict[str, Any]]:
+        """Convert $group output documents into result rows."""
+        if not documents and not groups:
+            return Aggregator(groups, measures).results()
+        results = []
+        for document in documents:
+            key = [(document["_id"] or {}).get(f"g{index}") for index in range(len(groups))]
+            values = []
+            for index, (_, function, _) in enumerate(measures):
+                value = document.get(f"m{index}")
+                if function == "sum" and not document.get(f"n{index}"):
+                    value = None
+                values.append(value)
+            results.append(aggregate_result(groups, measures, key, values))
+        return results
+    
+    def _query_filter(self, model_class: Type[BaseModel], filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Compile a filter dictionary into a MongoDB query document.
+        
+        The query template is cached by filter shape; operators Norma does
+        not define (e.g. $regex, $elemMatch) are passed through unchanged.
+        """
+        if not filters:
+            return {}
+        shape, values = parse_filters(filters, self.get_model_meta(model_class).field_to_column)
+        key = (self.get_collection_name(model_class), "filter", shape)
+        template = self.statement_cache.get(key, lambda: self._filter_template(shape))
+        return _bind(template, values)
+    
+    # MongoDB form of operators without a value
+    _VALUELESS_TEMPLATES = {
+        "$is_null": None,
+        "$is_not_null": {"$ne": None},
+        "$exists": {"$exists": True},
+        "$not_exists": {"$exists": False},
+    }
+    
+    def _filter_template(self, node: Node) -> Dict[str, Any]:
+        """Compile a filter AST into a query document with _Param placeholders."""
+        if isinstance(node, Comparison):
+            if node.op in self._VALUELESS_TEMPLATES:
+                condition = self._VALUELESS_TEMPLATES[node.op]
+            elif node.op == "$eq":
+                condition = _Param(node.param)
+            elif node.op == "$like":
+                condition = {"$regex": _Param(node.param, like_to_regex)}
+            else:
+                condition = {node.op: _Param(node.param)}
+            
+            if node.column is None:
+                # Top-level operator such as $text
+                return {node.op: _Param(node.param)}
+            return {node.column: condition}
+        
+        children = [self._filter_template(child) for child in node.children]
+        if isinstance(node, Or):
+            # An empty $or is rejected by the server; it matches nothing
+            return {"$or": children} if children else {"_id": {"$in": []}}
+        
+        # Merge AND-ed conditions into one document while keys don't clash
+        merged: Dict[str, Any] = {}
+        for child in children:
+            for key, condition in child.items():
+                if key not in merged:
+                    merged[key] = condition
+                elif (
+                    not key.startswith("$")
+                    and isinstance(merged[key], dict)
+                    and isinstance(condition, dict)
+                    and not merged[key].keys() & condition.keys()
+                ):
+                    merged[key] = {**merged[key], **condition}
+                else:
+                    return {"$and": children}
+        return merged
+    
+    @staticmethod
+    def _projection_document(columns: Optional[Tuple[str, ...]]) -> Optional[Dict[str, int]]:
+        """Translate projected columns into a MongoDB projection (None for whole documents)."""
+        if columns is None:
+            return None
+        return {column: 1 for column in columns}
+    
+    def _model_from_document(
+        self,
+        model_class: Type[T],
+        document: Dict[str, Any],
+        pk_field: str,
+        columns: Optional[Tuple[str, ...]] = None
+    ) -> T:
+        """Build a model from a document, or a partial model from a projected one."""
+        document = self._prepare_document_for_model(document, pk_field)
+        if columns is None:
+            return self._model_from_mapping(model_class, document)
+        row = [document.get(column) for column in columns]
+        return self._models_from_rows(model_class, [row], columns, partial=True)[0]
     
     def _prepare_document_for_model(self, document: Dict[str, Any], pk_field: str) -> Dict[str, Any]:
         """Prepare MongoDB document for model creation."""
@@ -406,18 +851,9 @@ class MongoAdapter(BaseAdapter):
         
         collection = self.sync_collections[collection_name]
         
-        # Prepare data for insertion
-        data = model.to_dict(exclude_none=False)
-        
-        # Generate primary key if needed
+        # Prepare data for insertion, generating the primary key if needed
+        data = self._prepare_insert_document(model)
         pk_field = self.get_primary_key_field(model.__class__)
-        if not data.get(pk_field):
-            data[pk_field] = model.generate_id()
-            setattr(model, pk_field, data[pk_field])
-        
-        # MongoDB uses _id as primary key, map from model's primary key
-        if pk_field != '_id':
-            data['_id'] = data[pk_field]
         
         try:
             result = collection.insert_one(data)
@@ -426,6 +862,7 @@ class MongoAdapter(BaseAdapter):
             if not getattr(model, pk_field):
                 setattr(model, pk_field, str(result.inserted_id))
             
+            self._mark_clean(model)
             return model
             
         except DuplicateKeyError as e:
@@ -433,11 +870,56 @@ class MongoAdapter(BaseAdapter):
         except Exception as e:
             raise QueryError(f"Failed to insert document: {str(e)}")
     
-    def update_sync(self, model: T) -> T:
+    def insert_many_sync(self, models: Sequence[T], batch_size: int = 1000) -> List[T]:
+        """Synchronous version of insert_many using sync client."""
+        if not models:
+            return []
+        
+        model_class = self._bulk_model_class(models)
+        for model in models:
+            self.validate_model(model)
+        
+        collection_name = self.get_collection_name(model_class)
+        if collection_name not in self.sync_collections:
+            self.sync_collections[collection_name] = self.sync_database[collection_name]
+        collection = self.sync_collections[collection_name]
+        
+        documents = [self._prepare_insert_document(model) for model in models]
+        errors: List[Dict[str, Any]] = []
+        for batch_number, (start, batch) in enumerate(self._batches(documents, batch_size)):
+            try:
+                collection.insert_many(batch, ordered=False)
+            except PyMongoBulkWriteError as e:
+                errors.extend(self._write_errors(batch_number, start, e))
+            except Exception as e:
+                raise QueryError(f"Failed to insert documents: {str(e)}")
+        
+        return self._finish_insert_many(models, errors)
+    
+    def upsert_sync(self, model: T, conflict_fields: Optional[Sequence[str]] = None) -> T:
+        """Synchronous version of upsert."""
+        return asyncio.run(self.upsert(model, conflict_fields))
+    
+    def upsert_many_sync(
+        self,
+        models: Sequence[T],
+        batch_size: int = 1000,
+        conflict_fields: Optional[Sequence[str]] = None
+    ) -> List[T]:
+        """Synchronous version of upsert_many."""
+        return asyncio.run(self.upsert_many(models, batch_size, conflict_fields))
+    
+    def update_sync(self, model: T, full: bool = False) -> T:
         """Synchronous version of update."""
-        return asyncio.run(self.update(model))
+        return asyncio.run(self.update(model, full))
     
-    def find_by_id_sync(self, model_class: Type[T], id_value: Any) -> Optional[T]:
+    def find_by_id_sync(
+        self,
+        model_class: Type[T],
+        id_value: Any,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Optional[T]:
         """Synchronous version of find_by_id."""
         collection_name = self.get_collection_name(model_class)
         
@@ -445,18 +927,19 @@ class MongoAdapter(BaseAdapter):
             return None
         
         collection = self.sync_collections[collection_name]
-        pk_field = self.get_primary_key_field(model_class)
+        pk_field = self._column_name(model_class, self.get_primary_key_field(model_class))
         
         # Determine query filter
         query_filter = {pk_field: id_value} if pk_field != '_id' else {'_id': id_value}
         
+        projection = self._projection(model_class, fields, exclude)
+        
         try:
-            document = collection.find_one(query_filter)
+            document = collection.find_one(query_filter, self._projection_document(projection))
             
             if document:
                 # Convert MongoDB document to model
-                document = self._prepare_document_for_model(document, pk_field)
-                return model_class.from_dict(document)
+                return self._model_from_document(model_class, document, pk_field, projection)
             
             return None
             
@@ -469,15 +952,64 @@ class MongoAdapter(BaseAdapter):
         filters: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        order_by: Optional[List[str]] = None
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
     ) -> List[T]:
         """Synchronous version of find_many."""
-        return asyncio.run(self.find_many(model_class, filters, limit, offset, order_by))
+        return asyncio.run(self.find_many(model_class, filters, limit, offset, order_by, fields, exclude, include))
+    
+    def stream_sync(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Iterator[T]:
+        """Synchronous version of stream using the sync client."""
+        collection_name = self.get_collection_name(model_class)
+        
+        if collection_name not in self.sync_collections:
+            return
+        
+        projection = self._projection(model_class, fields, exclude)
+        cursor = self.sync_collections[collection_name].find(
+            self._query_filter(model_class, filters), self._projection_document(projection),
+            batch_size=batch_size
+        )
+        if order_by:
+            cursor = cursor.sort(self._sort_spec(model_class, order_by))
+        pk_field = self._column_name(model_class, self.get_primary_key_field(model_class))
+        
+        try:
+            for document in cursor:
+                yield self._model_from_document(model_class, document, pk_field, projection)
+            
+        except Exception as e:
+            raise QueryError(f"Failed to stream documents: {str(e)}")
+        finally:
+            cursor.close()
     
     def delete_by_id_sync(self, model_class: Type[T], id_value: Any) -> bool:
         """Synchronous version of delete_by_id."""
         return asyncio.run(self.delete_by_id(model_class, id_value))
     
+    def update_many_sync(
+        self,
+        model_class: Type[T],
+        filters: Dict[str, Any],
+        changes: Dict[str, Any]
+    ) -> int:
+        """Synchronous version of update_many."""
+        return asyncio.run(self.update_many(model_class, filters, changes))
+    
+    def delete_many_sync(self, model_class: Type[T], filters: Dict[str, Any]) -> int:
+        """Synchronous version of delete_many."""
+        return asyncio.run(self.delete_many(model_class, filters))
+    
     def count_sync(
         self, 
         model_class: Type[T], 
@@ -486,6 +1018,28 @@ class MongoAdapter(BaseAdapter):
         """Synchronous version of count."""
         return asyncio.run(self.count(model_class, filters))
     
+    def aggregate_sync(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        group_by: Optional[Sequence[str]] = None,
+        metrics: Optional[Mapping[str, Aggregate]] = None
+    ) -> List[Dict[str, Any]]:
+        """Synchronous version of aggregate using the sync client."""
+        groups, measures = self._aggregate_spec(model_class, group_by, metrics)
+        collection_name = self.get_collection_name(model_class)
+        
+        if collection_name not in self.sync_collections:
+            return Aggregator(groups, measures).results()
+        
+        pipeline = self._aggregate_pipeline(model_class, filters, groups, measures)
+        
+        try:
+            documents = list(self.sync_collections[collection_name].aggregate(pipeline))
+            return self._aggregate_results(documents, groups, measures)
+        except Exception as e:
+            raise QueryError(f"Failed to aggregate documents: {str(e)}")
+    
     def __enter__(self):
         """Sync context manager entry."""
         self.connect_sync()
@@ -6,20 +6,24 @@ Supports both synchronous and asynchronous operations.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional, Type, TypeVar, get_origin, get_args
-from dataclasses import fields
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar, get_origin, get_args
 from datetime import datetime
 
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy import create_engine, MetaData, Table, Column, Index
-from sqlalchemy.sql import select, insert, update, delete
+from sqlalchemy.sql import bindparam, select, insert, update, delete
 from sqlalchemy.exc import IntegrityError, NoResultFound
+from sqlalchemy.dialects import postgresql, sqlite
 
 from .base_adapter import BaseAdapter
+from ..core.aggregates import Aggregate, Aggregator, Measure, aggregate_result
 from ..core.base_model import BaseModel
 from ..core.field import FieldConfig
+from ..core.filters import And, Comparison, Node, Or, parse_filters
+from ..core.relations import IncludeTree, Relation, bind_lazy, get_relation, parse_include
 from ..exceptions import (
     ConnectionError, 
     NotFoundError, 
@@ -31,6 +35,12 @@ from ..exceptions import (
 
 T = TypeVar('T', bound=BaseModel)
 
+# Dialect-specific INSERT constructs supporting ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
 
 class SQLAdapter(BaseAdapter):
     """
@@ -60,6 +70,7 @@ class SQLAdapter(BaseAdapter):
         # Engines and sessions
         self._engine = None
         self._async_engine = None
+        self._sync_engine = None
         self._session_factory = None
         self._async_session_factory = None
     
@@ -120,6 +131,85 @@ class SQLAdapter(BaseAdapter):
             # Log error but don't raise - we're cleaning up
             pass
     
+    @asynccontextmanager
+    async def _session(self, commit: bool = False) -> AsyncIterator[AsyncSession]:
+        """
+        Get the active transaction's session, or a new one for one operation.
+        
+        A new session is committed on exit when `commit` is set; a
+        transaction's session is committed by the transaction.
+        """
+        active = self._active_transaction.get()
+        if isinstance(active, AsyncSession):
+            yield active
+            return
+        
+        async with self._async_session_factory() as session:
+            yield session
+            if commit:
+                await session.commit()
+    
+    @contextmanager
+    def _sync_session(self, commit: bool = False) -> Iterator[Session]:
+        """Synchronous version of _session."""
+        active = self._active_transaction.get()
+        if isinstance(active, Session):
+            yield active
+            return
+        
+        with self._session_factory() as session:
+            yield session
+            if commit:
+                session.commit()
+    
+    async def _begin_transaction(self) -> Any:
+        """Open the session shared by the transaction's operations."""
+        if self._async_engine:
+            return self._async_session_factory()
+        return self._session_factory()
+    
+    async def _commit_transaction(self, session: Any) -> None:
+        """Commit the transaction's session with a single COMMIT and close it."""
+        if not isinstance(session, AsyncSession):
+            return self._commit_transaction_sync(session)
+        try:
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            raise QueryError(f"Failed to commit transaction: {str(e)}")
+        finally:
+            await session.close()
+    
+    async def _rollback_transaction(self, session: Any) -> None:
+        """Roll back the transaction's session and close it."""
+        if not isinstance(session, AsyncSession):
+            return self._rollback_transaction_sync(session)
+        try:
+            await session.rollback()
+        finally:
+            await session.close()
+    
+    def _begin_transaction_sync(self) -> Session:
+        """Synchronous version of _begin_transaction."""
+        return self._session_factory()
+    
+    def _commit_transaction_sync(self, session: Session) -> None:
+        """Synchronous version of _commit_transaction."""
+        try:
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            raise QueryError(f"Failed to commit transaction: {str(e)}")
+        finally:
+            session.close()
+    
+    def _rollback_transaction_sync(self, session: Session) -> None:
+        """Synchronous version of _rollback_transaction."""
+        try:
+            session.rollback()
+        finally:
+            session.close()
+    
     async def create_table(self, model_class: Type[T]) -> None:
         """Create table for the given model."""
         table_name = self.get_table_name(model_class)
@@ -158,8 +248,9 @@ class SQLAdapter(BaseAdapter):
             else:
                 table.drop(self._engine, checkfirst=True)
             
-            # Remove from our table registry and metadata
+            # Remove from our table registry, metadata and statement cache
             del self.tables[table_name]
+            self.statement_cache.invalidate(table)
             if table_name in self.metadata.tables:
                 self.metadata.remove(table)
             
@@ -170,18 +261,18 @@ class SQLAdapter(BaseAdapter):
         """Create SQLAlchemy Table from Norma model."""
         columns = []
         indexes = []
+        meta = self.get_model_meta(model_class)
         
-        for field_info in fields(model_class):
-            field_name = field_info.name
-            field_type = field_info.type
-            config = field_info.metadata.get("norma_config")
+        for field_name in meta.field_names:
+            field_type = meta.field_types[field_name]
+            config = meta.field_configs[field_name]
             
             # Convert Python type to SQLAlchemy type
             sa_type = self._python_type_to_sqlalchemy(field_type, config)
             
             # Create column
             column = Column(
-                config.db_column_name or field_name,
+                meta.field_to_column[field_name],
                 sa_type,
                 primary_key=config.primary_key if config else False,
                 unique=config.unique if config else False,
@@ -199,6 +290,351 @@ class SQLAdapter(BaseAdapter):
         table = Table(table_name, self.metadata, *columns, *indexes)
         return table
     
+    # SQL rendering of each comparison operator, given a column and bound parameter
+    _FILTER_OPERATORS = {
+        "$eq": lambda column, param: column == param,
+        "$ne": lambda column, param: column != param,
+        "$gt": lambda column, param: column > param,
+        "$gte": lambda column, param: column >= param,
+        "$lt": lambda column, param: column < param,
+        "$lte": lambda column, param: column <= param,
+        "$in": lambda column, param: column.in_(param),
+        "$nin": lambda column, param: column.not_in(param),
+        "$like": lambda column, param: column.like(param),
+    }
+    
+    # Operators without a value; every SQL column exists, so $exists tests for NULL
+    _VALUELESS_OPERATORS = {
+        "$is_null": lambda column: column.is_(None),
+        "$is_not_null": lambda column: column.is_not(None),
+        "$exists": lambda column: column.is_not(None),
+        "$not_exists": lambda column: column.is_(None),
+    }
+    
+    def _filter_shape(
+        self,
+        model_class: Type[BaseModel],
+        filters: Optional[Dict[str, Any]]
+    ) -> Tuple[Node, Dict[str, Any]]:
+        """
+        Parse filters into a hashable shape and bound parameter values.
+        
+        Statements are cached by shape, so filters that differ only in their
+        values share one pre-built statement.
+        
+        Returns:
+            The filter AST and its parameters, named "_f0", "_f1", ... by position
+        """
+        shape, values = parse_filters(filters, self.get_model_meta(model_class).field_to_column)
+        return shape, {f"_f{index}": value for index, value in enumerate(values)}
+    
+    def _where_clause(self, model_class: Type[BaseModel], table: Table, node: Node, strict: bool = False) -> Optional[Any]:
+        """
+        Compile a filter AST into a WHERE clause with bound parameters.
+        
+        Args:
+            model_class: The model class being queried
+            table: The model's table
+            node: Filter AST from _filter_shape()
+            strict: Raise QueryError for unknown fields or operators instead
+                of ignoring them (used by writes, where ignoring a filter
+                would widen the set of affected rows)
+            
+        Returns:
+            The clause, or None if the filter matches every row
+        """
+        if not isinstance(node, Comparison):
+            clauses = [self._where_clause(model_class, table, child, strict) for child in node.children]
+            clauses = [clause for clause in clauses if clause is not None]
+            if isinstance(node, Or):
+                return sa.or_(*clauses) if clauses else sa.false()
+            return sa.and_(*clauses) if clauses else None
+        
+        if node.column is None or not hasattr(table.c, node.column):
+            if strict:
+                raise QueryError(f"Unknown filter field '{node.column or node.op}' for {model_class.__name__}")
+            return None
+        
+        column = table.c[node.column]
+        if node.op in self._VALUELESS_OPERATORS:
+            return self._VALUELESS_OPERATORS[node.op](column)
+        
+        operator = self._FILTER_OPERATORS.get(node.op)
+        if operator is None:
+            if strict:
+                raise QueryError(f"Unsupported filter operator '{node.op}'")
+            return None
+        return operator(column, bindparam(f"_f{node.param}", expanding=node.op in ("$in", "$nin")))
+    
+    def _filtered(self, query: Any, model_class: Type[BaseModel], table: Table, node: Node, strict: bool = False) -> Any:
+        """Apply a compiled filter to a select, update or delete statement."""
+        clause = self._where_clause(model_class, table, node, strict)
+        return query if clause is None else query.where(clause)
+    
+    def _order_shape(self, model_class: Type[BaseModel], table: Table, order_by: Optional[List[str]]) -> Tuple[Tuple[str, bool], ...]:
+        """Get (column, descending) pairs for known order_by fields."""
+        shape = []
+        for field in order_by or ():
+            descending = field.startswith('-')
+            column = self._column_name(model_class, field[1:] if descending else field)
+            if hasattr(table.c, column):
+                shape.append((column, descending))
+        return tuple(shape)
+    
+    # Cached statements
+    
+    def _pk_statement(
+        self,
+        table: Table,
+        pk_column: str,
+        kind: str,
+        columns: Optional[Tuple[str, ...]] = None
+    ) -> Any:
+        """
+        Get the cached select, update or delete statement by primary key.
+        
+        The key is bound as "_pk"; update statements take their SET columns
+        from the execution parameters. Selects load only `columns` if given.
+        """
+        def build() -> Any:
+            condition = table.c[pk_column] == bindparam("_pk")
+            if kind == "select":
+                return self._select(table, columns).where(condition)
+            if kind == "update":
+                return update(table).where(condition)
+            return delete(table).where(condition)
+        
+        return self.statement_cache.get((table, kind, pk_column, columns), build)
+    
+    @staticmethod
+    def _select(table: Table, columns: Optional[Tuple[str, ...]] = None) -> Any:
+        """SELECT every column of a table, or only a projection of them."""
+        if columns is None:
+            return select(table)
+        return select(*[table.c[column] for column in columns])
+    
+    def _insert_statement(self, table: Table) -> Any:
+        """Get the cached INSERT statement; columns come from the parameters."""
+        return self.statement_cache.get((table, "insert"), lambda: insert(table))
+    
+    def _find_query(
+        self,
+        model_class: Type[BaseModel],
+        table: Table,
+        filters: Optional[Dict[str, Any]],
+        limit: Optional[int],
+        offset: Optional[int],
+        order_by: Optional[List[str]],
+        columns: Optional[Tuple[str, ...]] = None,
+        joins: Tuple[Tuple[Relation, Table], ...] = ()
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Get the cached SELECT for a find_many call and its parameters."""
+        shape, params = self._filter_shape(model_class, filters)
+        order = self._order_shape(model_class, table, order_by)
+        
+        def build() -> Any:
+            query = self._select(table, columns)
+            if joins:
+                source = table
+                for index, (relation, target_table) in enumerate(joins):
+                    # Aliased, so a model can join its own table
+                    target = target_table.alias(f"_include{index}")
+                    local = table.c[self._column_name(model_class, relation.local_field)]
+                    remote = target.c[self._column_name(relation.target, relation.remote_field)]
+                    source = source.outerjoin(target, local == remote)
+                    query = query.add_columns(*target.c)
+                query = query.select_from(source)
+            query = self._filtered(query, model_class, table, shape)
+            for column, descending in order:
+                query = query.order_by(table.c[column].desc() if descending else table.c[column])
+            if offset:
+                query = query.offset(bindparam("_offset"))
+            if limit:
+                query = query.limit(bindparam("_limit"))
+            return query
+        
+        if offset:
+            params["_offset"] = offset
+        if limit:
+            params["_limit"] = limit
+        key = (table, "find", shape, order, bool(limit), bool(offset), columns, joins)
+        return self.statement_cache.get(key, build), params
+    
+    def _join_plan(
+        self,
+        model_class: Type[BaseModel],
+        include: Optional[Sequence[str]]
+    ) -> Tuple[IncludeTree, Tuple[Tuple[Relation, Table], ...]]:
+        """
+        Parse include and pick the relations to load with a JOIN.
+        
+        A to-one relation on the target's primary key adds at most one row
+        per record, so joining it is cheaper than a second query; to-many
+        relations would multiply the rows and are loaded select-in instead.
+        """
+        if not include:
+            return {}, ()
+        tree = parse_include(include)
+        joins = []
+        for name in tree:
+            relation = get_relation(model_class, name)
+            target_table = self.tables.get(self.get_table_name(relation.target))
+            if (
+                not relation.many and target_table is not None
+                and relation.remote_field == self.get_primary_key_field(relation.target)
+            ):
+                joins.append((relation, target_table))
+        return tree, tuple(joins)
+    
+    def _joined_models(
+        self,
+        model_class: Type[T],
+        rows: Sequence[Any],
+        columns: Tuple[str, ...],
+        partial: bool,
+        joins: Tuple[Tuple[Relation, Table], ...]
+    ) -> List[T]:
+        """Build models from find rows, and the joined relations from their trailing columns."""
+        if not joins:
+            return self._models_from_rows(model_class, rows, columns, partial)
+        
+        start = len(columns) - sum(len(target_table.c) for _, target_table in joins)
+        models = self._models_from_rows(model_class, rows, columns[:start], partial)
+        for relation, target_table in joins:
+            target_columns = tuple(column.name for column in target_table.c)
+            end = start + len(target_columns)
+            key_position = target_columns.index(self._column_name(relation.target, relation.remote_field))
+            
+            # One instance per distinct target, shared by the records referencing it
+            targets: Dict[Any, Any] = {}
+            for row in rows:
+                values = tuple(row[start:end])
+                if values[key_position] is not None and values[key_position] not in targets:
+                    targets[values[key_position]] = values
+            loaded = dict(zip(targets, self._models_from_rows(relation.target, list(targets.values()), target_columns)))
+            bind_lazy(self, relation.target, list(loaded.values()))
+            for model, row in zip(models, rows):
+                model._set_related(relation.name, loaded.get(row[start + key_position]))
+            start = end
+        return models
+    
+    @staticmethod
+    def _unjoined_includes(
+        model_class: Type[BaseModel],
+        models: Sequence[BaseModel],
+        tree: IncludeTree,
+        joins: Tuple[Tuple[Relation, Table], ...]
+    ) -> List[Tuple[Type[BaseModel], Sequence[BaseModel], IncludeTree]]:
+        """
+        Get the (model class, models, include tree) loads left after the JOINs:
+        the relations that were not joined, and those nested under joined ones.
+        """
+        joined = {relation.name: relation for relation, _ in joins}
+        loads = []
+        remaining = {name: children for name, children in tree.items() if name not in joined}
+        if remaining and models:
+            loads.append((model_class, models, remaining))
+        for name, relation in joined.items():
+            targets = {id(target): target for target in (model.get_related(name) for model in models) if target is not None}
+            if tree[name] and targets:
+                loads.append((relation.target, list(targets.values()), tree[name]))
+        return loads
+    
+    def _count_query(
+        self,
+        model_class: Type[BaseModel],
+        table: Table,
+        filters: Optional[Dict[str, Any]]
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Get the cached COUNT(*) statement for the filters and its parameters."""
+        shape, params = self._filter_shape(model_class, filters)
+        
+        def build() -> Any:
+            return self._filtered(select(sa.func.count()).select_from(table), model_class, table, shape)
+        
+        return self.statement_cache.get((table, "count", shape), build), params
+    
+    def _aggregate_query(
+        self,
+        model_class: Type[BaseModel],
+        table: Table,
+        filters: Optional[Dict[str, Any]],
+        groups: Tuple[Tuple[str, str], ...],
+        measures: Tuple[Measure, ...]
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Get the cached SELECT ... GROUP BY statement for aggregate() and its parameters."""
+        shape, params = self._filter_shape(model_class, filters)
+        
+        def build() -> Any:
+            keys = [table.c[column] for _, column in groups]
+            values = []
+            for _, function, column in measures:
+                if column is None:
+                    values.append(sa.func.count())
+                else:
+                    values.append(getattr(sa.func, function)(table.c[column]))
+            query = self._filtered(select(*keys, *values).select_from(table), model_class, table, shape)
+            return query.group_by(*keys) if keys else query
+        
+        return self.statement_cache.get((table, "aggregate", shape, groups, measures), build), params
+    
+    def _aggregate_results(
+        self,
+        rows: Sequence[Any],
+        groups: Tuple[Tuple[str, str], ...],
+        measures: Tuple[Measure, ...]
+    ) -> List[Dict[str, Any]]:
+        """Split result rows into group keys and metric values."""
+        size = len(groups)
+        return [aggregate_result(groups, measures, row[:size], row[size:]) for row in rows]
+    
+    def _exists_query(
+        self,
+        model_class: Type[BaseModel],
+        table: Table,
+        filters: Optional[Dict[str, Any]]
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Get the cached SELECT 1 ... LIMIT 1 probe for exists() and its parameters."""
+        shape, params = self._filter_shape(model_class, filters)
+        
+        def build() -> Any:
+            probe = select(sa.literal(1)).select_from(table)
+            return self._filtered(probe, model_class, table, shape).limit(1)
+        
+        return self.statement_cache.get((table, "exists", shape), build), params
+    
+    def _update_many_query(
+        self,
+        model_class: Type[BaseModel],
+        table: Table,
+        filters: Dict[str, Any],
+        changes: Dict[str, Any]
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Get the cached UPDATE ... WHERE for update_many and its parameters."""
+        values = self._get_bulk_changes(model_class, changes)
+        shape, params = self._filter_shape(model_class, filters)
+        
+        def build() -> Any:
+            return self._filtered(update(table), model_class, table, shape, strict=True)
+        
+        # SET columns come from the parameters, keyed by column name
+        params.update(values)
+        return self.statement_cache.get((table, "update_many", shape), build), params
+    
+    def _delete_many_query(
+        self,
+        model_class: Type[BaseModel],
+        table: Table,
+        filters: Dict[str, Any]
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Get the cached DELETE ... WHERE for delete_many and its parameters."""
+        shape, params = self._filter_shape(model_class, filters)
+        
+        def build() -> Any:
+            return self._filtered(delete(table), model_class, table, shape, strict=True)
+        
+        return self.statement_cache.get((table, "delete_many", shape), build), params
+    
     def _python_type_to_sqlalchemy(self, python_type: Type, config: Optional[FieldConfig] = None) -> sa.types.TypeEngine:
         """Convert Python type to SQLAlchemy type."""
         # Handle Optional types
@@ -236,25 +672,18 @@ class SQLAdapter(BaseAdapter):
             await self.create_table(model.__class__)
             table = self.tables[table_name]
         
-        # Prepare data for insertion
-        data = model.to_dict(exclude_none=False)
-        
-        # Generate primary key if needed
-        pk_field = self.get_primary_key_field(model.__class__)
-        if not data.get(pk_field):
-            data[pk_field] = model.generate_id()
-            setattr(model, pk_field, data[pk_field])
+        # Prepare data for insertion, generating the primary key if needed
+        data = self._prepare_insert_data(model)
         
         try:
             if self._async_engine:
-                async with self._async_session_factory() as session:
-                    result = await session.execute(insert(table).values(**data))
-                    await session.commit()
+                async with self._session(commit=True) as session:
+                    result = await session.execute(self._insert_statement(table), data)
             else:
-                with self._session_factory() as session:
-                    result = session.execute(insert(table).values(**data))
-                    session.commit()
+                with self._sync_session(commit=True) as session:
+                    result = session.execute(self._insert_statement(table), data)
             
+            self._mark_clean(model)
             return model
             
         except IntegrityError as e:
@@ -264,8 +693,191 @@ class SQLAdapter(BaseAdapter):
         except Exception as e:
             raise QueryError(f"Failed to insert record: {str(e)}")
     
-    async def update(self, model: T) -> T:
-        """Update an existing record."""
+    async def insert_many(self, models: Sequence[T], batch_size: int = 1000) -> List[T]:
+        """
+        Insert many records in one transaction.
+        
+        Each batch is sent as a single multi-row executemany inside its own
+        savepoint, so a batch that violates a constraint is rolled back and
+        reported while the other batches are committed.
+        """
+        if not models:
+            return []
+        
+        model_class = self._bulk_model_class(models)
+        for model in models:
+            self.validate_model(model)
+        
+        table_name = self.get_table_name(model_class)
+        table = self.tables.get(table_name)
+        if table is None:
+            await self.create_table(model_class)
+            table = self.tables[table_name]
+        
+        rows = [self._prepare_insert_data(model) for model in models]
+        errors: List[Dict[str, Any]] = []
+        statement = self._insert_statement(table)
+        
+        try:
+            if self._async_engine:
+                async with self._session(commit=True) as session:
+                    for batch_number, (start, batch) in enumerate(self._batches(rows, batch_size)):
+                        try:
+                            async with session.begin_nested():
+                                await session.execute(statement, batch)
+                        except IntegrityError as e:
+                            errors.append(self._bulk_error(batch_number, start, e.orig, len(batch)))
+            else:
+                errors = self._insert_batches(statement, rows, batch_size)
+        except Exception as e:
+            raise QueryError(f"Failed to insert records: {str(e)}")
+        
+        return self._finish_insert_many(models, errors)
+    
+    def _insert_batches(self, statement: Any, rows: List[Dict[str, Any]], batch_size: int) -> List[Dict[str, Any]]:
+        """Write rows in savepointed executemany batches on a sync session."""
+        errors: List[Dict[str, Any]] = []
+        with self._sync_session(commit=True) as session:
+            for batch_number, (start, batch) in enumerate(self._batches(rows, batch_size)):
+                try:
+                    with session.begin_nested():
+                        session.execute(statement, batch)
+                except IntegrityError as e:
+                    errors.append(self._bulk_error(batch_number, start, e.orig, len(batch)))
+        return errors
+    
+    async def upsert(self, model: T, conflict_fields: Optional[Sequence[str]] = None) -> T:
+        """Insert or update a record with INSERT ... ON CONFLICT DO UPDATE."""
+        return (await self.upsert_many([model], conflict_fields=conflict_fields))[0]
+    
+    async def upsert_many(
+        self,
+        models: Sequence[T],
+        batch_size: int = 1000,
+        conflict_fields: Optional[Sequence[str]] = None
+    ) -> List[T]:
+        """
+        Upsert many records in one transaction, one executemany per batch.
+        
+        Conflicting rows keep their primary key; the stored key is written
+        back to the model via RETURNING. Models sharing a conflict key are
+        written once, with the last one's values.
+        """
+        if not models:
+            return []
+        
+        model_class = self._bulk_model_class(models)
+        for model in models:
+            self.validate_model(model)
+        
+        table_name = self.get_table_name(model_class)
+        table = self.tables.get(table_name)
+        if table is None:
+            await self.create_table(model_class)
+            table = self.tables[table_name]
+        
+        conflict_columns = self._conflict_columns(model_class, conflict_fields)
+        statement = self._upsert_statement(model_class, table, conflict_columns)
+        rows = [self._prepare_insert_data(model) for model in models]
+        
+        try:
+            if self._async_engine:
+                stored = []
+                async with self._session(commit=True) as session:
+                    for _, batch in self._batches(self._unique_upsert_rows(rows, conflict_columns), batch_size):
+                        result = await session.execute(statement, batch)
+                        stored.extend(result.all())
+            else:
+                stored = self._upsert_batches(statement, self._unique_upsert_rows(rows, conflict_columns), batch_size)
+        except IntegrityError as e:
+            raise DuplicateError(f"Duplicate value for unique field: {str(e)}")
+        except Exception as e:
+            raise QueryError(f"Failed to upsert records: {str(e)}")
+        
+        return self._finish_upsert(models, rows, stored, conflict_columns)
+    
+    def _upsert_statement(
+        self,
+        model_class: Type[BaseModel],
+        table: Table,
+        conflict_columns: Tuple[str, ...]
+    ) -> Any:
+        """
+        Get the cached INSERT ... ON CONFLICT DO UPDATE statement, returning
+        the stored primary key and conflict columns of each written row.
+        """
+        dialect_name = self._dialect_name()
+        dialect_insert = _UPSERT_INSERTS.get(dialect_name)
+        if dialect_insert is None:
+            raise QueryError(f"Upsert is not supported for the {dialect_name} dialect")
+        
+        pk_column = self._column_name(model_class, self.get_primary_key_field(model_class))
+        
+        def build() -> Any:
+            statement = dialect_insert(table)
+            unchanged = set(conflict_columns) | {pk_column}
+            changes = {
+                column.name: statement.excluded[column.name]
+                for column in table.columns if column.name not in unchanged
+            }
+            if not changes:
+                # A no-op update (rather than DO NOTHING) keeps RETURNING one row per input
+                changes = {conflict_columns[0]: statement.excluded[conflict_columns[0]]}
+            
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c[column] for column in conflict_columns],
+                set_=changes,
+            )
+            return statement.returning(table.c[pk_column], *(table.c[column] for column in conflict_columns))
+        
+        return self.statement_cache.get((table, "upsert", conflict_columns), build)
+    
+    def _dialect_name(self) -> str:
+        """Get the SQL dialect name, whether connected with connect() or connect_sync()."""
+        for engine in (self._async_engine, self._engine, self._sync_engine):
+            if engine is not None:
+                return engine.dialect.name
+        return sa.engine.make_url(self.connection_string).get_backend_name()
+    
+    @staticmethod
+    def _unique_upsert_rows(rows: List[Dict[str, Any]], conflict_columns: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """
+        Keep the last row per conflict key: ON CONFLICT DO UPDATE cannot
+        affect the same row twice in one statement.
+        """
+        return list({tuple(row[column] for column in conflict_columns): row for row in rows}.values())
+    
+    def _upsert_batches(self, statement: Any, rows: List[Dict[str, Any]], batch_size: int) -> List[Any]:
+        """Execute upsert batches on a sync session, returning the RETURNING rows."""
+        stored = []
+        with self._sync_session(commit=True) as session:
+            for _, batch in self._batches(rows, batch_size):
+                stored.extend(session.execute(statement, batch).all())
+        return stored
+    
+    def _finish_upsert(
+        self,
+        models: Sequence[T],
+        rows: List[Dict[str, Any]],
+        stored: List[Any],
+        conflict_columns: Tuple[str, ...]
+    ) -> List[T]:
+        """
+        Write stored primary keys back to the models, matched by conflict
+        key (the RETURNING rows come in no particular order), and mark the
+        models clean.
+        """
+        pk_field = self.get_primary_key_field(models[0].__class__)
+        keys = {tuple(row[1:]): row[0] for row in stored}
+        for model, row in zip(models, rows):
+            key = keys.get(tuple(row[column] for column in conflict_columns))
+            if key is not None and getattr(model, pk_field) != key:
+                setattr(model, pk_field, key)
+            self._mark_clean(model)
+        return list(models)
+    
+    async def update(self, model: T, full: bool = False) -> T:
+        """Update an existing record, writing only changed columns unless full=True."""
         self.validate_model(model)
         
         table_name = self.get_table_name(model.__class__)
@@ -280,29 +892,31 @@ class SQLAdapter(BaseAdapter):
         if not pk_value:
             raise ValidationError(f"Primary key field '{pk_field}' is required for update")
         
-        # Prepare data for update (exclude primary key)
-        data = {k: v for k, v in model.to_dict(exclude_none=False).items() if k != pk_field}
+        # Prepare data for update (changed columns only, excluding primary key)
+        pk_column = self._column_name(model.__class__, pk_field)
+        data = self._get_update_data(model, full)
+        if not data:
+            return model
         
         try:
             if self._async_engine:
-                async with self._async_session_factory() as session:
+                async with self._session(commit=True) as session:
                     result = await session.execute(
-                        update(table).where(table.c[pk_field] == pk_value).values(**data)
+                        self._pk_statement(table, pk_column, "update"), {**data, "_pk": pk_value}
                     )
-                    await session.commit()
                     
                     if result.rowcount == 0:
                         raise NotFoundError(f"Record with {pk_field}={pk_value} not found")
             else:
-                with self._session_factory() as session:
+                with self._sync_session(commit=True) as session:
                     result = session.execute(
-                        update(table).where(table.c[pk_field] == pk_value).values(**data)
+                        self._pk_statement(table, pk_column, "update"), {**data, "_pk": pk_value}
                     )
-                    session.commit()
                     
                     if result.rowcount == 0:
                         raise NotFoundError(f"Record with {pk_field}={pk_value} not found")
             
+            self._mark_clean(model)
             return model
             
         except NotFoundError:
@@ -310,7 +924,13 @@ class SQLAdapter(BaseAdapter):
         except Exception as e:
             raise QueryError(f"Failed to update record: {str(e)}")
     
-    async def find_by_id(self, model_class: Type[T], id_value: Any) -> Optional[T]:
+    async def find_by_id(
+        self,
+        model_class: Type[T],
+        id_value: Any,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Optional[T]:
         """Find a record by primary key."""
         table_name = self.get_table_name(model_class)
         table = self.tables.get(table_name)
@@ -318,24 +938,24 @@ class SQLAdapter(BaseAdapter):
         if table is None:
             return None
         
-        pk_field = self.get_primary_key_field(model_class)
+        pk_column = self._column_name(model_class, self.get_primary_key_field(model_class))
+        columns = self._projection(model_class, fields, exclude)
+        query = self._pk_statement(table, pk_column, "select", columns)
         
         try:
             if self._async_engine:
-                async with self._async_session_factory() as session:
-                    result = await session.execute(
-                        select(table).where(table.c[pk_field] == id_value)
-                    )
+                async with self._session() as session:
+                    result = await session.execute(query, {"_pk": id_value})
                     row = result.fetchone()
             else:
-                with self._session_factory() as session:
-                    result = session.execute(
-                        select(table).where(table.c[pk_field] == id_value)
-                    )
+                with self._sync_session() as session:
+                    result = session.execute(query, {"_pk": id_value})
                     row = result.fetchone()
             
+            if row and columns:
+                return self._models_from_rows(model_class, [row], columns, partial=True)[0]
             if row:
-                return model_class.from_dict(dict(row._mapping))
+                return self._model_from_mapping(model_class, row._mapping)
             return None
             
         except Exception as e:
@@ -347,71 +967,121 @@ class SQLAdapter(BaseAdapter):
         filters: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        order_by: Optional[List[str]] = None
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
     ) -> List[T]:
-        """Find multiple records."""
+        """
+        Find multiple records.
+        
+        To-one relationships in `include` are loaded with a LEFT JOIN in the
+        same query; to-many and nested ones with one select-in query each.
+        """
         table_name = self.get_table_name(model_class)
         table = self.tables.get(table_name)
         
         if table is None:
             return []
         
-        # Build query
-        query = select(table)
-        
-        # Apply filters
-        if filters:
-            for field, value in filters.items():
-                if hasattr(table.c, field):
-                    if isinstance(value, dict):
-                        # Handle operators like {"$gte": 18}
-                        for op, op_value in value.items():
-                            if op == "$gte":
-                                query = query.where(table.c[field] >= op_value)
-                            elif op == "$lte":
-                                query = query.where(table.c[field] <= op_value)
-                            elif op == "$gt":
-                                query = query.where(table.c[field] > op_value)
-                            elif op == "$lt":
-                                query = query.where(table.c[field] < op_value)
-                            elif op == "$ne":
-                                query = query.where(table.c[field] != op_value)
-                            elif op == "$in":
-                                query = query.where(table.c[field].in_(op_value))
-                    else:
-                        query = query.where(table.c[field] == value)
-        
-        # Apply ordering
-        if order_by:
-            for field in order_by:
-                if field.startswith('-'):
-                    field = field[1:]
-                    if hasattr(table.c, field):
-                        query = query.order_by(table.c[field].desc())
-                else:
-                    if hasattr(table.c, field):
-                        query = query.order_by(table.c[field])
-        
-        # Apply pagination
-        if offset:
-            query = query.offset(offset)
-        if limit:
-            query = query.limit(limit)
+        # Build query (cached by filter/order shape, values bound as parameters)
+        projection = self._projection(model_class, fields, exclude)
+        tree, joins = self._join_plan(model_class, include)
+        query, params = self._find_query(model_class, table, filters, limit, offset, order_by, projection, joins)
         
         try:
             if self._async_engine:
-                async with self._async_session_factory() as session:
-                    result = await session.execute(query)
+                async with self._session() as session:
+                    result = await session.execute(query, params)
                     rows = result.fetchall()
+                    columns = tuple(result.keys())
             else:
-                with self._session_factory() as session:
-                    result = session.execute(query)
+                with self._sync_session() as session:
+                    result = session.execute(query, params)
                     rows = result.fetchall()
+                    columns = tuple(result.keys())
             
-            return [model_class.from_dict(dict(row._mapping)) for row in rows]
+            models = self._joined_models(model_class, rows, columns, bool(projection), joins)
             
         except Exception as e:
             raise QueryError(f"Failed to find records: {str(e)}")
+        
+        for target_class, targets, children in self._unjoined_includes(model_class, models, tree, joins):
+            await self.load_related(target_class, targets, children)
+        return models
+    
+    async def stream(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[T]:
+        """Stream records from a server-side cursor, batch_size rows at a time."""
+        table = self.tables.get(self.get_table_name(model_class))
+        
+        if table is None:
+            return
+        
+        projection = self._projection(model_class, fields, exclude)
+        query, params = self._find_query(model_class, table, filters, None, None, order_by, projection)
+        options = {"yield_per": batch_size}
+        
+        try:
+            if self._async_engine:
+                async with self._session() as session:
+                    result = await session.stream(query, params, execution_options=options)
+                    columns = tuple(result.keys())
+                    async for rows in result.partitions():
+                        for model in self._models_from_rows(model_class, rows, columns, bool(projection)):
+                            yield model
+            else:
+                for model in self.stream_sync(model_class, filters, batch_size, order_by, fields, exclude):
+                    yield model
+            
+        except QueryError:
+            raise
+        except Exception as e:
+            raise QueryError(f"Failed to stream records: {str(e)}")
+    
+    async def update_many(
+        self,
+        model_class: Type[T],
+        filters: Dict[str, Any],
+        changes: Dict[str, Any]
+    ) -> int:
+        """Update all matching rows with a single UPDATE ... WHERE."""
+        table = self.tables.get(self.get_table_name(model_class))
+        if table is None:
+            return 0
+        
+        query, params = self._update_many_query(model_class, table, filters, changes)
+        return await self._execute_write(query, params, "update")
+    
+    async def delete_many(self, model_class: Type[T], filters: Dict[str, Any]) -> int:
+        """Delete all matching rows with a single DELETE ... WHERE."""
+        table = self.tables.get(self.get_table_name(model_class))
+        if table is None:
+            return 0
+        
+        query, params = self._delete_many_query(model_class, table, filters)
+        return await self._execute_write(query, params, "delete")
+    
+    async def _execute_write(self, query: Any, params: Dict[str, Any], action: str) -> int:
+        """Execute and commit a set-based write, returning the affected row count."""
+        try:
+            if self._async_engine:
+                async with self._session(commit=True) as session:
+                    result = await session.execute(query, params)
+            else:
+                with self._sync_session(commit=True) as session:
+                    result = session.execute(query, params)
+            return result.rowcount
+            
+        except Exception as e:
+            raise QueryError(f"Failed to {action} records: {str(e)}")
     
     async def delete_by_id(self, model_class: Type[T], id_value: Any) -> bool:
         """Delete a record by primary key."""
@@ -421,21 +1091,19 @@ class SQLAdapter(BaseAdapter):
         if table is None:
             return False
         
-        pk_field = self.get_primary_key_field(model_class)
+        pk_column = self._column_name(model_class, self.get_primary_key_field(model_class))
         
         try:
             if self._async_engine:
-                async with self._async_session_factory() as session:
+                async with self._session(commit=True) as session:
                     result = await session.execute(
-                        delete(table).where(table.c[pk_field] == id_value)
+                        self._pk_statement(table, pk_column, "delete"), {"_pk": id_value}
                     )
-                    await session.commit()
             else:
-                with self._session_factory() as session:
+                with self._sync_session(commit=True) as session:
                     result = session.execute(
-                        delete(table).where(table.c[pk_field] == id_value)
+                        self._pk_statement(table, pk_column, "delete"), {"_pk": id_value}
                     )
-                    session.commit()
             
             return result.rowcount > 0
             
@@ -454,35 +1122,73 @@ class SQLAdapter(BaseAdapter):
         if table is None:
             return 0
         
-        query = select(sa.func.count()).select_from(table)
-        
-        # Apply filters
-        if filters:
-            for field, value in filters.items():
-                if hasattr(table.c, field):
-                    query = query.where(table.c[field] == value)
+        query, params = self._count_query(model_class, table, filters)
         
         try:
             if self._async_engine:
-                async with self._async_session_factory() as session:
-                    result = await session.execute(query)
+                async with self._session() as session:
+                    result = await session.execute(query, params)
                     return result.scalar()
             else:
-                with self._session_factory() as session:
-                    result = session.execute(query)
+                with self._sync_session() as session:
+                    result = session.execute(query, params)
                     return result.scalar()
                     
         except Exception as e:
             raise QueryError(f"Failed to count records: {str(e)}")
     
+    async def aggregate(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        group_by: Optional[Sequence[str]] = None,
+        metrics: Optional[Mapping[str, Aggregate]] = None
+    ) -> List[Dict[str, Any]]:
+        """Compute metrics per group with one SELECT ... GROUP BY."""
+        groups, measures = self._aggregate_spec(model_class, group_by, metrics)
+        table = self.tables.get(self.get_table_name(model_class))
+        if table is None:
+            return Aggregator(groups, measures).results()
+        
+        query, params = self._aggregate_query(model_class, table, filters, groups, measures)
+        
+        try:
+            if self._async_engine:
+                async with self._session() as session:
+                    result = await session.execute(query, params)
+                    return self._aggregate_results(result.all(), groups, measures)
+            else:
+                with self._sync_session() as session:
+                    result = session.execute(query, params)
+                    return self._aggregate_results(result.all(), groups, measures)
+                    
+        except Exception as e:
+            raise QueryError(f"Failed to aggregate records: {str(e)}")
+    
     async def exists(
         self, 
         model_class: Type[T], 
         filters: Dict[str, Any]
     ) -> bool:
-        """Check if records exist matching criteria."""
-        count = await self.count(model_class, filters)
-        return count > 0
+        """Check if records exist matching criteria with a LIMIT 1 probe."""
+        table = self.tables.get(self.get_table_name(model_class))
+        if table is None:
+            return False
+        
+        query, params = self._exists_query(model_class, table, filters)
+        
+        try:
+            if self._async_engine:
+                async with self._session() as session:
+                    result = await session.execute(query, params)
+                    return result.first() is not None
+            else:
+                with self._sync_session() as session:
+                    result = session.execute(query, params)
+                    return result.first() is not None
+                    
+        except Exception as e:
+            raise QueryError(f"Failed to check records: {str(e)}")
     
     # Synchronous method implementations
     
@@ -514,19 +1220,13 @@ class SQLAdapter(BaseAdapter):
             table.create(self._sync_engine, checkfirst=True)
             self.tables[table_name] = table
         
-        # Prepare data for insertion
-        data = model.to_dict(exclude_none=False)
-        
-        # Generate primary key if needed
-        pk_field = self.get_primary_key_field(model.__class__)
-        if not data.get(pk_field):
-            data[pk_field] = model.generate_id()
-            setattr(model, pk_field, data[pk_field])
+        # Prepare data for insertion, generating the primary key if needed
+        data = self._prepare_insert_data(model)
         
         try:
-            with self._session_factory() as session:
-                result = session.execute(insert(table).values(**data))
-                session.commit()
+            with self._sync_session(commit=True) as session:
+                result = session.execute(self._insert_statement(table), data)
+            self._mark_clean(model)
             return model
             
         except sa.exc.IntegrityError as e:
@@ -534,7 +1234,69 @@ class SQLAdapter(BaseAdapter):
         except Exception as e:
             raise QueryError(f"Failed to insert record: {str(e)}")
     
-    def update_sync(self, model: T) -> T:
+    def insert_many_sync(self, models: Sequence[T], batch_size: int = 1000) -> List[T]:
+        """Synchronous version of insert_many."""
+        if not models:
+            return []
+        
+        model_class = self._bulk_model_class(models)
+        for model in models:
+            self.validate_model(model)
+        
+        table_name = self.get_table_name(model_class)
+        table = self.tables.get(table_name)
+        if table is None:
+            table = self._create_table_from_model(model_class, table_name)
+            table.create(self._sync_engine, checkfirst=True)
+            self.tables[table_name] = table
+        
+        rows = [self._prepare_insert_data(model) for model in models]
+        try:
+            errors = self._insert_batches(self._insert_statement(table), rows, batch_size)
+        except Exception as e:
+            raise QueryError(f"Failed to insert records: {str(e)}")
+        
+        return self._finish_insert_many(models, errors)
+    
+    def upsert_sync(self, model: T, conflict_fields: Optional[Sequence[str]] = None) -> T:
+        """Synchronous version of upsert."""
+        return self.upsert_many_sync([model], conflict_fields=conflict_fields)[0]
+    
+    def upsert_many_sync(
+        self,
+        models: Sequence[T],
+        batch_size: int = 1000,
+        conflict_fields: Optional[Sequence[str]] = None
+    ) -> List[T]:
+        """Synchronous version of upsert_many."""
+        if not models:
+            return []
+        
+        model_class = self._bulk_model_class(models)
+        for model in models:
+            self.validate_model(model)
+        
+        table_name = self.get_table_name(model_class)
+        table = self.tables.get(table_name)
+        if table is None:
+            table = self._create_table_from_model(model_class, table_name)
+            table.create(self._sync_engine, checkfirst=True)
+            self.tables[table_name] = table
+        
+        conflict_columns = self._conflict_columns(model_class, conflict_fields)
+        statement = self._upsert_statement(model_class, table, conflict_columns)
+        rows = [self._prepare_insert_data(model) for model in models]
+        
+        try:
+            stored = self._upsert_batches(statement, self._unique_upsert_rows(rows, conflict_columns), batch_size)
+        except IntegrityError as e:
+            raise DuplicateError(f"Duplicate value for unique field: {str(e)}")
+        except Exception as e:
+            raise QueryError(f"Failed to upsert records: {str(e)}")
+        
+        return self._finish_upsert(models, rows, stored, conflict_columns)
+    
+    def update_sync(self, model: T, full: bool = False) -> T:
         """Synchronous version of update."""
         self.validate_model(model)
         
@@ -550,18 +1312,21 @@ class SQLAdapter(BaseAdapter):
         if not pk_value:
             raise ValidationError(f"Primary key field '{pk_field}' is required for update")
         
-        data = {k: v for k, v in model.to_dict(exclude_none=False).items() if k != pk_field}
+        pk_column = self._column_name(model.__class__, pk_field)
+        data = self._get_update_data(model, full)
+        if not data:
+            return model
         
         try:
-            with self._session_factory() as session:
+            with self._sync_session(commit=True) as session:
                 result = session.execute(
-                    update(table).where(table.c[pk_field] == pk_value).values(**data)
+                    self._pk_statement(table, pk_column, "update"), {**data, "_pk": pk_value}
                 )
-                session.commit()
                 
                 if result.rowcount == 0:
                     raise NotFoundError(f"Record with {pk_field}={pk_value} not found")
             
+            self._mark_clean(model)
             return model
             
         except NotFoundError:
@@ -569,7 +1334,13 @@ class SQLAdapter(BaseAdapter):
         except Exception as e:
             raise QueryError(f"Failed to update record: {str(e)}")
     
-    def find_by_id_sync(self, model_class: Type[T], id_value: Any) -> Optional[T]:
+    def find_by_id_sync(
+        self,
+        model_class: Type[T],
+        id_value: Any,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Optional[T]:
         """Synchronous version of find_by_id."""
         table_name = self.get_table_name(model_class)
         table = self.tables.get(table_name)
@@ -577,17 +1348,19 @@ class SQLAdapter(BaseAdapter):
         if table is None:
             return None
         
-        pk_field = self.get_primary_key_field(model_class)
+        pk_column = self._column_name(model_class, self.get_primary_key_field(model_class))
+        columns = self._projection(model_class, fields, exclude)
+        query = self._pk_statement(table, pk_column, "select", columns)
         
         try:
-            with self._session_factory() as session:
-                result = session.execute(
-                    select(table).where(table.c[pk_field] == id_value)
-                )
+            with self._sync_session() as session:
+                result = session.execute(query, {"_pk": id_value})
                 row = result.fetchone()
             
+            if row and columns:
+                return self._models_from_rows(model_class, [row], columns, partial=True)[0]
             if row:
-                return model_class.from_dict(dict(row._mapping))
+                return self._model_from_mapping(model_class, row._mapping)
             return None
             
         except Exception as e:
@@ -599,7 +1372,10 @@ class SQLAdapter(BaseAdapter):
         filters: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        order_by: Optional[List[str]] = None
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
     ) -> List[T]:
         """Synchronous version of find_many."""
         table_name = self.get_table_name(model_class)
@@ -608,55 +1384,85 @@ class SQLAdapter(BaseAdapter):
         if table is None:
             return []
         
-        query = select(table)
-        
-        # Apply filters
-        if filters:
-            for field, value in filters.items():
-                if hasattr(table.c, field):
-                    if isinstance(value, dict):
-                        for op, op_value in value.items():
-                            if op == "$gte":
-                                query = query.where(table.c[field] >= op_value)
-                            elif op == "$lte":
-                                query = query.where(table.c[field] <= op_value)
-                            elif op == "$gt":
-                                query = query.where(table.c[field] > op_value)
-                            elif op == "$lt":
-                                query = query.where(table.c[field] < op_value)
-                            elif op == "$ne":
-                                query = query.where(table.c[field] != op_value)
-                            elif op == "$in":
-                                query = query.where(table.c[field].in_(op_value))
-                    else:
-                        query = query.where(table.c[field] == value)
-        
-        # Apply ordering
-        if order_by:
-            for field in order_by:
-                if field.startswith('-'):
-                    field = field[1:]
-                    if hasattr(table.c, field):
-                        query = query.order_by(table.c[field].desc())
-                else:
-                    if hasattr(table.c, field):
-                        query = query.order_by(table.c[field])
-        
-        # Apply pagination
-        if offset:
-            query = query.offset(offset)
-        if limit:
-            query = query.limit(limit)
+        projection = self._projection(model_class, fields, exclude)
+        tree, joins = self._join_plan(model_class, include)
+        query, params = self._find_query(model_class, table, filters, limit, offset, order_by, projection, joins)
         
         try:
-            with self._session_factory() as session:
-                result = session.execute(query)
+            with self._sync_session() as session:
+                result = session.execute(query, params)
                 rows = result.fetchall()
+                columns = tuple(result.keys())
             
-            return [model_class.from_dict(dict(row._mapping)) for row in rows]
+            models = self._joined_models(model_class, rows, columns, bool(projection), joins)
             
         except Exception as e:
             raise QueryError(f"Failed to find records: {str(e)}")
+        
+        for target_class, targets, children in self._unjoined_includes(model_class, models, tree, joins):
+            self.load_related_sync(target_class, targets, children)
+        return models
+    
+    def stream_sync(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Iterator[T]:
+        """Synchronous version of stream."""
+        table = self.tables.get(self.get_table_name(model_class))
+        
+        if table is None:
+            return
+        
+        projection = self._projection(model_class, fields, exclude)
+        query, params = self._find_query(model_class, table, filters, None, None, order_by, projection)
+        
+        try:
+            with self._sync_session() as session:
+                result = session.execute(query, params, execution_options={"yield_per": batch_size})
+                columns = tuple(result.keys())
+                for rows in result.partitions():
+                    yield from self._models_from_rows(model_class, rows, columns, bool(projection))
+            
+        except Exception as e:
+            raise QueryError(f"Failed to stream records: {str(e)}")
+    
+    def update_many_sync(
+        self,
+        model_class: Type[T],
+        filters: Dict[str, Any],
+        changes: Dict[str, Any]
+    ) -> int:
+        """Synchronous version of update_many."""
+        table = self.tables.get(self.get_table_name(model_class))
+        if table is None:
+            return 0
+        
+        query, params = self._update_many_query(model_class, table, filters, changes)
+        return self._execute_write_sync(query, params, "update")
+    
+    def delete_many_sync(self, model_class: Type[T], filters: Dict[str, Any]) -> int:
+        """Synchronous version of delete_many."""
+        table = self.tables.get(self.get_table_name(model_class))
+        if table is None:
+            return 0
+        
+        query, params = self._delete_many_query(model_class, table, filters)
+        return self._execute_write_sync(query, params, "delete")
+    
+    def _execute_write_sync(self, query: Any, params: Dict[str, Any], action: str) -> int:
+        """Synchronous version of _execute_write."""
+        try:
+            with self._sync_session(commit=True) as session:
+                result = session.execute(query, params)
+            return result.rowcount
+            
+        except Exception as e:
+            raise QueryError(f"Failed to {action} records: {str(e)}")
     
     def delete_by_id_sync(self, model_class: Type[T], id_value: Any) -> bool:
         """Synchronous version of delete_by_id."""
@@ -666,14 +1472,13 @@ class SQLAdapter(BaseAdapter):
         if table is None:
             return False
         
-        pk_field = self.get_primary_key_field(model_class)
+        pk_column = self._column_name(model_class, self.get_primary_key_field(model_class))
         
         try:
-            with self._session_factory() as session:
+            with self._sync_session(commit=True) as session:
                 result = session.execute(
-                    delete(table).where(table.c[pk_field] == id_value)
+                    self._pk_statement(table, pk_column, "delete"), {"_pk": id_value}
                 )
-                session.commit()
             
             return result.rowcount > 0
             
@@ -692,21 +1497,39 @@ class SQLAdapter(BaseAdapter):
         if table is None:
             return 0
         
-        query = select(sa.func.count()).select_from(table)
-        
-        if filters:
-            for field, value in filters.items():
-                if hasattr(table.c, field):
-                    query = query.where(table.c[field] == value)
+        query, params = self._count_query(model_class, table, filters)
         
         try:
-            with self._session_factory() as session:
-                result = session.execute(query)
+            with self._sync_session() as session:
+                result = session.execute(query, params)
                 return result.scalar()
                     
         except Exception as e:
             raise QueryError(f"Failed to count records: {str(e)}")
     
+    def aggregate_sync(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        group_by: Optional[Sequence[str]] = None,
+        metrics: Optional[Mapping[str, Aggregate]] = None
+    ) -> List[Dict[str, Any]]:
+        """Synchronous version of aggregate."""
+        groups, measures = self._aggregate_spec(model_class, group_by, metrics)
+        table = self.tables.get(self.get_table_name(model_class))
+        if table is None:
+            return Aggregator(groups, measures).results()
+        
+        query, params = self._aggregate_query(model_class, table, filters, groups, measures)
+        
+        try:
+            with self._sync_session() as session:
+                result = session.execute(query, params)
+                return self._aggregate_results(result.all(), groups, measures)
+                    
+        except Exception as e:
+            raise QueryError(f"Failed to aggregate records: {str(e)}")
+    
     def disconnect_sync(self) -> None:
         """Synchronous version of disconnect."""
         if self._sync_engine:
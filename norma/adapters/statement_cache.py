@@ -0,0 +1,109 @@
+"""
+Norma Statement Cache
+
+Bounded cache of pre-built, parameterized statements shared by the
+adapters. Statements are keyed by what determines their shape (table,
+operation, filter layout) and executed with bound parameters, so the
+driver and SQLAlchemy can reuse their own compiled forms too.
+"""
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class StatementCache:
+    """
+    LRU cache of statements with hit/miss counters.
+
+    Keys are tuples whose first element identifies the table (or other
+    schema object) the statement targets, so invalidate() can drop every
+    statement for it after a schema change.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        """
+        Create an empty cache.
+
+        Args:
+            maxsize: Maximum number of statements kept; the least recently
+                used statement is evicted beyond this
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._statements: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+        # Statements being built by get_async(), keyed like _statements
+        self._building: Dict[Tuple[Hashable, ...], "asyncio.Future[Any]"] = {}
+
+    def get(self, key: Tuple[Hashable, ...], build: Callable[[], Any]) -> Any:
+        """
+        Get the statement for a key, building and caching it on a miss.
+
+        Args:
+            key: Hashable statement shape, starting with the target table
+            build: Zero-argument function building the statement
+        """
+        statement = self._statements.get(key)
+        if statement is not None:
+            self.hits += 1
+            self._statements.move_to_end(key)
+            return statement
+
+        self.misses += 1
+        statement = build()
+        self._put(key, statement)
+        return statement
+
+    async def get_async(self, key: Tuple[Hashable, ...], build: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Like get(), for statements built without blocking the event loop
+        (e.g. prepared on the database server from a worker thread).
+
+        Concurrent misses for one key share a single build. A build still
+        running when its table is invalidated is not cached.
+        """
+        statement = self._statements.get(key)
+        if statement is not None:
+            self.hits += 1
+            self._statements.move_to_end(key)
+            return statement
+
+        building = self._building.get(key)
+        if building is None or building.get_loop() is not asyncio.get_running_loop():
+            self.misses += 1
+            building = self._building[key] = asyncio.ensure_future(build())
+            building.add_done_callback(lambda done: self._finish_build(key, done))
+        return await asyncio.shield(building)
+
+    def _finish_build(self, key: Tuple[Hashable, ...], building: "asyncio.Future[Any]") -> None:
+        if self._building.get(key) is not building:
+            return
+        del self._building[key]
+        if not building.cancelled() and building.exception() is None:
+            self._put(key, building.result())
+
+    def _put(self, key: Tuple[Hashable, ...], statement: Any) -> None:
+        self._statements[key] = statement
+        self._statements.move_to_end(key)
+        if len(self._statements) > self.maxsize:
+            self._statements.popitem(last=False)
+
+    def invalidate(self, target: Hashable) -> None:
+        """Drop every cached statement for a table (or other target)."""
+        for key in [key for key in self._statements if key[0] == target]:
+            del self._statements[key]
+        for key in [key for key in self._building if key[0] == target]:
+            del self._building[key]
+
+    def clear(self) -> None:
+        """Drop every cached statement (counters are kept)."""
+        self._statements.clear()
+        self._building.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Get the hit and miss counts and the number of cached statements."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._statements)}
+
+    def __len__(self) -> int:
+        return len(self._statements)
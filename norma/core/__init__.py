@@ -4,13 +4,17 @@ Norma Core Components
 This package contains the core components of Norma ORM.
 """
 
-from .base_model import BaseModel, model_metadata
+from .base_model import BaseModel, model, model_metadata
+from .meta import ModelMeta, get_model_meta
 from .field import Field, FieldConfig, Relationship, OneToOne, OneToMany, ManyToOne, ManyToMany
 from .client import NormaClient, ModelClient
 
 __all__ = [
     "BaseModel",
+    "model",
     "model_metadata",
+    "ModelMeta",
+    "get_model_meta",
     "Field",
     "FieldConfig", 
     "Relationship",
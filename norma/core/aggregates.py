@@ -0,0 +1,187 @@
+"""
+Norma Aggregates
+
+Metrics accepted by aggregate(). Each metric names an aggregate function
+and the field it reads; adapters compile them into a SQL GROUP BY query,
+a MongoDB $group stage or CQL aggregate functions. Results are plain
+dictionaries keyed by the group_by fields and the metric names:
+
+    await client.aggregate(
+        Order,
+        {"status": "paid"},
+        group_by=["region"],
+        metrics={"orders": Count(), "total": Sum("amount"), "largest": Max("amount")},
+    )
+    # [{"region": "eu", "orders": 12, "total": 340, "largest": 90}, ...]
+"""
+
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ..exceptions import QueryError
+
+
+@dataclass(frozen=True)
+class Aggregate:
+    """An aggregate function over one field (or over rows, for Count())."""
+
+    field: Optional[str] = None
+    function: ClassVar[str] = ""
+
+
+class Count(Aggregate):
+    """Number of rows, or of non-null values of `field` when given."""
+
+    function = "count"
+
+
+class Sum(Aggregate):
+    """Sum of the non-null values of `field` (None if there are none)."""
+
+    function = "sum"
+
+
+class Avg(Aggregate):
+    """Mean of the non-null values of `field` (None if there are none)."""
+
+    function = "avg"
+
+
+class Min(Aggregate):
+    """Smallest non-null value of `field`."""
+
+    function = "min"
+
+
+class Max(Aggregate):
+    """Largest non-null value of `field`."""
+
+    function = "max"
+
+
+# Compiled form of a metric: (result name, function, column or None)
+Measure = Tuple[str, str, Optional[str]]
+
+
+def resolve_aggregate(
+    group_by: Optional[Sequence[str]],
+    metrics: Optional[Mapping[str, Aggregate]],
+    field_to_column: Mapping[str, str],
+    model_name: str
+) -> Tuple[Tuple[Tuple[str, str], ...], Tuple[Measure, ...]]:
+    """
+    Validate an aggregate() call and translate its fields into columns.
+
+    Without metrics the rows are counted, as {"count": Count()}.
+
+    Returns:
+        The hashable (field, column) group keys and measures, used by the
+        adapters to compile and cache the query
+
+    Raises:
+        QueryError: For unknown fields, non-metric values, metrics missing
+            their field, or metric names that clash with group_by fields
+    """
+    def column_for(field: str) -> str:
+        if field not in field_to_column:
+            raise QueryError(f"Unknown aggregate field '{field}' for {model_name}")
+        return field_to_column[field]
+
+    groups = tuple((field, column_for(field)) for field in group_by or ())
+    measures = []
+    for name, metric in (metrics or {"count": Count()}).items():
+        if not isinstance(metric, Aggregate) or not metric.function:
+            raise QueryError(f"Metric '{name}' must be Count, Sum, Avg, Min or Max")
+        if name in (group_by or ()):
+            raise QueryError(f"Metric '{name}' has the same name as a group_by field")
+        if metric.field is None and metric.function != "count":
+            raise QueryError(f"Metric '{name}' needs a field to {metric.function}")
+        column = None if metric.field is None else column_for(metric.field)
+        measures.append((name, metric.function, column))
+    return groups, tuple(measures)
+
+
+class _Accumulator:
+    """Running value of one measure within one group."""
+
+    __slots__ = ("function", "count", "value")
+
+    def __init__(self, function: str):
+        self.function = function
+        self.count = 0
+        self.value = None
+
+    def add(self, value: Any) -> None:
+        if value is None:
+            return
+        self.count += 1
+        if self.value is None:
+            self.value = value
+        elif self.function in ("sum", "avg"):
+            self.value += value
+        elif self.function == "min":
+            self.value = min(self.value, value)
+        elif self.function == "max":
+            self.value = max(self.value, value)
+
+    def result(self) -> Any:
+        if self.function == "count":
+            return self.count
+        if self.function == "avg":
+            return self.value / self.count if self.count else None
+        return self.value
+
+
+class Aggregator:
+    """
+    Aggregate rows in Python, for queries a backend cannot run itself.
+
+    Rows are added one at a time, so memory grows with the number of
+    groups rather than rows. Like SQL, aggregating without group_by
+    always produces one row, even if nothing matched.
+    """
+
+    def __init__(self, groups: Sequence[Tuple[str, str]], measures: Sequence[Measure]):
+        """
+        Args:
+            groups: Group keys from resolve_aggregate()
+            measures: Measures from resolve_aggregate()
+        """
+        self.groups = groups
+        self.measures = measures
+        self._results: Dict[Tuple[Any, ...], List[_Accumulator]] = {}
+
+    def add(self, row: Mapping[str, Any]) -> None:
+        """Add a row, given as a mapping of column name to value."""
+        key = tuple(row.get(column) for _, column in self.groups)
+        accumulators = self._results.get(key)
+        if accumulators is None:
+            accumulators = self._results[key] = self._accumulators()
+        for accumulator, (_, _, column) in zip(accumulators, self.measures):
+            # Count() counts rows, whatever their values
+            accumulator.add(True if column is None else row.get(column))
+
+    def results(self) -> List[Dict[str, Any]]:
+        """Get one result row per group, in the order groups were first seen."""
+        results = self._results
+        if not results and not self.groups:
+            results = {(): self._accumulators()}
+        return [
+            aggregate_result(self.groups, self.measures, key, [accumulator.result() for accumulator in accumulators])
+            for key, accumulators in results.items()
+        ]
+
+    def _accumulators(self) -> List[_Accumulator]:
+        return [_Accumulator(function) for _, function, _ in self.measures]
+
+
+def aggregate_result(
+    groups: Sequence[Tuple[str, str]],
+    measures: Sequence[Measure],
+    key: Sequence[Any],
+    values: Sequence[Any]
+) -> Dict[str, Any]:
+    """Build one result row from a group's key values and measure values."""
+    row = {field: value for (field, _), value in zip(groups, key)}
+    row.update((name, value) for (name, _, _), value in zip(measures, values))
+    return row
@@ -5,19 +5,25 @@ Provides the base class for all Norma ORM models with validation,
 serialization, and metadata introspection capabilities.
 """
 
-import re
+import sys
 import uuid
-from dataclasses import dataclass, fields, asdict, is_dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type, TypeVar, get_origin, get_args, Union
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar
 from uuid import uuid4
 
-from ..exceptions import ValidationError
+from ..exceptions import QueryError, ValidationError
 from .field import FieldConfig
+from .meta import get_model_meta, register_model
+from .relations import LazyRelation, get_relations
+from .validation import get_validator
 
 
 T = TypeVar('T', bound='BaseModel')
 
+# Snapshot placeholder for fields flagged with mark_dirty()
+_DIRTY = object()
+
 
 @dataclass
 class BaseModel:
@@ -39,8 +45,27 @@ class BaseModel:
             email: str = Field(unique=True)
             age: int = Field(default=0, min_value=0)
         ```
+    
+    BaseModel only declares internal __slots__, so subclasses declared with
+    ``@model(slots=True)`` (or ``@dataclass(slots=True)`` on Python 3.10+)
+    get compact instances without a per-instance __dict__.
     """
     
+    # Field values as of the last load or save, for dirty-field tracking,
+    # the fields a projected read did not load, loaded relationships and
+    # the read that lazy relationship loads go through
+    __slots__ = ('_norma_snapshot', '_norma_unloaded', '_norma_related', '_norma_lazy')
+    
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        register_model(cls)
+    
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names that are not fields or methods
+        if not name.startswith('_') and name in get_relations(self.__class__):
+            return LazyRelation(self, name)
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+    
     def __post_init__(self):
         """Automatically validate the model after initialization."""
         self.validate()
@@ -49,93 +74,21 @@ class BaseModel:
         """
         Validate all fields according to their configuration.
         
+        Uses the validator compiled once per model class, so repeated
+        validation does not re-read field metadata.
+        
         Raises:
             ValidationError: If any field fails validation
         """
-        for field_info in fields(self):
-            field_name = field_info.name
-            field_value = getattr(self, field_name)
-            
-            # Get Norma field configuration from metadata
-            norma_config = field_info.metadata.get("norma_config")
-            if not norma_config:
-                continue
-                
-            self._validate_field(field_name, field_value, norma_config, field_info.type)
-    
-    def _validate_field(self, field_name: str, value: Any, config: FieldConfig, field_type: Type) -> None:
-        """Validate a single field against its configuration."""
-        
-        # Check nullability
-        if value is None:
-            if not config.nullable and not config.primary_key:
-                raise ValidationError(f"Field '{field_name}' cannot be None", field_name, value)
-            return  # If None is allowed, skip other validations
-        
-        # Type validation
-        self._validate_field_type(field_name, value, field_type)
-        
-        # String validations
-        if isinstance(value, str):
-            if config.min_length is not None and len(value) < config.min_length:
-                raise ValidationError(
-                    f"Field '{field_name}' must be at least {config.min_length} characters",
-                    field_name, value
-                )
-            
-            if config.max_length is not None and len(value) > config.max_length:
-                raise ValidationError(
-                    f"Field '{field_name}' must be at most {config.max_length} characters", 
-                    field_name, value
-                )
-            
-            if config.regex_pattern and not re.match(config.regex_pattern, value):
-                raise ValidationError(
-                    f"Field '{field_name}' does not match required pattern",
-                    field_name, value
-                )
-        
-        # Numeric validations
-        if isinstance(value, (int, float)):
-            if config.min_value is not None and value < config.min_value:
-                raise ValidationError(
-                    f"Field '{field_name}' must be at least {config.min_value}",
-                    field_name, value
-                )
-            
-            if config.max_value is not None and value > config.max_value:
-                raise ValidationError(
-                    f"Field '{field_name}' must be at most {config.max_value}",
-                    field_name, value
-                )
-    
-    def _validate_field_type(self, field_name: str, value: Any, expected_type: Type) -> None:
-        """Validate field type more safely."""
-        if value is None:
-            return
-        
-        origin = get_origin(expected_type)
-        
-        # Handle Union types (like Optional)
-        if origin is Union:
-            args = get_args(expected_type)
-            # For Optional types, check against the non-None type
-            non_none_types = [arg for arg in args if arg is not type(None)]
-            if non_none_types and not any(isinstance(value, t) for t in non_none_types if isinstance(t, type)):
-                raise ValidationError(
-                    f"Field '{field_name}' should be one of {non_none_types}, got {type(value)}",
-                    field_name, value
-                )
-        elif isinstance(expected_type, type) and not isinstance(value, expected_type):
-            raise ValidationError(
-                f"Field '{field_name}' should be {expected_type.__name__}, got {type(value).__name__}",
-                field_name, value
-            )
+        get_validator(self.__class__)(self)
     
     def to_dict(self, exclude_none: bool = True, exclude_private: bool = True) -> Dict[str, Any]:
         """
         Convert the model to a dictionary.
         
+        Values are not copied; nested dataclass fields are converted to
+        dictionaries.
+        
         Args:
             exclude_none: Whether to exclude None values
             exclude_private: Whether to exclude fields starting with underscore
@@ -143,15 +96,28 @@ class BaseModel:
         Returns:
             Dictionary representation of the model
         """
-        result = asdict(self)
-        
-        if exclude_none:
-            result = {k: v for k, v in result.items() if v is not None}
+        return get_model_meta(self.__class__).serializer.to_dict(self, exclude_none, exclude_private)
+    
+    def to_db_dict(self, exclude_none: bool = False) -> Dict[str, Any]:
+        """
+        Convert the model to a dictionary keyed by database column name.
         
-        if exclude_private:
-            result = {k: v for k, v in result.items() if not k.startswith('_')}
+        Args:
+            exclude_none: Whether to exclude None values
+            
+        Returns:
+            Dictionary mapping column names (db_column_name or field name) to values
+        """
+        return get_model_meta(self.__class__).serializer.to_db_dict(self, exclude_none)
+    
+    def to_row(self) -> Tuple[Any, ...]:
+        """
+        Get the model's values as a tuple in column order.
         
-        return result
+        The order matches ModelMeta.column_names, which makes the result
+        suitable for bulk writes.
+        """
+        return get_model_meta(self.__class__).serializer.to_row(self)
     
     @classmethod
     def from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
@@ -165,11 +131,41 @@ class BaseModel:
             New model instance
         """
         # Filter data to only include fields that exist in the model
-        model_fields = {f.name for f in fields(cls)}
+        model_fields = get_model_meta(cls).field_set
         filtered_data = {k: v for k, v in data.items() if k in model_fields}
         
         return cls(**filtered_data)
     
+    @classmethod
+    def _hydrate(cls: Type[T], row: Mapping[str, Any]) -> T:
+        """
+        Build an instance from a trusted database row without validation.
+        
+        Keys are database column names. Missing columns take the field's
+        default, or None. Use from_dict() for untrusted input.
+        
+        Args:
+            row: Mapping of column names to values
+            
+        Returns:
+            New model instance
+        """
+        return get_model_meta(cls).mapping_hydrator(row)
+    
+    @classmethod
+    def _hydrate_row(cls: Type[T], row: Sequence[Any], columns: Sequence[str]) -> T:
+        """
+        Build an instance from a trusted positional row without validation.
+        
+        Args:
+            row: Row values (tuple, driver row or namedtuple)
+            columns: Database column names, in row order
+            
+        Returns:
+            New model instance
+        """
+        return get_model_meta(cls).row_hydrator(columns)(row)
+    
     def update(self, **kwargs) -> None:
         """
         Update model fields with validation.
@@ -178,7 +174,7 @@ class BaseModel:
             **kwargs: Field values to update
         """
         # Get valid field names
-        valid_fields = {f.name for f in fields(self)}
+        valid_fields = get_model_meta(self.__class__).field_set
         
         for key, value in kwargs.items():
             if key not in valid_fields:
@@ -188,52 +184,142 @@ class BaseModel:
         # Re-validate after updates
         self.validate()
     
+    def get_dirty_fields(self) -> List[str]:
+        """
+        Get the names of fields changed since the model was loaded or saved.
+        
+        Changes are detected by comparing current values against a snapshot
+        taken at load/save time, so in-place mutation of a mutable value
+        (e.g. appending to a list) is not detected; reassign the field or
+        call mark_dirty() instead. Models that were never loaded or saved
+        report every field as dirty.
+        """
+        meta = get_model_meta(self.__class__)
+        snapshot = getattr(self, '_norma_snapshot', None)
+        if snapshot is None:
+            return list(meta.field_names)
+        
+        current = meta.serializer.values(self)
+        return [
+            name for name, old, new in zip(meta.field_names, snapshot, current)
+            if old is not new and (old is _DIRTY or old != new)
+        ]
+    
+    def get_unloaded_fields(self) -> List[str]:
+        """
+        Get the names of fields a projected read (fields=/exclude=) did not load.
+        
+        Unloaded fields hold their default (or None) and are not written by
+        update(), even with full=True, unless they are assigned.
+        """
+        return sorted(getattr(self, '_norma_unloaded', ()))
+    
+    def get_related(self, name: str) -> Any:
+        """
+        Get a relationship loaded with include=[name].
+        
+        To-one relationships are a model or None, to-many ones a list.
+        
+        Raises:
+            QueryError: If the relationship was not loaded
+        """
+        related = getattr(self, '_norma_related', None) or {}
+        if name not in related:
+            raise QueryError(
+                f"Relationship '{name}' of {self.__class__.__name__} is not loaded; pass include=['{name}']"
+            )
+        return related[name]
+    
+    def has_related(self, name: str) -> bool:
+        """Check whether a relationship is loaded, so get_related(name) will not raise."""
+        return name in (getattr(self, '_norma_related', None) or ())
+    
+    async def fetch_related(self, name: str) -> Any:
+        """
+        Get a relationship, loading it on first access.
+        
+        Records read through a client load it, by default, for every record
+        of the same read at once; later calls return the cached value.
+        `await model.<name>` is equivalent.
+        
+        Raises:
+            QueryError: For unknown relationships, or if the model was not
+                read through a client
+        """
+        if not self.has_related(name):
+            scope = self._lazy_scope(name)
+            await scope.adapter.load_related(scope.model_class, scope.pending(self, name), [name])
+        return self.get_related(name)
+    
+    def fetch_related_sync(self, name: str) -> Any:
+        """Synchronous version of fetch_related."""
+        if not self.has_related(name):
+            scope = self._lazy_scope(name)
+            scope.adapter.load_related_sync(scope.model_class, scope.pending(self, name), [name])
+        return self.get_related(name)
+    
+    def _lazy_scope(self, name: str) -> Any:
+        scope = getattr(self, '_norma_lazy', None)
+        if scope is None:
+            raise QueryError(
+                f"Cannot load relationship '{name}' of {self.__class__.__name__}: "
+                f"it was not read through a client; pass include=['{name}']"
+            )
+        return scope
+    
+    def _set_related(self, name: str, value: Any) -> None:
+        """Store a loaded relationship (see get_related)."""
+        related = getattr(self, '_norma_related', None)
+        if related is None:
+            related = {}
+            object.__setattr__(self, '_norma_related', related)
+        related[name] = value
+    
+    def mark_dirty(self, *field_names: str) -> None:
+        """Flag fields as changed, e.g. after mutating a list in place."""
+        meta = get_model_meta(self.__class__)
+        snapshot = getattr(self, '_norma_snapshot', None)
+        if snapshot is None:
+            return  # Everything is already dirty
+        
+        for name in field_names:
+            if name not in meta.field_set:
+                raise ValidationError(f"Unknown field '{name}' for {self.__class__.__name__}")
+        snapshot = tuple(
+            _DIRTY if name in field_names else value
+            for name, value in zip(meta.field_names, snapshot)
+        )
+        object.__setattr__(self, '_norma_snapshot', snapshot)
+    
+    def mark_clean(self) -> None:
+        """Record the current field values as persisted."""
+        snapshot = get_model_meta(self.__class__).serializer.values(self)
+        object.__setattr__(self, '_norma_snapshot', snapshot)
+    
     @classmethod
     def get_field_config(cls, field_name: str) -> Optional[FieldConfig]:
         """Get the Norma configuration for a specific field."""
-        for field_info in fields(cls):
-            if field_info.name == field_name:
-                return field_info.metadata.get("norma_config")
-        return None
+        return get_model_meta(cls).field_configs.get(field_name)
     
     @classmethod
     def get_primary_key_field(cls) -> Optional[str]:
         """Get the name of the primary key field."""
-        for field_info in fields(cls):
-            config = field_info.metadata.get("norma_config")
-            if config and config.primary_key:
-                return field_info.name
-        return None
+        return get_model_meta(cls).primary_key
     
     @classmethod
     def get_unique_fields(cls) -> List[str]:
         """Get names of all unique fields."""
-        unique_fields = []
-        for field_info in fields(cls):
-            config = field_info.metadata.get("norma_config")
-            if config and (config.unique or config.primary_key):
-                unique_fields.append(field_info.name)
-        return unique_fields
+        return list(get_model_meta(cls).unique_fields)
     
     @classmethod
     def get_indexed_fields(cls) -> List[str]:
         """Get names of all indexed fields."""
-        indexed_fields = []
-        for field_info in fields(cls):
-            config = field_info.metadata.get("norma_config")
-            if config and (config.index or config.unique or config.primary_key):
-                indexed_fields.append(field_info.name)
-        return indexed_fields
+        return list(get_model_meta(cls).indexed_fields)
     
     @classmethod
     def get_relationship_fields(cls) -> Dict[str, FieldConfig]:
         """Get all fields that define relationships."""
-        relationships = {}
-        for field_info in fields(cls):
-            config = field_info.metadata.get("norma_config")
-            if config and config.relationship:
-                relationships[field_info.name] = config
-        return relationships
+        return dict(get_model_meta(cls).relationships)
     
     @staticmethod
     def generate_id() -> str:
@@ -242,7 +328,7 @@ class BaseModel:
     
     def get_primary_key_value(self) -> Any:
         """Get the value of the primary key field."""
-        pk_field = self.get_primary_key_field()
+        pk_field = get_model_meta(self.__class__).primary_key
         if pk_field:
             return getattr(self, pk_field)
         return None
@@ -263,6 +349,61 @@ class BaseModel:
         return self.__str__()
 
 
+def model(cls: Optional[type] = None, *, slots: bool = False, **dataclass_options: Any) -> Any:
+    """
+    Declare a Norma model class.
+    
+    Equivalent to ``@dataclass``, with optional ``__slots__`` support on
+    every supported Python version. Slotted models have no per-instance
+    __dict__, which substantially reduces memory for large numbers of
+    cached instances.
+    
+    Args:
+        cls: The class to decorate (when used without arguments)
+        slots: Whether to generate __slots__ for the model's fields
+        **dataclass_options: Additional options passed to dataclass()
+    
+    Example:
+        ```python
+        @model(slots=True)
+        class Point(BaseModel):
+            id: str = Field(primary_key=True, default_factory=lambda: uuid4().hex)
+            x: float = Field(default=0.0)
+            y: float = Field(default=0.0)
+        ```
+    """
+    def wrap(cls: type) -> type:
+        if not slots:
+            return dataclass(cls, **dataclass_options)
+        if sys.version_info >= (3, 10):
+            return dataclass(cls, slots=True, **dataclass_options)
+        return _add_slots(dataclass(cls, **dataclass_options))
+    
+    if cls is None:
+        return wrap
+    return wrap(cls)
+
+
+def _add_slots(cls: type) -> type:
+    """Recreate a dataclass with __slots__ for its fields (Python < 3.10)."""
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    
+    # Only add slots for fields not already slotted by a base class
+    inherited = {name for base in cls.__mro__[1:] for name in getattr(base, '__slots__', ())}
+    cls_dict['__slots__'] = tuple(name for name in field_names if name not in inherited)
+    
+    for name in field_names:
+        # Defaults live in __init__; class attributes would clash with slots
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
 def model_metadata(model_class: Type[BaseModel]) -> Dict[str, Any]:
     """
     Extract metadata from a Norma model class.
@@ -276,23 +417,26 @@ def model_metadata(model_class: Type[BaseModel]) -> Dict[str, Any]:
     if not is_dataclass(model_class) or not issubclass(model_class, BaseModel):
         raise ValueError("Class must be a Norma BaseModel dataclass")
     
+    meta = get_model_meta(model_class)
+    
     metadata = {
-        "name": model_class.__name__,
+        "name": meta.name,
+        "table_name": meta.table_name,
         "fields": {},
-        "primary_key": model_class.get_primary_key_field(),
-        "unique_fields": model_class.get_unique_fields(),
-        "indexed_fields": model_class.get_indexed_fields(),
-        "relationships": model_class.get_relationship_fields(),
+        "primary_key": meta.primary_key,
+        "unique_fields": list(meta.unique_fields),
+        "indexed_fields": list(meta.indexed_fields),
+        "relationships": dict(meta.relationships),
+        "columns": dict(meta.field_to_column),
     }
     
-    for field_info in fields(model_class):
+    for field_info in meta.fields:
         field_name = field_info.name
-        config = field_info.metadata.get("norma_config")
         
         metadata["fields"][field_name] = {
             "type": field_info.type,
-            "config": config,
+            "config": meta.field_configs[field_name],
             "has_default": field_info.default != field_info.default_factory,
         }
     
-    return metadata 
\ No newline at end of file
+    return metadata
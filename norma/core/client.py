@@ -5,10 +5,15 @@ Main client class providing unified interface for database operations
 across different adapters and models.
 """
 
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, List, Mapping, Optional, Sequence, Type, TypeVar, Union
 from dataclasses import is_dataclass
 
+from .aggregates import Aggregate
 from .base_model import BaseModel
+from .loader import LoaderStats, ModelLoader
+from .pagination import Page
+from .relations import bind_lazy, eager_includes
 from ..adapters.base_adapter import BaseAdapter
 from ..adapters.sql_adapter import SQLAdapter
 from ..adapters.mongo_adapter import MongoAdapter
@@ -38,51 +43,221 @@ class ModelClient:
         self.model_class = model_class
         self.adapter = adapter
         
+        # Set by NormaClient.enable_loader() to coalesce find_by_id calls
+        self.loader: Optional[ModelLoader[T]] = None
+        
         # Validate model class
         if not is_dataclass(model_class) or not issubclass(model_class, BaseModel):
             raise ConfigurationError(f"{model_class.__name__} must be a Norma BaseModel dataclass")
     
+    def _include(self, include: Optional[Sequence[str]]) -> Optional[Sequence[str]]:
+        """Add the relationships declared with lazy_load=False to include."""
+        eager = eager_includes(self.model_class)
+        if not eager:
+            return include
+        if isinstance(include, str):
+            include = [include]
+        return [*eager, *(include or ())]
+    
+    def _bind(self, found: Any) -> Any:
+        """Let the records of one read load their relationships lazily, together."""
+        models = found.values() if isinstance(found, dict) else found
+        bind_lazy(self.adapter, self.model_class, [model for model in models if model is not None])
+        return found
+    
     async def insert(self, model: T) -> T:
         """Insert a new record."""
         return await self.adapter.insert(model)
     
-    async def update(self, model: T) -> T:
-        """Update an existing record."""
-        return await self.adapter.update(model)
+    async def insert_many(self, models: Sequence[T], batch_size: int = 1000) -> List[T]:
+        """Insert many records using the backend's bulk write."""
+        return await self.adapter.insert_many(models, batch_size)
+    
+    async def upsert(self, model: T, conflict_fields: Optional[Sequence[str]] = None) -> T:
+        """Insert a record or update the one it conflicts with (default: by primary key)."""
+        return await self.adapter.upsert(model, conflict_fields)
+    
+    async def upsert_many(
+        self,
+        models: Sequence[T],
+        batch_size: int = 1000,
+        conflict_fields: Optional[Sequence[str]] = None
+    ) -> List[T]:
+        """Upsert many records using the backend's bulk write."""
+        return await self.adapter.upsert_many(models, batch_size, conflict_fields)
     
-    async def find_by_id(self, id_value: Any) -> Optional[T]:
-        """Find a record by its primary key."""
-        return await self.adapter.find_by_id(self.model_class, id_value)
+    async def update(self, model: T, full: bool = False) -> T:
+        """Update an existing record (changed fields only unless full=True)."""
+        return await self.adapter.update(model, full)
+    
+    async def find_by_id(
+        self,
+        id_value: Any,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
+    ) -> Optional[T]:
+        """
+        Find a record by its primary key.
+        
+        Pass `fields` (or `exclude`) to load only some columns; the result
+        is a partial model whose other fields hold their defaults.
+        
+        With the client's loader enabled, whole-record reads outside a
+        transaction are batched with concurrent calls for other IDs.
+        `include` loads relationships as in find_many().
+        """
+        include = self._include(include)
+        if self.loader is not None and fields is None and exclude is None and not self.adapter.in_transaction():
+            model = await self.loader.load(id_value)
+        else:
+            model = await self.adapter.find_by_id(self.model_class, id_value, fields, exclude)
+        if model is not None:
+            if include:
+                await self.adapter.load_related(self.model_class, [model], include)
+            bind_lazy(self.adapter, self.model_class, [model])
+        return model
+    
+    async def find_by_ids(
+        self,
+        ids: Sequence[Any],
+        preserve_order: bool = True,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        batch_size: int = 1000
+    ) -> Union[List[Optional[T]], Dict[Any, T]]:
+        """
+        Find many records by primary key in batched round trips.
+        
+        Returns a list aligned with `ids` (None for misses), or with
+        preserve_order=False a dict of the found records keyed by ID.
+        """
+        found = await self.adapter.find_by_ids(
+            self.model_class, ids, preserve_order, fields, exclude, batch_size
+        )
+        return self._bind(found)
     
     async def find_many(
         self,
         filters: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        order_by: Optional[List[str]] = None
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
     ) -> List[T]:
-        """Find multiple records matching criteria."""
-        return await self.adapter.find_many(
-            self.model_class, filters, limit, offset, order_by
-        )
+        """
+        Find multiple records matching criteria.
+        
+        `fields`/`exclude` load only some columns. `include` names
+        relationships to load with the records, e.g. ["author", "tags"] or
+        "posts.comments" for nested ones; read them with get_related().
+        Relationships that are not included load when awaited (post.author).
+        """
+        return self._bind(await self.adapter.find_many(
+            self.model_class, filters, limit, offset, order_by, fields, exclude, self._include(include)
+        ))
     
     async def find_first(
         self,
         filters: Optional[Dict[str, Any]] = None,
-        order_by: Optional[List[str]] = None
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
     ) -> Optional[T]:
         """Find the first record matching criteria."""
-        results = await self.find_many(filters, limit=1, order_by=order_by)
+        results = await self.find_many(
+            filters, limit=1, order_by=order_by, fields=fields, exclude=exclude, include=include
+        )
         return results[0] if results else None
     
+    def stream(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[T]:
+        """
+        Iterate over matching records, batch_size at a time.
+        
+        Use with `async for`; unlike find_many() only one batch is held in
+        memory.
+        """
+        return self.adapter.stream(self.model_class, filters, batch_size, order_by, fields, exclude)
+    
+    async def find_page(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Page[T]:
+        """
+        Find one page of records; pass the returned next_cursor as `after`
+        to fetch the following page.
+        """
+        page = await self.adapter.find_page(self.model_class, filters, order_by, after, limit, fields, exclude)
+        self._bind(page.items)
+        return page
+    
+    async def iter_pages(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[Page[T]]:
+        """
+        Iterate over pages of records with `async for`, starting after the
+        cursor `after`; each page's next_cursor resumes the scan later.
+        """
+        async for page in self.adapter.iter_pages(self.model_class, filters, order_by, after, limit, fields, exclude):
+            self._bind(page.items)
+            yield page
+    
     async def delete_by_id(self, id_value: Any) -> bool:
         """Delete a record by its primary key."""
         return await self.adapter.delete_by_id(self.model_class, id_value)
     
+    async def update_many(self, filters: Dict[str, Any], changes: Dict[str, Any]) -> int:
+        """Apply changes to all matching records; returns the number updated."""
+        return await self.adapter.update_many(self.model_class, filters, changes)
+    
+    async def delete_many(self, filters: Dict[str, Any]) -> int:
+        """Delete all matching records; returns the number deleted."""
+        return await self.adapter.delete_many(self.model_class, filters)
+    
+    async def delete_many_by_ids(self, ids: Sequence[Any], batch_size: int = 1000) -> int:
+        """Delete many records by primary key in batched round trips; returns the number deleted."""
+        return await self.adapter.delete_many_by_ids(self.model_class, ids, batch_size)
+    
     async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Count records matching criteria."""
         return await self.adapter.count(self.model_class, filters)
     
+    async def aggregate(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        group_by: Optional[Sequence[str]] = None,
+        metrics: Optional[Mapping[str, Aggregate]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Compute metrics such as {"total": Sum("amount")} over matching
+        records, per group_by group, in the database.
+        
+        Returns plain dictionaries (not models) keyed by the group_by fields
+        and metric names.
+        """
+        return await self.adapter.aggregate(self.model_class, filters, group_by, metrics)
+    
     async def exists(self, filters: Dict[str, Any]) -> bool:
         """Check if any records exist matching criteria."""
         return await self.adapter.exists(self.model_class, filters)
@@ -101,42 +276,153 @@ class ModelClient:
         """Synchronous version of insert."""
         return self.adapter.insert_sync(model)
     
-    def update_sync(self, model: T) -> T:
+    def insert_many_sync(self, models: Sequence[T], batch_size: int = 1000) -> List[T]:
+        """Synchronous version of insert_many."""
+        return self.adapter.insert_many_sync(models, batch_size)
+    
+    def upsert_sync(self, model: T, conflict_fields: Optional[Sequence[str]] = None) -> T:
+        """Synchronous version of upsert."""
+        return self.adapter.upsert_sync(model, conflict_fields)
+    
+    def upsert_many_sync(
+        self,
+        models: Sequence[T],
+        batch_size: int = 1000,
+        conflict_fields: Optional[Sequence[str]] = None
+    ) -> List[T]:
+        """Synchronous version of upsert_many."""
+        return self.adapter.upsert_many_sync(models, batch_size, conflict_fields)
+    
+    def update_sync(self, model: T, full: bool = False) -> T:
         """Synchronous version of update."""
-        return self.adapter.update_sync(model)
+        return self.adapter.update_sync(model, full)
     
-    def find_by_id_sync(self, id_value: Any) -> Optional[T]:
+    def find_by_id_sync(
+        self,
+        id_value: Any,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
+    ) -> Optional[T]:
         """Synchronous version of find_by_id."""
-        return self.adapter.find_by_id_sync(self.model_class, id_value)
+        include = self._include(include)
+        model = self.adapter.find_by_id_sync(self.model_class, id_value, fields, exclude)
+        if model is not None:
+            if include:
+                self.adapter.load_related_sync(self.model_class, [model], include)
+            bind_lazy(self.adapter, self.model_class, [model])
+        return model
+    
+    def find_by_ids_sync(
+        self,
+        ids: Sequence[Any],
+        preserve_order: bool = True,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        batch_size: int = 1000
+    ) -> Union[List[Optional[T]], Dict[Any, T]]:
+        """Synchronous version of find_by_ids."""
+        found = self.adapter.find_by_ids_sync(
+            self.model_class, ids, preserve_order, fields, exclude, batch_size
+        )
+        return self._bind(found)
     
     def find_many_sync(
         self,
         filters: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        order_by: Optional[List[str]] = None
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
     ) -> List[T]:
         """Synchronous version of find_many."""
-        return self.adapter.find_many_sync(
-            self.model_class, filters, limit, offset, order_by
-        )
+        return self._bind(self.adapter.find_many_sync(
+            self.model_class, filters, limit, offset, order_by, fields, exclude, self._include(include)
+        ))
     
     def find_first_sync(
         self,
         filters: Optional[Dict[str, Any]] = None,
-        order_by: Optional[List[str]] = None
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
     ) -> Optional[T]:
         """Synchronous version of find_first."""
-        results = self.find_many_sync(filters, limit=1, order_by=order_by)
+        results = self.find_many_sync(
+            filters, limit=1, order_by=order_by, fields=fields, exclude=exclude, include=include
+        )
         return results[0] if results else None
     
+    def stream_sync(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Iterator[T]:
+        """Synchronous version of stream."""
+        return self.adapter.stream_sync(self.model_class, filters, batch_size, order_by, fields, exclude)
+    
+    def find_page_sync(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Page[T]:
+        """Synchronous version of find_page."""
+        page = self.adapter.find_page_sync(self.model_class, filters, order_by, after, limit, fields, exclude)
+        self._bind(page.items)
+        return page
+    
+    def iter_pages_sync(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Iterator[Page[T]]:
+        """Synchronous version of iter_pages."""
+        for page in self.adapter.iter_pages_sync(self.model_class, filters, order_by, after, limit, fields, exclude):
+            self._bind(page.items)
+            yield page
+    
     def delete_by_id_sync(self, id_value: Any) -> bool:
         """Synchronous version of delete_by_id."""
         return self.adapter.delete_by_id_sync(self.model_class, id_value)
     
+    def update_many_sync(self, filters: Dict[str, Any], changes: Dict[str, Any]) -> int:
+        """Synchronous version of update_many."""
+        return self.adapter.update_many_sync(self.model_class, filters, changes)
+    
+    def delete_many_sync(self, filters: Dict[str, Any]) -> int:
+        """Synchronous version of delete_many."""
+        return self.adapter.delete_many_sync(self.model_class, filters)
+    
+    def delete_many_by_ids_sync(self, ids: Sequence[Any], batch_size: int = 1000) -> int:
+        """Synchronous version of delete_many_by_ids."""
+        return self.adapter.delete_many_by_ids_sync(self.model_class, ids, batch_size)
+    
     def count_sync(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Synchronous version of count."""
         return self.adapter.count_sync(self.model_class, filters)
+    
+    def aggregate_sync(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        group_by: Optional[Sequence[str]] = None,
+        metrics: Optional[Mapping[str, Aggregate]] = None
+    ) -> List[Dict[str, Any]]:
+        """Synchronous version of aggregate."""
+        return self.adapter.aggregate_sync(self.model_class, filters, group_by, metrics)
 
 
 class NormaClient:
@@ -176,6 +462,9 @@ class NormaClient:
         
         # Model clients cache
         self._model_clients: Dict[Type[BaseModel], ModelClient] = {}
+        
+        # find_by_id coalescing options, set by enable_loader()
+        self._loader_options: Optional[Dict[str, Any]] = None
     
     def _create_adapter(self) -> BaseAdapter:
         """Create the appropriate adapter based on configuration."""
@@ -200,6 +489,25 @@ class NormaClient:
         """Disconnect from the database."""
         await self.adapter.disconnect()
     
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator["NormaClient"]:
+        """
+        Run the operations inside the block as one unit of work.
+        
+        Every operation in the block, through this client or its model
+        clients, joins one transaction that commits once on exit and rolls
+        back if the block raises:
+        
+            async with client.transaction() as tx:
+                await tx.insert(order)
+                await tx.get_model_client(User).update(user)
+        
+        SQL shares one session (a single COMMIT), MongoDB one client session
+        (replica sets only) and Cassandra sends the writes as one batch.
+        """
+        async with self.adapter.transaction():
+            yield self
+    
     def get_model_client(self, model_class: Type[T]) -> ModelClient:
         """
         Get a model client for the specified model class.
@@ -211,9 +519,42 @@ class NormaClient:
             ModelClient instance for the specified model
         """
         if model_class not in self._model_clients:
-            self._model_clients[model_class] = ModelClient(model_class, self.adapter)
+            client = ModelClient(model_class, self.adapter)
+            if self._loader_options is not None:
+                client.loader = ModelLoader(self.adapter, model_class, **self._loader_options)
+            self._model_clients[model_class] = client
         return self._model_clients[model_class]
     
+    def enable_loader(self, window: float = 0.0, max_batch_size: int = 1000) -> None:
+        """
+        Coalesce concurrent find_by_id calls into batched find_by_ids reads.
+        
+        Calls for the same model made within one event loop tick, or within
+        `window` seconds of the first one, are answered by one multi-get;
+        concurrent calls for the same ID share a result.
+        
+        Args:
+            window: Seconds to wait for more calls (0 for the current tick)
+            max_batch_size: Maximum number of distinct IDs per batch
+        """
+        self._loader_options = {"window": window, "max_batch_size": max_batch_size}
+        for model_class, client in self._model_clients.items():
+            client.loader = ModelLoader(self.adapter, model_class, window, max_batch_size)
+    
+    def disable_loader(self) -> None:
+        """Send every find_by_id call straight to the database again."""
+        self._loader_options = None
+        for client in self._model_clients.values():
+            client.loader = None
+    
+    def loader_stats(self) -> Dict[Type[BaseModel], LoaderStats]:
+        """Get the batch size and latency stats of each model's loader."""
+        return {
+            model_class: client.loader.stats
+            for model_class, client in self._model_clients.items()
+            if client.loader is not None
+        }
+    
     def __getattr__(self, name: str) -> ModelClient:
         """
         Dynamic attribute access for model clients.
@@ -242,15 +583,59 @@ class NormaClient:
         client = self.get_model_client(model.__class__)
         return await client.insert(model)
     
-    async def update(self, model: T) -> T:
-        """Update a model instance."""
+    async def insert_many(self, models: Sequence[T], batch_size: int = 1000) -> List[T]:
+        """Insert many instances of one model class in bulk."""
+        if not models:
+            return []
+        client = self.get_model_client(models[0].__class__)
+        return await client.insert_many(models, batch_size)
+    
+    async def upsert(self, model: T, conflict_fields: Optional[Sequence[str]] = None) -> T:
+        """Insert a model instance or update the record it conflicts with."""
         client = self.get_model_client(model.__class__)
-        return await client.update(model)
+        return await client.upsert(model, conflict_fields)
     
-    async def find_by_id(self, model_class: Type[T], id_value: Any) -> Optional[T]:
+    async def upsert_many(
+        self,
+        models: Sequence[T],
+        batch_size: int = 1000,
+        conflict_fields: Optional[Sequence[str]] = None
+    ) -> List[T]:
+        """Upsert many instances of one model class in bulk."""
+        if not models:
+            return []
+        client = self.get_model_client(models[0].__class__)
+        return await client.upsert_many(models, batch_size, conflict_fields)
+    
+    async def update(self, model: T, full: bool = False) -> T:
+        """Update a model instance (changed fields only unless full=True)."""
+        client = self.get_model_client(model.__class__)
+        return await client.update(model, full)
+    
+    async def find_by_id(
+        self,
+        model_class: Type[T],
+        id_value: Any,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
+    ) -> Optional[T]:
         """Find a record by ID."""
         client = self.get_model_client(model_class)
-        return await client.find_by_id(id_value)
+        return await client.find_by_id(id_value, fields, exclude, include)
+    
+    async def find_by_ids(
+        self,
+        model_class: Type[T],
+        ids: Sequence[Any],
+        preserve_order: bool = True,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        batch_size: int = 1000
+    ) -> Union[List[Optional[T]], Dict[Any, T]]:
+        """Find many records by ID in batched round trips."""
+        client = self.get_model_client(model_class)
+        return await client.find_by_ids(ids, preserve_order, fields, exclude, batch_size)
     
     async def find_many(
         self,
@@ -258,22 +643,92 @@ class NormaClient:
         filters: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        order_by: Optional[List[str]] = None
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
     ) -> List[T]:
         """Find multiple records."""
         client = self.get_model_client(model_class)
-        return await client.find_many(filters, limit, offset, order_by)
+        return await client.find_many(filters, limit, offset, order_by, fields, exclude, include)
+    
+    def stream(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[T]:
+        """Iterate over matching records, batch_size at a time."""
+        client = self.get_model_client(model_class)
+        return client.stream(filters, batch_size, order_by, fields, exclude)
+    
+    async def find_page(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Page[T]:
+        """Find one page of records using keyset pagination."""
+        client = self.get_model_client(model_class)
+        return await client.find_page(filters, order_by, after, limit, fields, exclude)
+    
+    def iter_pages(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[Page[T]]:
+        """Iterate over pages of records with `async for`."""
+        client = self.get_model_client(model_class)
+        return client.iter_pages(filters, order_by, after, limit, fields, exclude)
     
     async def delete_by_id(self, model_class: Type[T], id_value: Any) -> bool:
         """Delete a record by ID."""
         client = self.get_model_client(model_class)
         return await client.delete_by_id(id_value)
     
+    async def update_many(self, model_class: Type[T], filters: Dict[str, Any], changes: Dict[str, Any]) -> int:
+        """Update all matching records in one set-based write."""
+        client = self.get_model_client(model_class)
+        return await client.update_many(filters, changes)
+    
+    async def delete_many(self, model_class: Type[T], filters: Dict[str, Any]) -> int:
+        """Delete all matching records in one set-based write."""
+        client = self.get_model_client(model_class)
+        return await client.delete_many(filters)
+    
+    async def delete_many_by_ids(self, model_class: Type[T], ids: Sequence[Any], batch_size: int = 1000) -> int:
+        """Delete many records of one model class by primary key."""
+        client = self.get_model_client(model_class)
+        return await client.delete_many_by_ids(ids, batch_size)
+    
     async def count(self, model_class: Type[T], filters: Optional[Dict[str, Any]] = None) -> int:
         """Count records."""
         client = self.get_model_client(model_class)
         return await client.count(filters)
     
+    async def aggregate(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        group_by: Optional[Sequence[str]] = None,
+        metrics: Optional[Mapping[str, Aggregate]] = None
+    ) -> List[Dict[str, Any]]:
+        """Compute metrics per group; returns plain dictionaries."""
+        client = self.get_model_client(model_class)
+        return await client.aggregate(filters, group_by, metrics)
+    
     # Synchronous versions
     
     def connect_sync(self) -> None:
@@ -284,20 +739,70 @@ class NormaClient:
             import asyncio
             asyncio.run(self.connect())
     
+    @contextmanager
+    def transaction_sync(self) -> Iterator["NormaClient"]:
+        """Synchronous version of transaction, joined by the *_sync operations."""
+        with self.adapter.transaction_sync():
+            yield self
+    
     def insert_sync(self, model: T) -> T:
         """Synchronous version of insert."""
         client = self.get_model_client(model.__class__)
         return client.insert_sync(model)
     
-    def update_sync(self, model: T) -> T:
+    def insert_many_sync(self, models: Sequence[T], batch_size: int = 1000) -> List[T]:
+        """Synchronous version of insert_many."""
+        if not models:
+            return []
+        client = self.get_model_client(models[0].__class__)
+        return client.insert_many_sync(models, batch_size)
+    
+    def upsert_sync(self, model: T, conflict_fields: Optional[Sequence[str]] = None) -> T:
+        """Synchronous version of upsert."""
+        client = self.get_model_client(model.__class__)
+        return client.upsert_sync(model, conflict_fields)
+    
+    def upsert_many_sync(
+        self,
+        models: Sequence[T],
+        batch_size: int = 1000,
+        conflict_fields: Optional[Sequence[str]] = None
+    ) -> List[T]:
+        """Synchronous version of upsert_many."""
+        if not models:
+            return []
+        client = self.get_model_client(models[0].__class__)
+        return client.upsert_many_sync(models, batch_size, conflict_fields)
+    
+    def update_sync(self, model: T, full: bool = False) -> T:
         """Synchronous version of update."""
         client = self.get_model_client(model.__class__)
-        return client.update_sync(model)
+        return client.update_sync(model, full)
     
-    def find_by_id_sync(self, model_class: Type[T], id_value: Any) -> Optional[T]:
+    def find_by_id_sync(
+        self,
+        model_class: Type[T],
+        id_value: Any,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
+    ) -> Optional[T]:
         """Synchronous version of find_by_id."""
         client = self.get_model_client(model_class)
-        return client.find_by_id_sync(id_value)
+        return client.find_by_id_sync(id_value, fields, exclude, include)
+    
+    def find_by_ids_sync(
+        self,
+        model_class: Type[T],
+        ids: Sequence[Any],
+        preserve_order: bool = True,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        batch_size: int = 1000
+    ) -> Union[List[Optional[T]], Dict[Any, T]]:
+        """Synchronous version of find_by_ids."""
+        client = self.get_model_client(model_class)
+        return client.find_by_ids_sync(ids, preserve_order, fields, exclude, batch_size)
     
     def find_many_sync(
         self,
@@ -305,22 +810,92 @@ class NormaClient:
         filters: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        order_by: Optional[List[str]] = None
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        include: Optional[Sequence[str]] = None
     ) -> List[T]:
         """Synchronous version of find_many."""
         client = self.get_model_client(model_class)
-        return client.find_many_sync(filters, limit, offset, order_by)
+        return client.find_many_sync(filters, limit, offset, order_by, fields, exclude, include)
+    
+    def stream_sync(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Iterator[T]:
+        """Synchronous version of stream."""
+        client = self.get_model_client(model_class)
+        return client.stream_sync(filters, batch_size, order_by, fields, exclude)
+    
+    def find_page_sync(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Page[T]:
+        """Synchronous version of find_page."""
+        client = self.get_model_client(model_class)
+        return client.find_page_sync(filters, order_by, after, limit, fields, exclude)
+    
+    def iter_pages_sync(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ) -> Iterator[Page[T]]:
+        """Synchronous version of iter_pages."""
+        client = self.get_model_client(model_class)
+        return client.iter_pages_sync(filters, order_by, after, limit, fields, exclude)
     
     def delete_by_id_sync(self, model_class: Type[T], id_value: Any) -> bool:
         """Synchronous version of delete_by_id."""
         client = self.get_model_client(model_class)
         return client.delete_by_id_sync(id_value)
     
+    def update_many_sync(self, model_class: Type[T], filters: Dict[str, Any], changes: Dict[str, Any]) -> int:
+        """Synchronous version of update_many."""
+        client = self.get_model_client(model_class)
+        return client.update_many_sync(filters, changes)
+    
+    def delete_many_sync(self, model_class: Type[T], filters: Dict[str, Any]) -> int:
+        """Synchronous version of delete_many."""
+        client = self.get_model_client(model_class)
+        return client.delete_many_sync(filters)
+    
+    def delete_many_by_ids_sync(self, model_class: Type[T], ids: Sequence[Any], batch_size: int = 1000) -> int:
+        """Synchronous version of delete_many_by_ids."""
+        client = self.get_model_client(model_class)
+        return client.delete_many_by_ids_sync(ids, batch_size)
+    
     def count_sync(self, model_class: Type[T], filters: Optional[Dict[str, Any]] = None) -> int:
         """Synchronous version of count."""
         client = self.get_model_client(model_class)
         return client.count_sync(filters)
     
+    def aggregate_sync(
+        self,
+        model_class: Type[T],
+        filters: Optional[Dict[str, Any]] = None,
+        group_by: Optional[Sequence[str]] = None,
+        metrics: Optional[Mapping[str, Aggregate]] = None
+    ) -> List[Dict[str, Any]]:
+        """Synchronous version of aggregate."""
+        client = self.get_model_client(model_class)
+        return client.aggregate_sync(filters, group_by, metrics)
+    
     # Context manager support
     
     async def __aenter__(self):
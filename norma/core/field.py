@@ -157,7 +157,8 @@ def Field(
 
 
 def OneToOne(target_model: str, foreign_key: Optional[str] = None, 
-             back_ref: Optional[str] = None, cascade_delete: bool = False) -> Relationship:
+             back_ref: Optional[str] = None, cascade_delete: bool = False,
+             lazy_load: bool = True) -> Relationship:
     """Create a one-to-one relationship."""
     return Relationship(
         target_model=target_model,
@@ -165,11 +166,13 @@ def OneToOne(target_model: str, foreign_key: Optional[str] = None,
         foreign_key=foreign_key,
         back_ref=back_ref,
         cascade_delete=cascade_delete,
+        lazy_load=lazy_load,
     )
 
 
 def OneToMany(target_model: str, foreign_key: Optional[str] = None,
-              back_ref: Optional[str] = None, cascade_delete: bool = False) -> Relationship:
+              back_ref: Optional[str] = None, cascade_delete: bool = False,
+              lazy_load: bool = True) -> Relationship:
     """Create a one-to-many relationship."""
     return Relationship(
         target_model=target_model,
@@ -177,11 +180,12 @@ def OneToMany(target_model: str, foreign_key: Optional[str] = None,
         foreign_key=foreign_key,
         back_ref=back_ref,
         cascade_delete=cascade_delete,
+        lazy_load=lazy_load,
     )
 
 
 def ManyToOne(target_model: str, foreign_key: Optional[str] = None,
-              back_ref: Optional[str] = None) -> Relationship:
+              back_ref: Optional[str] = None, lazy_load: bool = True) -> Relationship:
     """Create a many-to-one relationship."""
     return Relationship(
         target_model=target_model,
@@ -189,14 +193,16 @@ def ManyToOne(target_model: str, foreign_key: Optional[str] = None,
         foreign_key=foreign_key,
         back_ref=back_ref,
         cascade_delete=False,  # Typically don't cascade delete on many-to-one
+        lazy_load=lazy_load,
     )
 
 
-def ManyToMany(target_model: str, back_ref: Optional[str] = None) -> Relationship:
+def ManyToMany(target_model: str, back_ref: Optional[str] = None, lazy_load: bool = True) -> Relationship:
     """Create a many-to-many relationship."""
     return Relationship(
         target_model=target_model,
         relation_type=RelationType.MANY_TO_MANY,
         back_ref=back_ref,
         cascade_delete=False,  # Typically don't cascade delete on many-to-many
+        lazy_load=lazy_load,
     ) 
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""
+Norma Filters
+
+Parses the filter dictionaries accepted by find_many, count, exists and
+the bulk writes into a small, hashable AST. Each adapter compiles the AST
+for its backend and caches the result by shape, since filters that differ
+only in their values produce the same tree.
+
+Supported syntax:
+    {"name": "Ann"}                      equality
+    {"age": {"$gte": 18, "$lt": 65}}     $eq $ne $gt $gte $lt $lte
+    {"role": {"$in": ["a", "b"]}}        $in $nin
+    {"email": {"$like": "%@example.com"}}  SQL LIKE pattern (% and _)
+    {"deleted_at": {"$exists": False}}   presence (IS [NOT] NULL in SQL)
+    {"$or": [{...}, {...}]}              $and $or, nested freely
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, List, Mapping, Optional, Tuple, Union
+
+from ..exceptions import QueryError
+
+
+# Comparison operators that bind one value
+COMPARISON_OPERATORS = frozenset({
+    "$eq", "$ne", "$gt", "$gte", "$lt", "$lte", "$in", "$nin", "$like",
+})
+
+# Operators that bind a list of values
+LIST_OPERATORS = frozenset({"$in", "$nin"})
+
+# Operators that bind no value. Equality with None is parsed into
+# $is_null / $is_not_null so every backend can render it natively.
+VALUELESS_OPERATORS = frozenset({"$is_null", "$is_not_null", "$exists", "$not_exists"})
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """
+    A single condition on one column.
+
+    `param` is the position of the condition's value in the values tuple
+    returned by parse_filters(), or None for valueless operators. Operators
+    outside the documented set are kept so backends that understand them
+    (e.g. MongoDB's $regex) can pass them through.
+    """
+
+    column: Optional[str]
+    op: str
+    param: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class And:
+    """All child conditions must hold (an empty And matches everything)."""
+
+    children: Tuple["Node", ...]
+
+
+@dataclass(frozen=True)
+class Or:
+    """At least one child condition must hold."""
+
+    children: Tuple["Node", ...]
+
+
+Node = Union[Comparison, And, Or]
+
+
+def parse_filters(
+    filters: Optional[Mapping[str, Any]],
+    field_to_column: Optional[Mapping[str, str]] = None
+) -> Tuple[And, Tuple[Any, ...]]:
+    """
+    Parse a filter dictionary into an AST and its bound values.
+
+    Args:
+        filters: Filter dictionary (None or empty matches everything)
+        field_to_column: Mapping of field names to database column names;
+            unknown names are kept as-is
+
+    Returns:
+        The root And node and the values referenced by its comparisons
+
+    Raises:
+        QueryError: If $and/$or is not given a list of filter dictionaries
+    """
+    values: List[Any] = []
+    root = _parse(filters or {}, field_to_column or {}, values)
+    return root, tuple(values)
+
+
+def _parse(filters: Mapping[str, Any], field_to_column: Mapping[str, str], values: List[Any]) -> And:
+    """Parse one level of a filter dictionary, appending bound values."""
+    if not isinstance(filters, Mapping):
+        raise QueryError(f"Filters must be dictionaries, got {type(filters).__name__}")
+
+    children: List[Node] = []
+    for key, value in filters.items():
+        if key in ("$and", "$or"):
+            if not isinstance(value, (list, tuple)):
+                raise QueryError(f"{key} expects a list of filter dictionaries")
+            branches = tuple(_parse(branch, field_to_column, values) for branch in value)
+            children.append(And(branches) if key == "$and" else Or(branches))
+        elif key.startswith("$"):
+            # Backend-specific top-level operator (e.g. MongoDB's $text)
+            children.append(_comparison(None, key, value, values))
+        elif isinstance(value, dict):
+            # Handle operators like {"$gte": 18}
+            column = field_to_column.get(key, key)
+            for op, op_value in value.items():
+                children.append(_comparison(column, op, op_value, values))
+        else:
+            children.append(_comparison(field_to_column.get(key, key), "$eq", value, values))
+    return And(tuple(children))
+
+
+def _comparison(column: Optional[str], op: str, value: Any, values: List[Any]) -> Comparison:
+    """Build a comparison, folding None and $exists values into the operator."""
+    if op in ("$eq", "$ne") and value is None:
+        return Comparison(column, "$is_null" if op == "$eq" else "$is_not_null")
+    if op == "$exists":
+        return Comparison(column, "$exists" if value else "$not_exists")
+
+    if op in LIST_OPERATORS:
+        value = list(value)
+    values.append(value)
+    return Comparison(column, op, len(values) - 1)
+
+
+def like_to_regex(pattern: str) -> str:
+    """Translate a SQL LIKE pattern (% and _ wildcards) into an anchored regex."""
+    translated = "".join(
+        ".*" if char == "%" else "." if char == "_" else re.escape(char)
+        for char in pattern
+    )
+    return f"^{translated}$"
+
+
+def comparisons(node: Node) -> List[Comparison]:
+    """Get every comparison in a tree, depth first."""
+    if isinstance(node, Comparison):
+        return [node]
+    result: List[Comparison] = []
+    for child in node.children:
+        result.extend(comparisons(child))
+    return result
+
+
+def is_conjunction(node: Node) -> bool:
+    """Check whether a tree only combines its comparisons with AND."""
+    if isinstance(node, Or):
+        return False
+    if isinstance(node, And):
+        return all(is_conjunction(child) for child in node.children)
+    return True
@@ -0,0 +1,115 @@
+"""
+Norma Hydration
+
+Generates functions that build model instances directly from trusted
+database rows, bypassing __init__, from_dict filtering and validation.
+"""
+
+from dataclasses import MISSING
+from typing import Any, Callable, Dict, List, Sequence
+
+
+Hydrator = Callable[[Any], Any]
+
+
+def _field_defaults(meta: Any, namespace: Dict[str, Any]) -> Dict[str, str]:
+    """Map each field name to a source expression producing its default."""
+    defaults = {}
+    for index, field_info in enumerate(meta.fields):
+        if field_info.default_factory is not MISSING:
+            namespace[f"_factory_{index}"] = field_info.default_factory
+            defaults[field_info.name] = f"_factory_{index}()"
+        elif field_info.default is not MISSING:
+            namespace[f"_default_{index}"] = field_info.default
+            defaults[field_info.name] = f"_default_{index}"
+        else:
+            defaults[field_info.name] = "None"
+    return defaults
+
+
+def _assignment(meta: Any, field_name: str, expression: str) -> str:
+    """Source line assigning an attribute on the new instance."""
+    params = getattr(meta.model_class, "__dataclass_params__", None)
+    if params is not None and params.frozen:
+        return f"_setattr(self, {field_name!r}, {expression})"
+    return f"self.{field_name} = {expression}"
+
+
+def _compile(meta: Any, name: str, argument: str, body: List[str], namespace: Dict[str, Any]) -> Hydrator:
+    """Compile a hydrator function from generated source lines."""
+    namespace.update({
+        "_cls": meta.model_class,
+        "_new": object.__new__,
+        "_setattr": object.__setattr__,
+        "_MISSING": MISSING,
+    })
+    # Snapshot the loaded values for dirty-field tracking
+    snapshot = "(" + "".join(f"self.{field_name}, " for field_name in meta.field_names) + ")"
+    body = body + [_assignment(meta, "_norma_snapshot", snapshot)]
+
+    lines = [f"def {name}({argument}):", "    self = _new(_cls)"]
+    lines += ["    " + line for line in body]
+    lines.append("    return self")
+
+    exec("\n".join(lines) + "\n", namespace)
+    hydrator = namespace[name]
+    hydrator.__qualname__ = f"{meta.model_class.__qualname__}.{name}"
+    return hydrator
+
+
+def compile_row_hydrator(meta: Any, columns: Sequence[str]) -> Hydrator:
+    """
+    Build a hydrator for positional rows with the given column layout.
+
+    Args:
+        meta: ModelMeta of the model to build
+        columns: Database column names, in row order
+
+    Returns:
+        Function taking a row (tuple, driver row or namedtuple) and
+        returning a model instance
+    """
+    namespace: Dict[str, Any] = {}
+    defaults = _field_defaults(meta, namespace)
+    positions = {column: index for index, column in enumerate(columns)}
+
+    body = []
+    unloaded = []
+    for field_name in meta.field_names:
+        position = positions.get(meta.field_to_column[field_name])
+        if position is None:
+            unloaded.append(field_name)
+        expression = f"row[{position}]" if position is not None else defaults[field_name]
+        body.append(_assignment(meta, field_name, expression))
+    if unloaded:
+        # Partial row from a projected read
+        namespace["_unloaded"] = frozenset(unloaded)
+        body.append("_setattr(self, '_norma_unloaded', _unloaded)")
+
+    return _compile(meta, "__norma_hydrate_row__", "row", body, namespace)
+
+
+def compile_mapping_hydrator(meta: Any) -> Hydrator:
+    """
+    Build a hydrator for rows given as mappings keyed by column name.
+
+    Missing columns fall back to the field's default, or None.
+
+    Args:
+        meta: ModelMeta of the model to build
+
+    Returns:
+        Function taking a mapping and returning a model instance
+    """
+    namespace: Dict[str, Any] = {}
+    defaults = _field_defaults(meta, namespace)
+
+    body = ["get = row.get"]
+    for field_name in meta.field_names:
+        column = meta.field_to_column[field_name]
+        body += [
+            f"value = get({column!r}, _MISSING)",
+            _assignment(meta, field_name, f"{defaults[field_name]} if value is _MISSING else value"),
+        ]
+
+    return _compile(meta, "__norma_hydrate__", "row", body, namespace)
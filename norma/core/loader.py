@@ -0,0 +1,144 @@
+"""
+Norma Loader
+
+Request coalescing for find_by_id, in the style of DataLoader. Calls made
+for the same model within one event loop tick (or a short time window)
+are collected and answered by a single find_by_ids() multi-get, so N
+concurrent GraphQL resolvers cost one query instead of N:
+
+    client.enable_loader(window=0.002)
+    users = client.get_model_client(User)
+    a, b = await asyncio.gather(users.find_by_id(1), users.find_by_id(2))
+
+Loaders only coalesce calls that are in flight together; nothing is cached
+once a batch has been answered.
+"""
+
+import asyncio
+import contextvars
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Generic, Optional, Set, Tuple, Type, TypeVar
+
+from .base_model import BaseModel
+
+
+T = TypeVar("T", bound=BaseModel)
+
+
+@dataclass
+class LoaderStats:
+    """Batch counters of one loader, plus the (size, seconds) of recent batches."""
+
+    batches: int = 0
+    requested: int = 0
+    loaded: int = 0
+    largest_batch: int = 0
+    total_latency: float = 0.0
+    recent: Deque[Tuple[int, float]] = field(default_factory=lambda: deque(maxlen=100))
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Distinct IDs per batch."""
+        return self.loaded / self.batches if self.batches else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Seconds per batch query."""
+        return self.total_latency / self.batches if self.batches else 0.0
+
+    @property
+    def deduplicated(self) -> int:
+        """Calls answered by a batch another caller already asked for."""
+        return self.requested - self.loaded
+
+    def record(self, size: int, latency: float) -> None:
+        self.batches += 1
+        self.loaded += size
+        self.largest_batch = max(self.largest_batch, size)
+        self.total_latency += latency
+        self.recent.append((size, latency))
+
+
+class ModelLoader(Generic[T]):
+    """
+    Coalesces concurrent find_by_id calls for one model class.
+
+    Pending IDs are dispatched once the current tick ends (window=0) or
+    `window` seconds after the first call, or as soon as `max_batch_size`
+    distinct IDs are waiting.
+    """
+
+    def __init__(self, adapter: Any, model_class: Type[T], window: float = 0.0, max_batch_size: int = 1000):
+        """
+        Args:
+            adapter: The adapter answering the batches with find_by_ids()
+            model_class: The model class to load
+            window: Seconds to wait for more calls (0 for the current tick)
+            max_batch_size: Maximum number of distinct IDs per batch
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.adapter = adapter
+        self.model_class = model_class
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.stats = LoaderStats()
+        self._pending: Dict[Any, "asyncio.Future[Optional[T]]"] = {}
+        self._handle: Optional[asyncio.Handle] = None
+        # The loop only keeps weak references to tasks, so in-flight batches are held here
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def load(self, id_value: Any) -> Optional[T]:
+        """Find a record by primary key as part of the next batch."""
+        self.stats.requested += 1
+        future = self._pending.get(id_value)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[id_value] = loop.create_future()
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._handle is None:
+                if self.window > 0:
+                    self._handle = loop.call_later(self.window, self._dispatch)
+                else:
+                    self._handle = loop.call_soon(self._dispatch)
+        # Shielded, so one cancelled caller does not cancel the others' result
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        """Start fetching every pending ID in one batch."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, {}
+        if pending:
+            # A fresh context, so no caller's transaction or other state leaks into the batch
+            task = contextvars.Context().run(asyncio.get_running_loop().create_task, self._fetch(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, pending: Dict[Any, "asyncio.Future[Optional[T]]"]) -> None:
+        start = time.perf_counter()
+        try:
+            found = await self.adapter.find_by_ids(
+                self.model_class, list(pending), preserve_order=False, batch_size=self.max_batch_size
+            )
+        except BaseException as e:
+            # Also settle the callers when the batch is cancelled, then let the cancellation through
+            for future in pending.values():
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        finally:
+            self.stats.record(len(pending), time.perf_counter() - start)
+        for id_value, future in pending.items():
+            if not future.done():
+                future.set_result(found.get(id_value))
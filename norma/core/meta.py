@@ -0,0 +1,215 @@
+"""
+Norma Model Metadata
+
+Provides an immutable, per-class description of a Norma model (fields,
+primary key, column mapping, indexes, relationships, table name and table
+options) that is computed once and shared by the model, the adapters and
+the schema tooling.
+"""
+
+from dataclasses import Field as DataclassField, dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Sequence, Tuple, Type
+
+from ..exceptions import ConfigurationError
+from .field import FieldConfig
+from .hydration import Hydrator, compile_mapping_hydrator, compile_row_hydrator
+from .serialization import ModelSerializer
+
+
+_META_ATTR = "__norma_meta__"
+
+# Optional class attribute declaring database-specific table options
+_TABLE_OPTIONS_ATTR = "__table_options__"
+
+# Central registry of model metadata, keyed by "module.qualname".
+# Redefining a class under the same name replaces its entry.
+_registry: Dict[str, "ModelMeta"] = {}
+
+# Every model class defined so far, keyed the same way, so relationship
+# targets given by name can be resolved before their metadata is built.
+# The version changes on every registration.
+_model_classes: Dict[str, Type[Any]] = {}
+_model_classes_version = 0
+
+
+@dataclass(frozen=True)
+class ModelMeta:
+    """Immutable metadata describing a Norma model class."""
+
+    model_class: Type[Any]
+    name: str
+    table_name: str
+
+    # Fields, in declaration order
+    fields: Tuple[DataclassField, ...]
+    field_names: Tuple[str, ...]
+    field_set: FrozenSet[str]
+    field_types: Mapping[str, Any]
+    field_configs: Mapping[str, Optional[FieldConfig]]
+
+    # Keys and constraints
+    primary_key: Optional[str]
+    primary_key_fields: Tuple[str, ...]
+    unique_fields: Tuple[str, ...]
+    indexed_fields: Tuple[str, ...]
+    relationships: Mapping[str, FieldConfig]
+
+    # Database-specific table options (the model's __table_options__)
+    table_options: Mapping[str, Any]
+
+    # Database column mapping
+    column_names: Tuple[str, ...]
+    field_to_column: Mapping[str, str]
+    column_to_field: Mapping[str, str]
+
+    # Generated serializer (to_dict, to_db_dict, column-ordered tuples)
+    serializer: ModelSerializer
+
+    # Compiled hydrators, keyed by row column layout (None for mappings)
+    _hydrators: Dict[Optional[Tuple[str, ...]], Hydrator] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    @property
+    def primary_key_column(self) -> Optional[str]:
+        """Database column name of the primary key field."""
+        if self.primary_key is None:
+            return None
+        return self.field_to_column[self.primary_key]
+
+    def row_hydrator(self, columns: Sequence[str]) -> Hydrator:
+        """Get the hydrator for positional rows with the given columns."""
+        key = tuple(columns)
+        hydrator = self._hydrators.get(key)
+        if hydrator is None:
+            hydrator = self._hydrators[key] = compile_row_hydrator(self, key)
+        return hydrator
+
+    @property
+    def mapping_hydrator(self) -> Hydrator:
+        """Get the hydrator for rows given as column-keyed mappings."""
+        hydrator = self._hydrators.get(None)
+        if hydrator is None:
+            hydrator = self._hydrators[None] = compile_mapping_hydrator(self)
+        return hydrator
+
+
+def build_model_meta(model_class: Type[Any]) -> ModelMeta:
+    """
+    Compute the metadata for a model class.
+
+    Prefer get_model_meta(), which caches the result.
+    """
+    model_fields = tuple(fields(model_class))
+
+    field_types: Dict[str, Any] = {}
+    field_configs: Dict[str, Optional[FieldConfig]] = {}
+    field_to_column: Dict[str, str] = {}
+    primary_key_fields = []
+    unique_fields = []
+    indexed_fields = []
+    relationships: Dict[str, FieldConfig] = {}
+
+    for field_info in model_fields:
+        field_name = field_info.name
+        config = field_info.metadata.get("norma_config")
+
+        field_types[field_name] = field_info.type
+        field_configs[field_name] = config
+        field_to_column[field_name] = (config.db_column_name if config else None) or field_name
+
+        if not config:
+            continue
+
+        if config.primary_key:
+            primary_key_fields.append(field_name)
+        if config.unique or config.primary_key:
+            unique_fields.append(field_name)
+        if config.index or config.unique or config.primary_key:
+            indexed_fields.append(field_name)
+        if config.relationship:
+            relationships[field_name] = config
+
+    field_names = tuple(field_types)
+    column_names = tuple(field_to_column[name] for name in field_names)
+
+    return ModelMeta(
+        model_class=model_class,
+        name=model_class.__name__,
+        table_name=model_class.__name__.lower(),
+        fields=model_fields,
+        field_names=field_names,
+        field_set=frozenset(field_names),
+        field_types=MappingProxyType(field_types),
+        field_configs=MappingProxyType(field_configs),
+        primary_key=primary_key_fields[0] if primary_key_fields else None,
+        primary_key_fields=tuple(primary_key_fields),
+        unique_fields=tuple(unique_fields),
+        indexed_fields=tuple(indexed_fields),
+        relationships=MappingProxyType(relationships),
+        table_options=MappingProxyType(dict(getattr(model_class, _TABLE_OPTIONS_ATTR, None) or {})),
+        column_names=column_names,
+        field_to_column=MappingProxyType(field_to_column),
+        column_to_field=MappingProxyType({v: k for k, v in field_to_column.items()}),
+        serializer=ModelSerializer(field_names, column_names, field_types),
+    )
+
+
+def get_model_meta(model_class: Type[Any]) -> ModelMeta:
+    """
+    Get the cached metadata for a model class.
+
+    Metadata is computed on first access and stored on the class and in
+    the central registry. A redefined class is a new class object, so it
+    gets fresh metadata and replaces the stale registry entry.
+
+    Args:
+        model_class: The Norma model class
+
+    Returns:
+        The model's ModelMeta
+    """
+    meta = model_class.__dict__.get(_META_ATTR)
+    if meta is None:
+        meta = build_model_meta(model_class)
+        setattr(model_class, _META_ATTR, meta)
+        _registry[f"{model_class.__module__}.{model_class.__qualname__}"] = meta
+    return meta
+
+
+def registered_models() -> Mapping[str, ModelMeta]:
+    """Get a read-only view of all model metadata computed so far."""
+    return MappingProxyType(_registry)
+
+
+def register_model(model_class: Type[Any]) -> None:
+    """Record a model class so relationships can refer to it by name."""
+    global _model_classes_version
+    _model_classes[f"{model_class.__module__}.{model_class.__qualname__}"] = model_class
+    _model_classes_version += 1
+
+
+def resolve_model(name: str) -> Type[Any]:
+    """
+    Find a model class by "module.QualName" or by its class name.
+
+    Args:
+        name: Relationship target_model, e.g. "User"
+
+    Raises:
+        ConfigurationError: If no model, or more than one, has that name
+    """
+    model_class = _model_classes.get(name)
+    if model_class is not None:
+        return model_class
+    matches = [cls for cls in _model_classes.values() if name in (cls.__name__, cls.__qualname__)]
+    if len(matches) != 1:
+        problem = "ambiguous" if matches else "not found"
+        raise ConfigurationError(f"Relationship target model '{name}' {problem}")
+    return matches[0]
+
+
+def registered_model_classes() -> Tuple[int, Mapping[str, Type[Any]]]:
+    """Get the registry version and a read-only view of all model classes."""
+    return _model_classes_version, MappingProxyType(_model_classes)
@@ -0,0 +1,167 @@
+"""
+Norma Pagination
+
+Keyset ("seek") pagination support shared by the adapters. A page is
+fetched with find_page() and the next page is requested by passing the
+returned cursor back as `after`. Cursors are opaque, URL-safe strings:
+SQL and MongoDB encode the sort key of the last row, Cassandra encodes
+the driver's paging state.
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from ..exceptions import QueryError
+
+
+T = TypeVar("T")
+
+# Sort key: (field name, descending) pairs ending with the primary key
+SortKey = Tuple[Tuple[str, bool], ...]
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of results and the cursor for the next one (None on the last page)."""
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def page_sort_key(order_by: Optional[Sequence[str]], pk_field: str) -> SortKey:
+    """
+    Build the sort key for a page from find_many-style order_by fields.
+
+    The primary key is appended (ascending) as a tie-breaker unless it is
+    already ordered on, so every row has a distinct position.
+    """
+    key = [(name[1:], True) if name.startswith("-") else (name, False) for name in order_by or ()]
+    if pk_field not in {name for name, _ in key}:
+        key.append((pk_field, False))
+    return tuple(key)
+
+
+def keyset_filter(sort_key: SortKey, values: Sequence[Any]) -> Dict[str, Any]:
+    """
+    Build the filter selecting rows strictly after `values` in sort order.
+
+    For a key (a, b, id) this is a > va OR (a = va AND b > vb) OR
+    (a = va AND b = vb AND id > vid), with < for descending columns.
+    Sort columns must be non-null (see encode_keyset_cursor()).
+    """
+    branches = []
+    for position, (name, descending) in enumerate(sort_key):
+        branch: Dict[str, Any] = {prior: values[i] for i, (prior, _) in enumerate(sort_key[:position])}
+        branch[name] = {"$lt" if descending else "$gt": values[position]}
+        branches.append(branch)
+    return {"$or": branches}
+
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    """Encode a cursor payload as an opaque URL-safe string."""
+    data = json.dumps(payload, default=_encode_value, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Raises:
+        QueryError: If the cursor is malformed
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(data, object_hook=_decode_value)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise QueryError(f"Invalid page cursor: {str(e)}")
+    if not isinstance(payload, dict):
+        raise QueryError("Invalid page cursor")
+    return payload
+
+
+def encode_keyset_cursor(sort_key: SortKey, item: Any) -> str:
+    """
+    Encode the sort key values of the last item on a page.
+
+    Raises:
+        QueryError: If a sort value is None, as no row sorts strictly after
+            NULL and backends disagree on where NULLs sort
+    """
+    values = [getattr(item, name) for name, _ in sort_key]
+    for (name, _), value in zip(sort_key, values):
+        if value is None:
+            raise QueryError(f"Cannot page past a row whose sort field '{name}' is None; order by non-null fields")
+    return encode_cursor({
+        "key": [[name, descending] for name, descending in sort_key],
+        "values": values,
+    })
+
+
+def decode_keyset_cursor(cursor: str, sort_key: SortKey) -> List[Any]:
+    """
+    Decode the sort key values from a keyset cursor.
+
+    Raises:
+        QueryError: If the cursor is malformed or was issued for a different order
+    """
+    payload = decode_cursor(cursor)
+    key = payload.get("key")
+    values = payload.get("values")
+    if key != [[name, descending] for name, descending in sort_key] or not isinstance(values, list):
+        raise QueryError("Page cursor does not match the requested order")
+    return values
+
+
+# JSON tags for values that are not JSON-native
+def _encode_value(value: Any) -> Dict[str, str]:
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, time):
+        return {"$time": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {"$uuid": str(value)}
+    if isinstance(value, Decimal):
+        return {"$decimal": str(value)}
+    if isinstance(value, bytes):
+        return {"$bytes": base64.b64encode(value).decode()}
+    # Anything else is compared by its string form
+    return {"$str": str(value)}
+
+
+_DECODERS = {
+    "$datetime": datetime.fromisoformat,
+    "$date": date.fromisoformat,
+    "$time": time.fromisoformat,
+    "$uuid": uuid.UUID,
+    "$decimal": Decimal,
+    "$bytes": base64.b64decode,
+    "$str": str,
+}
+
+
+def _decode_value(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        tag, value = next(iter(obj.items()))
+        decoder = _DECODERS.get(tag)
+        if decoder is not None:
+            return decoder(value)
+    return obj
@@ -0,0 +1,297 @@
+"""
+Norma Relations
+
+Turns the relationships declared with OneToOne, OneToMany, ManyToOne and
+ManyToMany into relations that find methods can load with include=[...].
+
+A relationship is declared on the field holding the key it joins on, and
+is named after that field without a trailing "_id":
+
+    @dataclass
+    class Post(BaseModel):
+        author_id: str = Field(relationship=ManyToOne("User", back_ref="posts"))
+        tag_ids: list = Field(default_factory=list, relationship=ManyToMany("Tag"))
+
+    # include=["author"] loads post.get_related("author") (a User or None)
+    # include=["tag_ids"] loads a list of Tags, in tag_ids order
+    # On User, include=["posts"] loads the list of the user's Posts
+
+- ManyToOne / OneToOne: the field holds the `foreign_key` field of the
+  target (its primary key by default).
+- OneToMany: targets whose `foreign_key` field equals this field's value
+  (typically this model's primary key).
+- ManyToMany: the field holds a list of target primary keys.
+- back_ref declares the inverse relation on the target model (not
+  supported for ManyToMany).
+
+Relations are loaded with one query per relation and nesting level
+("select-in"), so include=["posts.comments"] costs two extra queries.
+
+Relations that are not included load lazily when awaited:
+
+    posts = await client.find_many(Post, {"draft": False})
+    author = await posts[0].author   # or posts[0].fetch_related_sync("author")
+
+By default the first access loads the relation for every record of the
+same read in one query, so looping over the posts costs one extra query
+rather than one per post; pass prefetch_related=False to the client to
+load only the accessed record. Relationships declared with
+lazy_load=False are always included by the client's find methods.
+"""
+
+from dataclasses import dataclass, is_dataclass
+from typing import Any, Dict, Generator, List, Mapping, Optional, Sequence, Type
+
+from ..exceptions import ConfigurationError, QueryError
+from .field import RelationType
+from .meta import get_model_meta, registered_model_classes, resolve_model
+
+
+# Nested include paths: {"posts": {"comments": {}}}
+IncludeTree = Dict[str, "IncludeTree"]
+
+
+@dataclass(frozen=True)
+class Relation:
+    """A loadable relation of one model class."""
+
+    name: str
+    target: Type[Any]
+    # Field on the owning model, and the field on the target it matches
+    local_field: str
+    remote_field: str
+    many: bool
+    # The local field holds a list of remote keys (ManyToMany)
+    key_list: bool = False
+    # Loaded on access rather than with every read (Relationship.lazy_load)
+    lazy: bool = True
+
+
+# Resolved relations per model class, and the registry version they match
+_relations: Dict[Type[Any], Mapping[str, Relation]] = {}
+_relations_version = -1
+
+
+def relation_name(field_name: str) -> str:
+    """Name a field's relation: the field name without a trailing "_id"."""
+    if field_name.endswith("_id") and len(field_name) > 3:
+        return field_name[:-3]
+    return field_name
+
+
+def get_relations(model_class: Type[Any]) -> Mapping[str, Relation]:
+    """
+    Get the relations of a model: those declared on its fields and the
+    back_refs other models declare towards it.
+
+    Raises:
+        ConfigurationError: For unknown target models, a OneToMany without
+            foreign_key, or relations sharing a name
+    """
+    global _relations_version
+    version, model_classes = registered_model_classes()
+    if version != _relations_version:
+        # A model was defined since the last lookup; back_refs may have changed
+        _relations.clear()
+        _relations_version = version
+
+    relations = _relations.get(model_class)
+    if relations is None:
+        relations = {}
+        for relation in _declared_relations(model_class):
+            _add(relations, model_class, relation)
+        for source in set(model_classes.values()):
+            if not is_dataclass(source):
+                continue  # An intermediate base class, not a model
+            for inverse in _back_refs(source, model_class):
+                _add(relations, model_class, inverse)
+        _relations[model_class] = relations
+    return relations
+
+
+def get_relation(model_class: Type[Any], name: str) -> Relation:
+    """
+    Get one relation of a model by name.
+
+    Raises:
+        QueryError: If the model has no relation with that name
+    """
+    relation = get_relations(model_class).get(name)
+    if relation is None:
+        raise QueryError(f"Unknown relationship '{name}' for {model_class.__name__}")
+    return relation
+
+
+def parse_include(include: Sequence[str]) -> IncludeTree:
+    """Parse dotted include paths ("posts.comments") into a nested tree."""
+    if isinstance(include, str):
+        include = [include]
+    tree: IncludeTree = {}
+    for path in include:
+        node = tree
+        for name in path.split("."):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def relation_keys(relation: Relation, models: Sequence[Any]) -> List[Any]:
+    """Get the distinct, non-null keys the models reference through a relation."""
+    keys: Dict[Any, None] = {}
+    for model in models:
+        value = getattr(model, relation.local_field)
+        if relation.key_list:
+            keys.update(dict.fromkeys(key for key in value or () if key is not None))
+        elif value is not None:
+            keys[value] = None
+    return list(keys)
+
+
+def assign_related(relation: Relation, models: Sequence[Any], targets: Sequence[Any]) -> None:
+    """Store the loaded targets on each model, matched on the relation's keys."""
+    index: Dict[Any, List[Any]] = {}
+    for target in targets:
+        index.setdefault(getattr(target, relation.remote_field), []).append(target)
+
+    for model in models:
+        value = getattr(model, relation.local_field)
+        if relation.key_list:
+            related: Any = [target for key in value or () for target in index.get(key, ())]
+        elif relation.many:
+            related = list(index.get(value, ())) if value is not None else []
+        else:
+            matches = index.get(value) if value is not None else None
+            related = matches[0] if matches else None
+        model._set_related(relation.name, related)
+
+
+def eager_includes(model_class: Type[Any]) -> List[str]:
+    """Get the relations of a model declared with lazy_load=False."""
+    return [name for name, relation in get_relations(model_class).items() if not relation.lazy]
+
+
+class LazyScope:
+    """
+    The records of one read, which lazy relation loads are shared across.
+
+    With prefetch, the scope holds the records so the first access to a
+    relation can load it for all of them; without, it only holds the
+    adapter to load from.
+    """
+
+    __slots__ = ("adapter", "model_class", "models")
+
+    def __init__(self, adapter: Any, model_class: Type[Any], models: Optional[List[Any]]):
+        self.adapter = adapter
+        self.model_class = model_class
+        self.models = models
+
+    def pending(self, model: Any, name: str) -> List[Any]:
+        """Get the records a lazy load of `name` on `model` should fill in."""
+        if self.models is None:
+            return [model]
+        return [other for other in self.models if not other.has_related(name)]
+
+
+def bind_lazy(adapter: Any, model_class: Type[Any], models: Sequence[Any]) -> None:
+    """
+    Let the models of one read load their relations lazily from `adapter`.
+
+    The adapter's `prefetch_related` option (default True) decides whether
+    the models share their lazy loads.
+    """
+    if not models or not get_relations(model_class):
+        return
+    prefetch = adapter.config.get("prefetch_related", True)
+    scope = LazyScope(adapter, model_class, list(models) if prefetch and len(models) > 1 else None)
+    for model in models:
+        object.__setattr__(model, "_norma_lazy", scope)
+
+
+class LazyRelation:
+    """
+    A relation of one record that is loaded when awaited.
+
+    Returned by attribute access on the relation's name (post.author), so
+    reading records never queries for relations nobody uses.
+    """
+
+    __slots__ = ("model", "name")
+
+    def __init__(self, model: Any, name: str):
+        self.model = model
+        self.name = name
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the relation is already loaded, so awaiting it will not query."""
+        return self.model.has_related(self.name)
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        return self.model.fetch_related(self.name).__await__()
+
+    def load_sync(self) -> Any:
+        """Load the relation synchronously (see BaseModel.fetch_related_sync)."""
+        return self.model.fetch_related_sync(self.name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyRelation {self.model.__class__.__name__}.{self.name} ({state})>"
+
+
+def _declared_relations(model_class: Type[Any]) -> List[Relation]:
+    """Build the relations declared on a model's own fields."""
+    relations = []
+    for field_name, config in get_model_meta(model_class).relationships.items():
+        rel = config.relationship
+        target = resolve_model(rel.target_model)
+        if rel.relation_type is RelationType.ONE_TO_MANY:
+            if rel.foreign_key is None:
+                raise ConfigurationError(
+                    f"OneToMany relationship '{field_name}' of {model_class.__name__} needs a foreign_key"
+                )
+            relations.append(Relation(
+                relation_name(field_name), target, field_name, rel.foreign_key, True, lazy=rel.lazy_load
+            ))
+        elif rel.relation_type is RelationType.MANY_TO_MANY:
+            relations.append(Relation(
+                relation_name(field_name), target, field_name, _primary_key(target), True, True, rel.lazy_load
+            ))
+        else:
+            remote = rel.foreign_key or _primary_key(target)
+            relations.append(Relation(relation_name(field_name), target, field_name, remote, False, lazy=rel.lazy_load))
+    return relations
+
+
+def _back_refs(source: Type[Any], model_class: Type[Any]) -> List[Relation]:
+    """Get the inverse relations that source's back_ref declarations add to model_class."""
+    names = (f"{model_class.__module__}.{model_class.__qualname__}", model_class.__name__, model_class.__qualname__)
+    inverses = []
+    for field_name, config in get_model_meta(source).relationships.items():
+        rel = config.relationship
+        if not rel.back_ref or rel.relation_type is RelationType.MANY_TO_MANY or rel.target_model not in names:
+            continue
+        if resolve_model(rel.target_model) is not model_class:
+            continue
+        if rel.relation_type is RelationType.ONE_TO_MANY and rel.foreign_key is None:
+            raise ConfigurationError(
+                f"OneToMany relationship '{field_name}' of {source.__name__} needs a foreign_key"
+            )
+        # Many-to-one is inverted to one-to-many and vice versa
+        inverses.append(Relation(
+            rel.back_ref, source, rel.foreign_key or _primary_key(model_class), field_name,
+            many=rel.relation_type is RelationType.MANY_TO_ONE, lazy=rel.lazy_load,
+        ))
+    return inverses
+
+
+def _add(relations: Dict[str, Relation], model_class: Type[Any], relation: Relation) -> None:
+    if relation.name in relations and relations[relation.name] != relation:
+        raise ConfigurationError(f"Relationship name '{relation.name}' is used twice on {model_class.__name__}")
+    relations[relation.name] = relation
+
+
+def _primary_key(model_class: Type[Any]) -> str:
+    primary_key: Optional[str] = get_model_meta(model_class).primary_key
+    if primary_key is None:
+        raise ConfigurationError(f"Relationship target {model_class.__name__} has no primary key")
+    return primary_key
@@ -0,0 +1,102 @@
+"""
+Norma Serialization
+
+Per-class serializers that read all field values in a single C-level
+attribute fetch and build dictionaries or column-ordered tuples without
+deep-copying values.
+"""
+
+from dataclasses import asdict, is_dataclass
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union, get_args, get_origin
+
+
+def _is_nested_model(field_type: Any) -> bool:
+    """Check whether a field is declared as a (possibly Optional) dataclass."""
+    if get_origin(field_type) is Union:
+        return any(_is_nested_model(arg) for arg in get_args(field_type))
+    return isinstance(field_type, type) and is_dataclass(field_type)
+
+
+class ModelSerializer:
+    """
+    Serializer generated for one model class.
+
+    Values are returned by reference; nested dataclass fields are the only
+    values converted (to dicts), matching what the database drivers accept.
+    """
+
+    __slots__ = (
+        "field_names",
+        "column_names",
+        "_public",
+        "_all_public",
+        "_getter",
+        "_nested",
+    )
+
+    def __init__(self, field_names: Sequence[str], column_names: Sequence[str], field_types: Dict[str, Any]):
+        """
+        Build a serializer.
+
+        Args:
+            field_names: Field names in declaration order
+            column_names: Database column names, in the same order
+            field_types: Mapping of field names to declared types
+        """
+        self.field_names = tuple(field_names)
+        self.column_names = tuple(column_names)
+        self._public = tuple(not name.startswith('_') for name in self.field_names)
+        self._all_public = all(self._public)
+        self._nested = tuple(
+            index for index, name in enumerate(self.field_names) if _is_nested_model(field_types[name])
+        )
+
+        if len(self.field_names) == 1:
+            # attrgetter with a single name returns the bare value
+            getter = attrgetter(self.field_names[0])
+            self._getter = lambda model: (getter(model),)
+        elif self.field_names:
+            self._getter = attrgetter(*self.field_names)
+        else:
+            self._getter = lambda model: ()
+
+    def values(self, model: Any) -> Tuple[Any, ...]:
+        """Get the model's raw field values, in field order, without conversion."""
+        return self._getter(model)
+
+    def to_row(self, model: Any) -> Tuple[Any, ...]:
+        """Get the model's values as a tuple in column order."""
+        values = self._getter(model)
+        if self._nested:
+            values = list(values)
+            for index in self._nested:
+                if values[index] is not None and is_dataclass(values[index]):
+                    values[index] = asdict(values[index])
+            values = tuple(values)
+        return values
+
+    def to_rows(self, models: Iterable[Any]) -> List[Tuple[Any, ...]]:
+        """Get the values of many models as column-ordered tuples."""
+        return [self.to_row(model) for model in models]
+
+    def to_dict(self, model: Any, exclude_none: bool = True, exclude_private: bool = True) -> Dict[str, Any]:
+        """Get a dictionary keyed by field name."""
+        return self._build(self.field_names, model, exclude_none, exclude_private)
+
+    def to_db_dict(self, model: Any, exclude_none: bool = False) -> Dict[str, Any]:
+        """Get a dictionary keyed by database column name."""
+        return self._build(self.column_names, model, exclude_none, False)
+
+    def _build(self, keys: Tuple[str, ...], model: Any, exclude_none: bool, exclude_private: bool) -> Dict[str, Any]:
+        """Build a dictionary in a single pass over the values."""
+        values = self.to_row(model)
+        if exclude_private and not self._all_public:
+            return {
+                key: value
+                for key, value, public in zip(keys, values, self._public)
+                if public and (value is not None or not exclude_none)
+            }
+        if exclude_none:
+            return {key: value for key, value in zip(keys, values) if value is not None}
+        return dict(zip(keys, values))
@@ -0,0 +1,156 @@
+"""
+Norma Validation
+
+Compiles field configurations into a specialized validator function per
+model class, so per-instance validation does no metadata lookups, type
+introspection or regex compilation.
+"""
+
+import re
+from dataclasses import fields
+from typing import Any, Callable, Dict, List, Type, Union, get_args, get_origin
+
+from ..exceptions import ValidationError
+from .field import FieldConfig
+
+
+Validator = Callable[[Any], None]
+
+_VALIDATOR_ATTR = "__norma_validator__"
+
+
+def _compile_field(
+    index: int,
+    field_name: str,
+    config: FieldConfig,
+    field_type: Any,
+    namespace: Dict[str, Any],
+) -> List[str]:
+    """Generate the source lines validating a single field."""
+    none_branch: List[str] = []
+    value_branch: List[str] = []
+
+    # Nullability
+    if not config.nullable and not config.primary_key:
+        message = f"Field '{field_name}' cannot be None"
+        none_branch.append(f"raise ValidationError({message!r}, {field_name!r}, value)")
+
+    # Type check, resolved once instead of per instance
+    origin = get_origin(field_type)
+    if origin is Union:
+        non_none_types = [arg for arg in get_args(field_type) if arg is not type(None)]
+        if non_none_types:
+            namespace[f"_types_{index}"] = tuple(t for t in non_none_types if isinstance(t, type))
+            message = f"Field '{field_name}' should be one of {non_none_types}, got "
+            value_branch += [
+                f"if not isinstance(value, _types_{index}):",
+                f"    raise ValidationError({message!r} + str(type(value)), {field_name!r}, value)",
+            ]
+    elif isinstance(field_type, type):
+        namespace[f"_type_{index}"] = field_type
+        message = f"Field '{field_name}' should be {field_type.__name__}, got "
+        value_branch += [
+            f"if not isinstance(value, _type_{index}):",
+            f"    raise ValidationError({message!r} + type(value).__name__, {field_name!r}, value)",
+        ]
+
+    # String validations
+    string_checks: List[str] = []
+    if config.min_length is not None:
+        message = f"Field '{field_name}' must be at least {config.min_length} characters"
+        string_checks += [
+            f"if len(value) < {config.min_length!r}:",
+            f"    raise ValidationError({message!r}, {field_name!r}, value)",
+        ]
+    if config.max_length is not None:
+        message = f"Field '{field_name}' must be at most {config.max_length} characters"
+        string_checks += [
+            f"if len(value) > {config.max_length!r}:",
+            f"    raise ValidationError({message!r}, {field_name!r}, value)",
+        ]
+    if config.regex_pattern:
+        namespace[f"_pattern_{index}"] = re.compile(config.regex_pattern)
+        message = f"Field '{field_name}' does not match required pattern"
+        string_checks += [
+            f"if _pattern_{index}.match(value) is None:",
+            f"    raise ValidationError({message!r}, {field_name!r}, value)",
+        ]
+    if string_checks:
+        value_branch.append("if isinstance(value, str):")
+        value_branch += ["    " + line for line in string_checks]
+
+    # Numeric validations
+    numeric_checks: List[str] = []
+    if config.min_value is not None:
+        namespace[f"_min_{index}"] = config.min_value
+        message = f"Field '{field_name}' must be at least {config.min_value}"
+        numeric_checks += [
+            f"if value < _min_{index}:",
+            f"    raise ValidationError({message!r}, {field_name!r}, value)",
+        ]
+    if config.max_value is not None:
+        namespace[f"_max_{index}"] = config.max_value
+        message = f"Field '{field_name}' must be at most {config.max_value}"
+        numeric_checks += [
+            f"if value > _max_{index}:",
+            f"    raise ValidationError({message!r}, {field_name!r}, value)",
+        ]
+    if numeric_checks:
+        value_branch.append("if isinstance(value, (int, float)):")
+        value_branch += ["    " + line for line in numeric_checks]
+
+    if not none_branch and not value_branch:
+        return []
+
+    lines = [f"value = self.{field_name}", "if value is None:"]
+    lines += ["    " + line for line in none_branch or ["pass"]]
+    if value_branch:
+        lines.append("else:")
+        lines += ["    " + line for line in value_branch]
+    return lines
+
+
+def compile_validator(model_class: Type[Any]) -> Validator:
+    """
+    Build a validator function for a model class.
+
+    The generated function checks every configured field of an instance
+    and raises ValidationError on the first violation, with the same
+    messages as field-by-field validation.
+
+    Args:
+        model_class: The Norma model class to compile a validator for
+
+    Returns:
+        Function taking a model instance and returning None
+    """
+    namespace: Dict[str, Any] = {"ValidationError": ValidationError}
+    body: List[str] = []
+
+    for index, field_info in enumerate(fields(model_class)):
+        config = field_info.metadata.get("norma_config")
+        if not config:
+            continue
+        body += _compile_field(index, field_info.name, config, field_info.type, namespace)
+
+    source = "def __norma_validate__(self):\n"
+    source += "\n".join("    " + line for line in body or ["pass"]) + "\n"
+
+    exec(source, namespace)
+    validator = namespace["__norma_validate__"]
+    validator.__qualname__ = f"{model_class.__qualname__}.__norma_validate__"
+    return validator
+
+
+def get_validator(model_class: Type[Any]) -> Validator:
+    """
+    Get the compiled validator for a model class, compiling it on first use.
+
+    The validator is cached on the class itself, so redefining a model
+    class always produces a fresh validator.
+    """
+    validator = model_class.__dict__.get(_VALIDATOR_ATTR)
+    if validator is None:
+        validator = compile_validator(model_class)
+        setattr(model_class, _VALIDATOR_ATTR, validator)
+    return validator
@@ -4,7 +4,7 @@ Norma ORM Exception Classes
 Custom exceptions for better error handling and debugging.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 
 class NormaError(Exception):
@@ -74,6 +74,23 @@ class DuplicateError(NormaError):
         self.value = value
 
 
+class BulkWriteError(NormaError):
+    """
+    Raised when some records in a bulk write fail.
+    
+    Records outside the failed batches are still written. Each entry in
+    `errors` describes one failure with its "batch" number, the "index" of
+    the first affected record in the input (or of the record itself when
+    the backend reports per-record errors), whether it was a "duplicate",
+    and the driver's "message".
+    """
+    
+    def __init__(self, message: str, errors: List[Dict[str, Any]], inserted_count: int = 0):
+        super().__init__(message, {"errors": len(errors), "inserted_count": inserted_count})
+        self.errors = errors
+        self.inserted_count = inserted_count
+
+
 class ConfigurationError(NormaError):
     """Raised when Norma is misconfigured."""
     pass
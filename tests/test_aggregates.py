@@ -0,0 +1,57 @@
+"""
+Tests for aggregate metric validation and the Python aggregator.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from norma import Avg, Count, Max, Min, Sum
+from norma.core.aggregates import Aggregator, resolve_aggregate
+from norma.exceptions import QueryError
+
+
+COLUMNS = {"region": "region", "amount": "order_amount"}
+
+
+def test_resolve_maps_fields_to_columns():
+    groups, measures = resolve_aggregate(
+        ["region"], {"total": Sum("amount"), "orders": Count()}, COLUMNS, "Order"
+    )
+    assert groups == (("region", "region"),)
+    assert measures == (("total", "sum", "order_amount"), ("orders", "count", None))
+    assert resolve_aggregate(None, None, COLUMNS, "Order") == ((), (("count", "count", None),))
+
+
+@pytest.mark.parametrize("group_by, metrics", [
+    (["missing"], None),
+    (None, {"total": Sum("missing")}),
+    (None, {"total": Sum()}),
+    (None, {"total": "sum"}),
+    (["region"], {"region": Count()}),
+])
+def test_resolve_rejects_invalid_calls(group_by, metrics):
+    with pytest.raises(QueryError):
+        resolve_aggregate(group_by, metrics, COLUMNS, "Order")
+
+
+def test_aggregator_groups_rows_and_skips_nulls():
+    groups, measures = resolve_aggregate(["region"], {
+        "orders": Count(), "priced": Count("amount"), "total": Sum("amount"),
+        "mean": Avg("amount"), "low": Min("amount"), "high": Max("amount"),
+    }, COLUMNS, "Order")
+    aggregator = Aggregator(groups, measures)
+    for region, amount in [("eu", 10), ("us", None), ("eu", 30), ("us", None)]:
+        aggregator.add({"region": region, "order_amount": amount})
+    
+    assert aggregator.results() == [
+        {"region": "eu", "orders": 2, "priced": 2, "total": 40, "mean": 20, "low": 10, "high": 30},
+        {"region": "us", "orders": 2, "priced": 0, "total": None, "mean": None, "low": None, "high": None},
+    ]
+
+
+def test_aggregator_without_groups_returns_one_row():
+    groups, measures = resolve_aggregate(None, {"orders": Count(), "total": Sum("amount")}, COLUMNS, "Order")
+    assert Aggregator(groups, measures).results() == [{"orders": 0, "total": None}]
@@ -11,7 +11,9 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from norma import BaseModel, Field, NormaClient
+from norma import BaseModel, Field, NormaClient, model
+from norma.core.base_model import _add_slots
+from norma.schema import generate_schemas
 from norma.exceptions import ValidationError
 
 
@@ -131,6 +133,52 @@ def test_model_serialization():
     assert new_user.id == user.id
 
 
+def test_model_shallow_serialization():
+    """Test that to_dict does not copy values and to_row follows column order."""
+    
+    @dataclass
+    class Tagged(BaseModel):
+        tags: list = Field(default_factory=list)
+        _secret: Optional[str] = Field(default="hidden")
+        note: Optional[str] = Field(default="", db_column_name="note_text")
+    
+    tagged = Tagged(tags=["a"], note=None)
+    
+    assert_equal(tagged.to_dict(), {"tags": ["a"]})
+    assert_true(tagged.to_dict()["tags"] is tagged.tags, "Values should not be deep-copied")
+    assert_equal(tagged.to_dict(exclude_none=False, exclude_private=False),
+                 {"tags": ["a"], "_secret": "hidden", "note": None})
+    assert_equal(tagged.to_db_dict(), {"tags": ["a"], "_secret": "hidden", "note_text": None})
+    assert_equal(tagged.to_row(), (["a"], "hidden", None))
+
+
+def test_slots_model():
+    """Test that slotted models have no __dict__ and support the model API."""
+    
+    @model(slots=True)
+    class Point(BaseModel):
+        x: int = Field(default=0, min_value=0)
+        y: int = Field(default=0)
+        id: str = Field(primary_key=True, default_factory=lambda: uuid4().hex)
+    
+    @dataclass
+    class LegacyPoint(BaseModel):
+        x: int = Field(default=0)
+    
+    for point_class in (Point, _add_slots(LegacyPoint)):
+        point = point_class(x=1)
+        assert_true(not hasattr(point, "__dict__"), "Slotted model should not have __dict__")
+    
+    point = Point.from_dict({"x": 1, "y": 2, "extra": 3})
+    point.update(y=5)
+    assert_equal(point.to_dict(exclude_none=False), {"x": 1, "y": 5, "id": point.id})
+    assert_raises(ValidationError, point.update, x=-1)
+    assert_equal(Point._hydrate({"x": 4}).x, 4)
+    
+    schemas = generate_schemas(Point)
+    assert_in("x", schemas["create"].model_fields)
+
+
 def test_model_metadata():
     """Test model metadata extraction."""
     
@@ -220,6 +268,8 @@ if __name__ == "__main__":
     test_model_creation()
     test_model_validation()
     test_model_serialization() 
+    test_model_shallow_serialization()
+    test_slots_model()
     test_model_metadata()
     test_model_update()
     test_client_initialization()
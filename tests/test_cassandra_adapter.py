@@ -0,0 +1,515 @@
+"""
+Tests for the Cassandra adapter against an in-memory stand-in session.
+
+The stand-in understands the single-partition INSERT, UPDATE, SELECT and
+DELETE statements the adapter prepares, which is enough to check how
+statements are prepared and executed without a Cassandra cluster. Like
+the driver, execute_async() answers from another thread.
+"""
+
+from dataclasses import dataclass
+import asyncio
+import re
+import threading
+import time
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+pytest.importorskip("cassandra")
+
+from cassandra.query import BatchType
+
+from norma import BaseModel, Field
+from norma.exceptions import BulkWriteError, ConfigurationError, QueryError
+from norma.adapters import cassandra_adapter
+from norma.adapters.cassandra_adapter import CassandraAdapter
+
+
+@dataclass
+class Sensor(BaseModel):
+    """Model used by the Cassandra adapter tests."""
+
+    name: str
+    reading: int = Field(default=0)
+    id: str = Field(primary_key=True, default_factory=lambda: "")
+
+
+class FakePrepared:
+    def __init__(self, cql, values=()):
+        self.query_string = cql
+        self.values = list(values)
+        self.fetch_size = None
+
+    def bind(self, values):
+        return FakePrepared(self.query_string, values)
+
+
+class FakeResult:
+    def __init__(self, rows=(), column_names=(), paging_state=None):
+        self.current_rows = list(rows)
+        self.column_names = list(column_names)
+        self.has_more_pages = paging_state is not None
+        self.paging_state = paging_state
+
+    def one(self):
+        return self.current_rows[0] if self.current_rows else None
+
+    def __iter__(self):
+        return iter(self.current_rows)
+
+
+@dataclass
+class Measurement(BaseModel):
+    """Model partitioned by sensor, clustered by timestamp."""
+
+    sensor: str = Field(primary_key=True)
+    ts: int = Field(primary_key=True)
+    value: float = Field(default=0.0)
+
+
+@dataclass
+class Sample(BaseModel):
+    """Time-series model with a composite partition key and newest-first rows."""
+
+    __table_options__ = {
+        "partition_key": ("sensor", "day"),
+        "clustering_order": {"ts": "DESC"},
+        "default_time_to_live": 604800,
+        "compaction": {"class": "TimeWindowCompactionStrategy", "compaction_window_size": 1},
+        "caching": {"keys": "ALL", "rows_per_partition": "NONE"},
+    }
+
+    sensor: str = Field(primary_key=True)
+    day: str = Field(primary_key=True)
+    ts: int = Field(primary_key=True)
+    seq: int = Field(primary_key=True)
+    value: float = Field(default=0.0)
+
+
+class FakeBatch:
+    def __init__(self, batch_type=None):
+        self.batch_type = batch_type
+        self.entries = []
+
+    def add(self, statement, values):
+        self.entries.append((statement.query_string, list(values)))
+
+
+class FakeResponseFuture:
+    """Completes on a timer thread after the session's latency."""
+
+    def __init__(self, run, delay):
+        self._run = run
+        self._result = self._error = None
+        self._done = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+        threading.Timer(delay, self._complete).start()
+
+    def _complete(self):
+        try:
+            self._result = self._run()
+        except Exception as e:
+            self._error = e
+        with self._lock:
+            self._done.set()
+            callbacks = list(self._callbacks)
+        for callback, errback in callbacks:
+            self._notify(callback, errback)
+
+    def _notify(self, callback, errback):
+        if self._error is not None:
+            errback(self._error)
+        else:
+            callback(self._result.current_rows)
+
+    def add_callbacks(self, callback, errback):
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append((callback, errback))
+                return
+        self._notify(callback, errback)
+
+    def result(self):
+        self._done.wait()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+class FakeSession:
+    """Stores rows per table, keyed by the primary key its CREATE TABLE declared."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.prepare_latency = 0.0
+        self.tables = {}
+        self.columns = {}
+        self.keys = {}
+        self.prepared = []
+        self.executed = []
+        self.in_flight = self.max_in_flight = 0
+        self.batches = []
+        self.batch_types = []
+        self._lock = threading.Lock()
+
+    def prepare(self, cql):
+        time.sleep(self.prepare_latency)  # blocking, like the driver's
+        self.prepared.append(cql)
+        return FakePrepared(cql)
+
+    def execute(self, statement, values=None):
+        return self.execute_async(statement, values).result()
+
+    def execute_async(self, statement, values=None, paging_state=None):
+        if isinstance(statement, FakeBatch):
+            self.batches.append(len(statement.entries))
+            self.batch_types.append(statement.batch_type)
+            return FakeResponseFuture(lambda: [self._run(*entry) for entry in statement.entries][-1], self.latency)
+        cql = statement if isinstance(statement, str) else statement.query_string
+        if values is None:
+            values = getattr(statement, "values", ())
+        self.executed.append(cql)
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        def run():
+            with self._lock:
+                self.in_flight -= 1
+            return self._run(cql, list(values), getattr(statement, "fetch_size", None), paging_state)
+        return FakeResponseFuture(run, self.latency)
+
+    def _run(self, cql, values, fetch_size=None, paging_state=None):
+        cql = " ".join(cql.split())
+        match = re.match(r"CREATE TABLE IF NOT EXISTS (\w+) \((.*), PRIMARY KEY \((.*?)\) \)", cql)
+        if match:
+            self.columns[match.group(1)] = [column.split()[0] for column in match.group(2).split(", ")]
+            self.keys[match.group(1)] = re.findall(r"\w+", match.group(3))
+            self.tables.setdefault(match.group(1), {})
+            return FakeResult()
+        match = re.match(r"DROP TABLE IF EXISTS (\w+)", cql)
+        if match:
+            self.tables.pop(match.group(1), None)
+            return FakeResult()
+        if "fail" in values:
+            raise RuntimeError("Operation timed out")
+        match = re.match(r"INSERT INTO (\w+) \(([^)]*)\) VALUES", cql)
+        if match:
+            row = dict(zip(match.group(2).split(", "), values))
+            self.tables[match.group(1)][self._key(match.group(1), row)] = row
+            return FakeResult()
+        match = re.match(r"UPDATE (\w+) SET (.*) WHERE (.*)", cql)
+        if match:
+            columns = [assignment.split(" = ")[0] for assignment in match.group(2).split(", ")]
+            where = self._where(match.group(3), values[len(columns):])
+            self.tables[match.group(1)][self._key(match.group(1), where)].update(zip(columns, values))
+            return FakeResult()
+        match = re.match(r"DELETE FROM (\w+) WHERE (.*)", cql)
+        if match:
+            self.tables[match.group(1)].pop(self._key(match.group(1), self._where(match.group(2), values)), None)
+            return FakeResult()
+        match = re.match(r"SELECT (.*) FROM (\w+)(?: WHERE (.*?))?(?: GROUP BY (.*?))?( LIMIT \?)?( ALLOW FILTERING)?$", cql)
+        if match:
+            # Equality filters and count(*) only; the paging state is the next row's position
+            table = match.group(2)
+            columns = self.columns[table] if match.group(1) == "*" else match.group(1).split(", ")
+            where = self._where(match.group(3), values) if match.group(3) else {}
+            rows = [
+                tuple(row.get(column) for column in columns) for row in self.tables[table].values()
+                if all(row.get(column) == value for column, value in where.items())
+            ]
+            if "count(*)" in columns:
+                groups = {}
+                for row in rows:
+                    groups[row[:-1]] = groups.get(row[:-1], 0) + 1
+                rows = [group + (count,) for group, count in groups.items()]
+            rows = rows[:values[-1]] if match.group(5) else rows
+            start = int(paging_state or 0)
+            end = start + fetch_size if fetch_size else len(rows)
+            return FakeResult(rows[start:end], columns, str(end).encode() if end < len(rows) else None)
+        return FakeResult()
+
+    def _key(self, table, row):
+        return tuple(row[column] for column in self.keys[table])
+
+    @staticmethod
+    def _where(conditions, values):
+        return dict(zip((condition.split(" = ")[0] for condition in conditions.split(" AND ")), values))
+
+
+@pytest.fixture
+def adapter():
+    adapter = CassandraAdapter("localhost", "tests")
+    adapter.session = FakeSession()
+    adapter._is_connected = True
+    return adapter
+
+
+async def test_statements_are_prepared_once_per_shape(adapter):
+    await adapter.create_table(Sensor)
+    for i in range(3):
+        sensor = await adapter.insert(Sensor(name=f"s{i}"))
+        sensor.reading = i
+        await adapter.update(sensor)
+        assert (await adapter.find_by_id(Sensor, sensor.id)).reading == i
+        await adapter.delete_by_id(Sensor, sensor.id)
+
+    prepared = adapter.session.prepared
+    assert sorted(prepared) == [
+        "DELETE FROM sensor WHERE id = ?",
+        "INSERT INTO sensor (name, reading, id) VALUES (?, ?, ?)",
+        "SELECT * FROM sensor WHERE id = ?",
+        "UPDATE sensor SET reading = ? WHERE id = ?",
+    ]
+    assert all(cql in prepared for cql in adapter.session.executed[1:])
+
+
+async def test_schema_changes_prepare_statements_again(adapter):
+    await adapter.create_table(Sensor)
+    sensor = await adapter.insert(Sensor(name="s"))
+    await adapter.find_by_id(Sensor, sensor.id)
+
+    await adapter.drop_table(Sensor)
+    await adapter.create_table(Sensor)
+    await adapter.insert(Sensor(name="t"))
+    assert [cql.split()[0] for cql in adapter.session.prepared] == ["INSERT", "SELECT", "INSERT"]
+
+
+async def test_queries_do_not_block_the_event_loop(adapter):
+    await adapter.create_table(Sensor)
+    sensors = [await adapter.insert(Sensor(name=f"s{i}")) for i in range(20)]
+    adapter.session.latency = 0.05
+    adapter.session.max_in_flight = 0
+
+    start = time.perf_counter()
+    found = await asyncio.gather(*(adapter.find_by_id(Sensor, sensor.id) for sensor in sensors))
+    elapsed = time.perf_counter() - start
+
+    assert [sensor.name for sensor in found] == [f"s{i}" for i in range(20)]
+    assert adapter.session.max_in_flight == 20
+    assert elapsed < 0.5  # 20 sequential round trips would take a second
+
+
+async def test_statements_are_prepared_off_the_event_loop_once(adapter):
+    await adapter.create_table(Sensor)
+    sensors = [await adapter.insert(Sensor(name=f"s{i}")) for i in range(5)]
+    adapter.session.prepare_latency = 0.1
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.ensure_future(tick())
+    found = await asyncio.gather(*(adapter.find_by_id(Sensor, sensor.id) for sensor in sensors))
+    ticker.cancel()
+
+    assert [sensor.name for sensor in found] == [f"s{i}" for i in range(5)]
+    assert ticks >= 5  # the loop kept running during the 0.1s prepare
+    assert adapter.session.prepared.count("SELECT * FROM sensor WHERE id = ?") == 1
+
+async def test_query_errors_are_raised_in_the_caller(adapter):
+    await adapter.create_table(Sensor)
+    adapter.session.tables.clear()
+    with pytest.raises(QueryError):
+        await adapter.find_by_id(Sensor, "missing")
+
+
+async def test_insert_many_bounds_requests_and_reports_failed_rows(adapter):
+    adapter.config["concurrency"] = 4
+    adapter.session.latency = 0.01
+    sensors = [Sensor(name="fail" if i == 7 else f"s{i}") for i in range(20)]
+
+    with pytest.raises(BulkWriteError) as raised:
+        await adapter.insert_many(sensors, batch_size=8)
+    assert [(error["batch"], error["index"]) for error in raised.value.errors] == [(0, 7)]
+    assert raised.value.inserted_count == 19
+    assert len(adapter.session.tables["sensor"]) == 19
+    assert adapter.session.max_in_flight == 4
+
+    found = await adapter.find_by_ids(Sensor, [sensor.id for sensor in sensors])
+    assert [sensor and sensor.name for sensor in found] == [None if i == 7 else f"s{i}" for i in range(20)]
+    deleted = await adapter.delete_many_by_ids(Sensor, [sensors[0].id, sensors[1].id, sensors[0].id])
+    assert deleted == 2 and len(adapter.session.tables["sensor"]) == 17
+
+
+async def test_rows_of_one_partition_share_an_unlogged_batch(adapter, monkeypatch):
+    monkeypatch.setattr(cassandra_adapter, "BatchStatement", FakeBatch)
+    adapter.config["partition_batch_size"] = 3
+    rows = [Measurement(sensor=f"s{i % 2}", ts=i) for i in range(8)]
+
+    await adapter.insert_many(rows)
+    # Four rows per sensor: a batch of three, then the fourth on its own
+    assert adapter.session.batches == [3, 3]
+    assert adapter.session.executed.count(adapter.session.prepared[0]) == 2
+    assert len(adapter.session.tables["measurement"]) == 8
+
+
+async def test_find_many_pages_through_results_and_applies_offset(adapter):
+    await adapter.create_table(Sensor)
+    await adapter.insert_many([Sensor(name=f"s{i}") for i in range(10)])
+    adapter.config["fetch_size"] = 3
+    executed = len(adapter.session.executed)
+
+    assert [sensor.name for sensor in await adapter.find_many(Sensor)] == [f"s{i}" for i in range(10)]
+    assert len(adapter.session.executed) - executed == 4
+    found = await adapter.find_many(Sensor, limit=4, offset=3)
+    assert [sensor.name for sensor in found] == ["s3", "s4", "s5", "s6"]
+
+
+async def test_iter_pages_prefetches_and_resumes_from_cursors(adapter):
+    await adapter.create_table(Sensor)
+    await adapter.insert_many([Sensor(name=f"s{i}") for i in range(10)])
+    adapter.session.latency = 0.01
+    executed = len(adapter.session.executed)
+
+    pages = []
+    async for page in adapter.iter_pages(Sensor, limit=4):
+        await asyncio.sleep(0)
+        # The following page is already requested while this one is processed
+        assert len(adapter.session.executed) - executed == len(pages) + 1 + page.has_more
+        pages.append(page)
+    assert [[sensor.name for sensor in page] for page in pages] == [
+        ["s0", "s1", "s2", "s3"], ["s4", "s5", "s6", "s7"], ["s8", "s9"]
+    ]
+
+    resumed = [page async for page in adapter.iter_pages(Sensor, after=pages[0].next_cursor, limit=4)]
+    assert [len(page) for page in resumed] == [4, 2]
+    page = await adapter.find_page(Sensor, after=pages[1].next_cursor, limit=4)
+    assert [sensor.name for sensor in page] == ["s8", "s9"] and page.next_cursor is None
+
+
+async def test_create_table_declares_partition_key_clustering_order_and_options(adapter):
+    await adapter.create_table(Sample)
+    await adapter.create_table(Measurement)
+    sample_cql, measurement_cql = (" ".join(cql.split()) for cql in adapter.session.executed)
+
+    assert "PRIMARY KEY ((sensor, day), ts, seq)" in sample_cql
+    assert sample_cql.endswith(
+        ") WITH CLUSTERING ORDER BY (ts DESC, seq ASC) AND default_time_to_live = 604800"
+        " AND compaction = {'class': 'TimeWindowCompactionStrategy', 'compaction_window_size': '1'}"
+        " AND caching = {'keys': 'ALL', 'rows_per_partition': 'NONE'}"
+    )
+    # Without table options the first key field is the partition key
+    assert measurement_cql.endswith("PRIMARY KEY (sensor, ts) )")
+    assert adapter._partition_key_columns(Sample) == ("sensor", "day")
+
+
+def test_table_options_must_name_primary_key_fields(adapter):
+    @dataclass
+    class Misdeclared(BaseModel):
+        __table_options__ = {"partition_key": "value"}
+
+        sensor: str = Field(primary_key=True)
+        value: float = Field(default=0.0)
+
+    with pytest.raises(ConfigurationError):
+        adapter._build_create_table_cql(Misdeclared, "misdeclared")
+
+
+@pytest.mark.parametrize("filters, allow_filtering", [
+    ({"sensor": "a", "day": "d"}, False),
+    ({"sensor": "a", "day": {"$in": ["d", "e"]}, "ts": {"$gte": 5}}, False),
+    ({"sensor": "a", "day": "d", "ts": 5, "seq": {"$lt": 3}}, False),
+    ({"sensor": "a"}, True),
+    ({"sensor": "a", "day": "d", "seq": 1}, True),
+    ({"sensor": "a", "day": "d", "ts": {"$gt": 5}, "seq": 1}, True),
+    ({"sensor": "a", "day": "d", "value": 1.0}, True),
+])
+def test_find_many_only_filters_outside_the_primary_key_order(adapter, filters, allow_filtering):
+    select_cql, _ = adapter._select_query(Sample, filters)
+    assert select_cql.endswith(" ALLOW FILTERING") == allow_filtering
+
+
+def test_order_by_follows_or_reverses_the_clustering_order(adapter):
+    filters = {"sensor": "a", "day": "d"}
+    assert adapter._select_query(Sample, filters, ["-ts", "seq"])[0].endswith("ORDER BY ts DESC, seq ASC")
+    assert adapter._select_query(Sample, filters, ["ts", "-seq"])[0].endswith("ORDER BY ts ASC, seq DESC")
+    for order_by in (["seq"], ["value"], ["ts", "seq"]):
+        with pytest.raises(QueryError):
+            adapter._select_query(Sample, filters, order_by)
+
+
+async def test_crud_binds_every_primary_key_column(adapter):
+    await adapter.create_table(Sample)
+    sample = await adapter.insert(Sample(sensor="a", day="d1", ts=1, seq=0, value=1.0))
+    await adapter.insert_many([Sample(sensor="a", day="d1", ts=2, seq=0), Sample(sensor="a", day="d2", ts=1, seq=0)])
+
+    sample.value = 2.0
+    await adapter.update(sample)
+    found = await adapter.find_by_id(Sample, ("a", "d1", 1, 0))
+    assert found.value == 2.0
+    assert await adapter.find_by_ids(Sample, [("a", "d2", 1, 0), ("b", "d1", 1, 0)]) == [
+        Sample(sensor="a", day="d2", ts=1, seq=0), None
+    ]
+    assert await adapter.exists(Sample, {"sensor": "a", "day": "d2"})
+
+    assert await adapter.update_many(Sample, {"sensor": "a", "day": "d1"}, {"value": 3.0}) == 2
+    assert [sample.value for sample in await adapter.find_many(Sample, {"sensor": "a", "day": "d1"})] == [3.0, 3.0]
+    assert await adapter.delete_by_id(Sample, ("a", "d1", 1, 0))
+    assert await adapter.delete_many(Sample, {"sensor": "a", "day": "d1"}) == 1
+    assert await adapter.delete_many_by_ids(Sample, [("a", "d2", 1, 0)]) == 1
+    assert adapter.session.tables["sample"] == {}
+
+    assert "UPDATE sample SET value = ? WHERE sensor = ? AND day = ? AND ts = ? AND seq = ?" in adapter.session.prepared
+    assert "SELECT sensor, day, ts, seq FROM sample WHERE sensor = ? AND day = ?" in adapter.session.executed
+    with pytest.raises(QueryError):
+        await adapter.find_by_id(Sample, "a")
+
+
+async def test_transactions_track_composite_partition_keys(adapter, monkeypatch):
+    monkeypatch.setattr(cassandra_adapter, "BatchStatement", FakeBatch)
+    await adapter.create_table(Sample)
+
+    for days in (("d1", "d1"), ("d1", "d2")):
+        async with adapter.transaction():
+            first = await adapter.insert(Sample(sensor="a", day=days[0], ts=1, seq=0))
+            await adapter.insert(Sample(sensor="a", day=days[1], ts=2, seq=0))
+            first.value = 1.0
+            await adapter.update(first)
+            await adapter.delete_by_id(Sample, ("a", days[1], 2, 0))
+
+    # Rows of one sensor on different days are different partitions, so need the batch log
+    assert adapter.session.batch_types == [BatchType.UNLOGGED, BatchType.LOGGED]
+    assert [row["value"] for row in adapter.session.tables["sample"].values()] == [1.0]
+
+
+async def test_aggregate_reads_every_page_of_groups(adapter):
+    await adapter.insert_many([Measurement(sensor=f"s{i % 5}", ts=i) for i in range(12)])
+    adapter.config["fetch_size"] = 2
+
+    groups = await adapter.aggregate(Measurement, group_by=["sensor"])
+    assert sorted((group["sensor"], group["count"]) for group in groups) == [
+        ("s0", 3), ("s1", 3), ("s2", 2), ("s3", 2), ("s4", 2)
+    ]
+    assert sum(cql.startswith("SELECT sensor, count(*)") for cql in adapter.session.executed) == 3
+
+
+async def test_callbacks_for_later_pages_leave_the_settled_future_alone():
+    future = asyncio.get_running_loop().create_future()
+    response = FakeResponseFuture(lambda: FakeResult([(1,)]), 0)
+    response.result()
+
+    cassandra_adapter._resolve(future, response, None)
+    cassandra_adapter._resolve(future, response, None)
+    assert future.result().current_rows == [(1,)]
+
+
+async def test_find_by_ids_accepts_composite_keys_as_lists_or_tuples(adapter):
+    await adapter.insert_many([Sample(sensor="a", day="d1", ts=i, seq=0, value=float(i)) for i in range(3)])
+    ids = [["a", "d1", 2, 0], ("a", "d1", 0, 0), ("a", "d1", 2, 0), ["b", "d1", 0, 0]]
+
+    found = await adapter.find_by_ids(Sample, ids)
+    assert [sample and sample.value for sample in found] == [2.0, 0.0, 2.0, None]
+    by_key = await adapter.find_by_ids(Sample, ids, preserve_order=False)
+    assert sorted(by_key) == [("a", "d1", 0, 0), ("a", "d1", 2, 0)]
+
+    assert await adapter.delete_many_by_ids(Sample, ids) == 3
+    assert len(adapter.session.tables["sample"]) == 1
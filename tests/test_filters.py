@@ -0,0 +1,45 @@
+"""
+Tests for the filter parser shared by the adapters.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from norma.core.filters import And, Comparison, Or, like_to_regex, parse_filters
+from norma.exceptions import QueryError
+
+
+def test_parse_filters_builds_shape_and_values():
+    shape, values = parse_filters(
+        {"name": "Ann", "age": {"$gte": 18, "$in": (1, 2)}, "$or": [{"email": None}, {"email": {"$exists": True}}]},
+        {"email": "email_address"},
+    )
+    
+    assert shape == And((
+        Comparison("name", "$eq", 0),
+        Comparison("age", "$gte", 1),
+        Comparison("age", "$in", 2),
+        Or((
+            And((Comparison("email_address", "$is_null"),)),
+            And((Comparison("email_address", "$exists"),)),
+        )),
+    ))
+    assert values == ("Ann", 18, [1, 2])
+
+
+def test_filters_with_same_shape_share_a_key():
+    first, _ = parse_filters({"age": {"$gte": 18}})
+    second, _ = parse_filters({"age": {"$gte": 65}})
+    assert first == second and hash(first) == hash(second)
+
+
+def test_invalid_logical_filters_raise():
+    with pytest.raises(QueryError):
+        parse_filters({"$or": {"name": "Ann"}})
+
+
+def test_like_to_regex():
+    assert like_to_regex("a%b_.") == r"^a.*b.\.$"
@@ -0,0 +1,158 @@
+"""
+Tests for find_by_id request coalescing.
+"""
+
+import asyncio
+import contextvars
+import gc
+from dataclasses import dataclass
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from norma import BaseModel, Field, NormaClient
+from norma.exceptions import QueryError
+
+
+@dataclass
+class Author(BaseModel):
+    """Model loaded by the loader tests."""
+    
+    name: str = Field()
+    id: str = Field(primary_key=True, default_factory=lambda: "")
+
+
+@pytest.fixture
+async def client(tmp_path):
+    client = NormaClient("sql", f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    await client.connect()
+    await client.get_model_client(Author).create_table()
+    yield client
+    await client.disconnect()
+
+
+def count_batches(client, monkeypatch):
+    """Record the ID lists passed to find_by_ids."""
+    calls = []
+    find_by_ids = client.adapter.find_by_ids
+    
+    async def recording(model_class, ids, *args, **kwargs):
+        calls.append(list(ids))
+        return await find_by_ids(model_class, ids, *args, **kwargs)
+    
+    monkeypatch.setattr(client.adapter, "find_by_ids", recording)
+    return calls
+
+
+async def test_concurrent_find_by_id_calls_share_one_batch(client, monkeypatch):
+    authors = client.get_model_client(Author)
+    ann, bob = await authors.insert_many([Author(name="ann"), Author(name="bob")])
+    client.enable_loader()
+    calls = count_batches(client, monkeypatch)
+    
+    found = await asyncio.gather(
+        authors.find_by_id(ann.id), authors.find_by_id(bob.id),
+        authors.find_by_id(ann.id), authors.find_by_id("missing"),
+    )
+    assert [author and author.name for author in found] == ["ann", "bob", "ann", None]
+    assert len(calls) == 1 and sorted(calls[0]) == sorted([ann.id, bob.id, "missing"])
+    
+    stats = client.loader_stats()[Author]
+    assert (stats.batches, stats.requested, stats.loaded, stats.deduplicated) == (1, 4, 3, 1)
+    assert stats.recent[0][0] == 3
+
+
+async def test_loader_window_and_batch_limit(client, monkeypatch):
+    authors = client.get_model_client(Author)
+    inserted = await authors.insert_many([Author(name=f"a{i}") for i in range(5)])
+    client.enable_loader(window=0.01, max_batch_size=2)
+    calls = count_batches(client, monkeypatch)
+    
+    async def later(id_value):
+        await asyncio.sleep(0)
+        return await authors.find_by_id(id_value)
+    
+    found = await asyncio.gather(*[later(author.id) for author in inserted])
+    assert [author.name for author in found] == [author.name for author in inserted]
+    assert [len(ids) for ids in calls] == [2, 2, 1]
+
+
+async def test_loader_is_bypassed_for_projections_and_transactions(client, monkeypatch):
+    authors = client.get_model_client(Author)
+    ann = await authors.insert(Author(name="ann"))
+    client.enable_loader()
+    calls = count_batches(client, monkeypatch)
+    
+    assert (await authors.find_by_id(ann.id, fields=["name"])).name == "ann"
+    async with client.transaction():
+        assert (await authors.find_by_id(ann.id)).name == "ann"
+    assert calls == []
+    
+    client.disable_loader()
+    assert authors.loader is None and client.loader_stats() == {}
+
+
+async def test_loader_errors_reach_every_caller(client, monkeypatch):
+    authors = client.get_model_client(Author)
+    client.enable_loader()
+    
+    async def failing(*args, **kwargs):
+        raise QueryError("boom")
+    
+    monkeypatch.setattr(client.adapter, "find_by_ids", failing)
+    results = await asyncio.gather(authors.find_by_id("a"), authors.find_by_id("b"), return_exceptions=True)
+    assert all(isinstance(result, QueryError) for result in results)
+
+
+
+async def test_cancelled_batches_release_every_caller(client, monkeypatch):
+    authors = client.get_model_client(Author)
+    client.enable_loader()
+    started = asyncio.Event()
+    
+    async def hanging(*args, **kwargs):
+        started.set()
+        await asyncio.Event().wait()
+    
+    monkeypatch.setattr(client.adapter, "find_by_ids", hanging)
+    callers = asyncio.gather(authors.find_by_id("a"), authors.find_by_id("b"), return_exceptions=True)
+    await started.wait()
+    for task in authors.loader._tasks:
+        task.cancel()
+    
+    results = await asyncio.wait_for(callers, 1)
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+
+async def test_batches_do_not_run_in_a_callers_context(client, monkeypatch):
+    authors = client.get_model_client(Author)
+    client.enable_loader()
+    request = contextvars.ContextVar("request", default=None)
+    seen = []
+    
+    async def recording(model_class, ids, *args, **kwargs):
+        seen.append(request.get())
+        return {}
+    
+    monkeypatch.setattr(client.adapter, "find_by_ids", recording)
+    request.set("first caller")
+    assert await authors.find_by_id("a") is None
+    assert seen == [None]
+
+async def test_in_flight_batches_survive_garbage_collection(client, monkeypatch):
+    authors = client.get_model_client(Author)
+    client.enable_loader()
+    
+    async def slow(model_class, ids, *args, **kwargs):
+        await asyncio.sleep(0)
+        gc.collect()  # only the loader references the batch task now
+        await asyncio.sleep(0.01)
+        return {id_value: Author(name=id_value, id=id_value) for id_value in ids}
+    
+    monkeypatch.setattr(client.adapter, "find_by_ids", slow)
+    found = await asyncio.wait_for(asyncio.gather(authors.find_by_id("a"), authors.find_by_id("b")), 1)
+    assert [author.name for author in found] == ["a", "b"]
+    assert not authors.loader._tasks
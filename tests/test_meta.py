@@ -0,0 +1,57 @@
+"""
+Tests for the cached model metadata registry.
+"""
+
+from dataclasses import dataclass, FrozenInstanceError
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from norma import BaseModel, Field, SQLAdapter
+from norma.core import get_model_meta, model_metadata
+from norma.core.meta import registered_models
+
+
+def _define_order():
+    @dataclass
+    class Order(BaseModel):
+        """Order model, redefined by each call."""
+        
+        total: float = Field(default=0.0, index=True)
+        reference: str = Field(default="", unique=True, db_column_name="ref")
+        id: str = Field(primary_key=True, default="o1")
+    
+    return Order
+
+
+def test_meta_contents():
+    Order = _define_order()
+    meta = get_model_meta(Order)
+    
+    assert meta.primary_key == "id"
+    assert meta.table_name == "order"
+    assert meta.field_names == ("total", "reference", "id")
+    assert meta.column_names == ("total", "ref", "id")
+    assert meta.column_to_field["ref"] == "reference"
+    assert meta.unique_fields == ("reference", "id")
+    assert meta.indexed_fields == ("total", "reference", "id")
+    
+    with pytest.raises(FrozenInstanceError):
+        meta.primary_key = "total"
+    
+    assert model_metadata(Order)["columns"]["reference"] == "ref"
+    assert SQLAdapter("sqlite:///:memory:").get_table_name(Order) == "order"
+
+
+def test_meta_is_cached_until_class_is_redefined():
+    Order = _define_order()
+    meta = get_model_meta(Order)
+    assert get_model_meta(Order) is meta
+    
+    Redefined = _define_order()
+    new_meta = get_model_meta(Redefined)
+    assert new_meta is not meta
+    assert registered_models()[f"{Redefined.__module__}.{Redefined.__qualname__}"] is new_meta
@@ -0,0 +1,275 @@
+"""
+Tests for the MongoDB adapter against an in-memory stand-in collection.
+
+The stand-in implements the Motor collection calls the adapter makes
+(insert_one, insert_many, bulk_write, find and aggregate) for the query and $group
+documents it builds, which is enough to check how requests are compiled
+and results are read back without a MongoDB server.
+"""
+
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Optional
+import re
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+pytest.importorskip("motor")
+
+from pymongo import ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError as PyMongoBulkWriteError, DuplicateKeyError
+
+from norma import BaseModel, Count, Field, Sum
+from norma.exceptions import BulkWriteError
+from norma.adapters.mongo_adapter import MongoAdapter, _Param, _bind
+
+
+@dataclass
+class Gauge(BaseModel):
+    """Model used by the MongoDB adapter tests."""
+
+    name: str
+    zone: str = Field(default="north", db_column_name="gauge_zone")
+    level: Optional[int] = None
+    id: str = Field(primary_key=True, default_factory=lambda: "")
+
+
+@dataclass
+class Subscriber(BaseModel):
+    """Model with a unique field used as an upsert conflict target."""
+
+    email: str = Field(unique=True)
+    plan: str = Field(default="free")
+    id: str = Field(primary_key=True, default_factory=lambda: "")
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self.documents:
+            yield document
+
+    async def to_list(self, length=None):
+        return list(self.documents)
+
+    async def close(self):
+        pass
+
+
+class FakeCollection:
+    def __init__(self, unique=()):
+        self.unique = ("_id", *unique)
+        self.documents = []
+        self.calls = []
+
+    async def insert_one(self, document, session=None):
+        if self._clashes(document):
+            raise DuplicateKeyError("E11000 duplicate key error")
+        self.documents.append(dict(document))
+        return SimpleNamespace(inserted_id=document["_id"])
+
+    async def insert_many(self, documents, ordered=True, session=None):
+        self.calls.append(("insert_many", len(documents), ordered))
+        errors = []
+        for index, document in enumerate(documents):
+            if self._clashes(document):
+                errors.append({"index": index, "code": 11000, "errmsg": "E11000 duplicate key error"})
+                if ordered:
+                    break
+            else:
+                self.documents.append(dict(document))
+        if errors:
+            raise PyMongoBulkWriteError({"writeErrors": errors})
+
+    async def bulk_write(self, requests, ordered=True, session=None):
+        self.calls.append(("bulk_write", len(requests), ordered))
+        for request in requests:
+            match = next(self._matching(request._filter), None)
+            if isinstance(request, ReplaceOne):
+                if match is not None:
+                    self.documents.remove(match)
+                self.documents.append(dict(request._doc))
+            elif match is not None:
+                match.update(request._doc["$set"])
+            else:
+                self.documents.append({**request._filter, **request._doc["$set"], **request._doc["$setOnInsert"]})
+
+    def find(self, query_filter, projection=None, session=None, **kwargs):
+        self.calls.append(("find", query_filter))
+        documents = [dict(document) for document in self._matching(query_filter)]
+        if projection:
+            documents = [{key: document[key] for key in ("_id", *projection) if key in document} for document in documents]
+        return FakeCursor(documents)
+
+    def aggregate(self, pipeline, session=None):
+        self.calls.append(("aggregate", pipeline))
+        documents = self.documents
+        groups = {}
+        for stage in pipeline:
+            if "$match" in stage:
+                documents = list(self._matching(stage["$match"]))
+                continue
+            spec = stage["$group"]
+            for document in documents:
+                key = {name: self._evaluate(expression, document) for name, expression in (spec["_id"] or {}).items()}
+                group = groups.setdefault(tuple(key.values()), {"_id": key or None})
+                for name, accumulator in spec.items():
+                    if name != "_id":
+                        ((function, expression),) = accumulator.items()
+                        value = self._evaluate(expression, document)
+                        if function == "$sum":
+                            group[name] = group.get(name, 0) + (value if isinstance(value, int) else 0)
+                        elif value is not None and function == "$max":
+                            group[name] = max(group.get(name, value), value)
+        return FakeCursor(list(groups.values()))
+
+    def _clashes(self, document):
+        return any(
+            existing.get(column) == document.get(column)
+            for existing in self.documents
+            for column in self.unique
+        )
+
+    def _matching(self, query_filter):
+        return (document for document in self.documents if self._matches(document, query_filter))
+
+    def _matches(self, document, query_filter):
+        for key, condition in query_filter.items():
+            if key == "$or":
+                if not any(self._matches(document, branch) for branch in condition):
+                    return False
+            elif key == "$and":
+                if not all(self._matches(document, branch) for branch in condition):
+                    return False
+            elif isinstance(condition, dict):
+                value = document.get(key)
+                for op, operand in condition.items():
+                    if op == "$gte" and not (value is not None and value >= operand):
+                        return False
+                    if op == "$in" and value not in operand:
+                        return False
+                    if op == "$regex" and not (value is not None and re.search(operand, value)):
+                        return False
+            elif document.get(key) != condition:
+                return False
+        return True
+
+    def _evaluate(self, expression, document):
+        if isinstance(expression, str) and expression.startswith("$"):
+            return document.get(expression[1:])
+        if isinstance(expression, dict):
+            ((op, arguments),) = expression.items()
+            values = [self._evaluate(argument, document) for argument in arguments]
+            if op == "$cond":
+                return values[1] if values[0] else values[2]
+            if op == "$eq":
+                return values[0] == values[1]
+            if op == "$ifNull":
+                return values[1] if values[0] is None else values[0]
+        return expression
+
+
+@pytest.fixture
+def adapter():
+    adapter = MongoAdapter("mongodb://localhost:27017", "tests")
+    adapter.collections["gauge"] = FakeCollection()
+    adapter.collections["subscriber"] = FakeCollection(unique=("email",))
+    adapter._is_connected = True
+    return adapter
+
+
+def test_bind_substitutes_and_converts_nested_params():
+    template = {"$or": [{"a": _Param(0)}, {"b": {"$in": _Param(1), "$regex": _Param(2, str.upper)}}], "c": 3}
+    assert _bind(template, [1, [2, 3], "x"]) == {"$or": [{"a": 1}, {"b": {"$in": [2, 3], "$regex": "X"}}], "c": 3}
+
+
+async def test_filter_templates_are_cached_per_shape_and_bound_per_call(adapter):
+    await adapter.insert_many([Gauge(name=f"g{i}", level=i) for i in range(4)])
+
+    low = await adapter.find_many(Gauge, filters={"level": {"$gte": 1}, "zone": "north"})
+    high = await adapter.find_many(Gauge, filters={"level": {"$gte": 3}, "zone": "north"})
+    named = await adapter.find_many(Gauge, filters={"name": {"$like": "g_"}})
+
+    assert [gauge.name for gauge in low] == ["g1", "g2", "g3"]
+    assert [gauge.name for gauge in high] == ["g3"]
+    assert len(named) == 4
+    finds = [call[1] for call in adapter.collections["gauge"].calls if call[0] == "find"]
+    assert finds[:2] == [{"level": {"$gte": 1}, "gauge_zone": "north"}, {"level": {"$gte": 3}, "gauge_zone": "north"}]
+    assert adapter.statement_cache.stats()["misses"] == 2
+
+
+async def test_insert_many_is_unordered_and_reports_duplicates_per_document(adapter):
+    existing = await adapter.insert(Gauge(name="taken", id="g-1"))
+    models = [Gauge(name="a"), Gauge(name="dup", id=existing.id), Gauge(name="b"), Gauge(name="c")]
+
+    with pytest.raises(BulkWriteError) as error:
+        await adapter.insert_many(models, batch_size=2)
+
+    collection = adapter.collections["gauge"]
+    assert [call for call in collection.calls if call[0] == "insert_many"] == [("insert_many", 2, False)] * 2
+    assert [(entry["batch"], entry["index"], entry["duplicate"]) for entry in error.value.errors] == [(0, 1, True)]
+    assert error.value.inserted_count == 3
+    assert sorted(document["name"] for document in collection.documents) == ["a", "b", "c", "taken"]
+    assert models[1].get_dirty_fields() and not models[2].get_dirty_fields()
+
+
+async def test_upsert_by_primary_key_replaces_whole_documents(adapter):
+    gauge = await adapter.insert(Gauge(name="old", level=1))
+
+    await adapter.upsert_many([Gauge(name="new", id=gauge.id), Gauge(name="fresh")])
+
+    collection = adapter.collections["gauge"]
+    assert sorted((document["name"], document["level"]) for document in collection.documents) == [
+        ("fresh", None), ("new", None)
+    ]
+    assert not any(call[0] == "find" for call in collection.calls)
+
+
+async def test_upsert_by_unique_field_keeps_and_restores_stored_keys(adapter):
+    stored = await adapter.insert(Subscriber(email="a@example.com", id="s-1"))
+
+    incoming = [Subscriber(email="a@example.com", plan="pro"), Subscriber(email="b@example.com")]
+    requests = [adapter._upsert_request(model, ("email",), "id") for model in incoming]
+    await adapter.upsert_many(incoming, conflict_fields=["email"])
+
+    assert all(isinstance(request, UpdateOne) for request in requests)
+    assert incoming[0].id == stored.id
+    assert incoming[1].id and incoming[1].id != stored.id
+    documents = {document["email"]: document for document in adapter.collections["subscriber"].documents}
+    assert documents["a@example.com"] == {"_id": "s-1", "id": "s-1", "email": "a@example.com", "plan": "pro"}
+    assert documents["b@example.com"]["_id"] == incoming[1].id
+
+
+async def test_aggregate_builds_a_cached_group_stage(adapter):
+    await adapter.insert_many([
+        Gauge(name="a", zone="north", level=2),
+        Gauge(name="b", zone="north", level=5),
+        Gauge(name="c", zone="south"),
+    ])
+    metrics = {"gauges": Count(), "total": Sum("level")}
+
+    results = await adapter.aggregate(Gauge, group_by=["zone"], metrics=metrics)
+    await adapter.aggregate(Gauge, filters={"name": "a"}, group_by=["zone"], metrics=metrics)
+
+    pipelines = [call[1] for call in adapter.collections["gauge"].calls if call[0] == "aggregate"]
+    assert pipelines[0] == [{"$group": {
+        "_id": {"g0": "$gauge_zone"},
+        "m0": {"$sum": 1},
+        "m1": {"$sum": "$level"},
+        "n1": {"$sum": {"$cond": [{"$eq": [{"$ifNull": ["$level", None]}, None]}, 0, 1]}},
+    }}]
+    assert pipelines[1] == [{"$match": {"name": "a"}}, pipelines[0][0]]
+    assert pipelines[1][1] is pipelines[0][0]
+    assert sorted(results, key=lambda row: row["zone"]) == [
+        {"zone": "north", "gauges": 2, "total": 7},
+        {"zone": "south", "gauges": 1, "total": None},
+    ]
@@ -0,0 +1,50 @@
+"""
+Tests for keyset pagination cursors.
+"""
+
+from datetime import datetime
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from norma.core.pagination import (
+    decode_cursor, decode_keyset_cursor, encode_keyset_cursor, keyset_filter, page_sort_key,
+)
+from norma.exceptions import QueryError
+
+
+class Row:
+    created = datetime(2024, 5, 1, 12, 30)
+    id = "r1"
+
+
+def test_sort_key_appends_primary_key_tie_breaker():
+    assert page_sort_key(["-created"], "id") == (("created", True), ("id", False))
+    assert page_sort_key(["-id"], "id") == (("id", True),)
+
+
+def test_keyset_cursor_round_trips_typed_values():
+    sort_key = page_sort_key(["-created"], "id")
+    
+    values = decode_keyset_cursor(encode_keyset_cursor(sort_key, Row), sort_key)
+    assert values == [Row.created, "r1"]
+    assert keyset_filter(sort_key, values) == {"$or": [
+        {"created": {"$lt": Row.created}},
+        {"created": Row.created, "id": {"$gt": "r1"}},
+    ]}
+
+
+def test_keyset_cursor_rejects_null_sort_values():
+    class Unscheduled:
+        created = None
+        id = "r2"
+    
+    with pytest.raises(QueryError):
+        encode_keyset_cursor(page_sort_key(["created"], "id"), Unscheduled)
+
+def test_malformed_cursor_raises():
+    with pytest.raises(QueryError):
+        decode_cursor("%%%")
@@ -0,0 +1,615 @@
+"""
+Tests for the SQL adapter against a temporary SQLite database.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+import weakref
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import event
+
+from norma import Avg, BaseAdapter, BaseModel, Count, Field, ManyToOne, Max, NormaClient, Sum, model
+from norma.exceptions import BulkWriteError, QueryError, ValidationError
+
+
+@dataclass
+class Item(BaseModel):
+    """Item model used by the SQL adapter tests."""
+    
+    name: str = Field(max_length=20)
+    quantity: int = Field(default=0, min_value=0)
+    label: Optional[str] = Field(default="none", db_column_name="item_label")
+    id: str = Field(primary_key=True, default_factory=lambda: "")
+
+
+@dataclass
+class Account(BaseModel):
+    """Model with a unique field used as an upsert conflict target."""
+    
+    email: str = Field(unique=True)
+    plan: str = Field(default="free")
+    id: str = Field(primary_key=True, default_factory=lambda: "")
+
+
+@model(slots=True)
+class Part(BaseModel):
+    """Slotted model used by the SQL adapter tests."""
+    
+    name: str = Field(max_length=20)
+    id: str = Field(primary_key=True, default_factory=lambda: "")
+
+
+@dataclass
+class Writer(BaseModel):
+    """Target of Article.writer_id; gains the "articles" back_ref."""
+    
+    name: str
+    id: str = Field(primary_key=True, default_factory=lambda: "")
+
+
+@dataclass
+class Article(BaseModel):
+    """Model with a many-to-one relationship used by the include tests."""
+    
+    title: str
+    writer_id: Optional[str] = Field(default_factory=lambda: None, relationship=ManyToOne("Writer", back_ref="articles"))
+    id: str = Field(primary_key=True, default_factory=lambda: "")
+
+
+@pytest.fixture
+async def client(tmp_path):
+    client = NormaClient("sql", f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    await client.connect()
+    await client.get_model_client(Item).create_table()
+    yield client
+    await client.disconnect()
+
+
+def test_hydrate_skips_validation_and_fills_defaults():
+    item = Item._hydrate({"name": "x" * 50, "id": "i1"})
+    assert item.name == "x" * 50
+    assert item.quantity == 0
+    assert item.label == "none"
+    
+    item = Item._hydrate_row(("i2", "bolt", 3), ("id", "name", "quantity"))
+    assert (item.id, item.name, item.quantity) == ("i2", "bolt", 3)
+
+
+async def test_trusted_reads_round_trip(client):
+    items = client.get_model_client(Item)
+    inserted = await items.insert(Item(name="bolt", quantity=3))
+    
+    found = await items.find_by_id(inserted.id)
+    assert found == inserted
+    assert await items.find_many({"quantity": {"$gte": 1}}) == [inserted]
+
+
+async def test_strict_reads_validate_rows(client):
+    items = client.get_model_client(Item)
+    inserted = await items.insert(Item(name="bolt", quantity=3))
+    
+    # Corrupt the row behind Norma's back
+    async with client.adapter._async_engine.begin() as conn:
+        await conn.exec_driver_sql("UPDATE item SET quantity = -5")
+    
+    assert (await items.find_by_id(inserted.id)).quantity == -5
+    
+    client.adapter.trusted_reads = False
+    with pytest.raises(Exception) as exc_info:
+        await items.find_by_id(inserted.id)
+    assert "must be at least 0" in str(exc_info.value)
+
+
+async def test_slots_model_round_trip(client):
+    parts = client.get_model_client(Part)
+    await parts.create_table()
+    
+    part = await parts.insert(Part(name="gear"))
+    part.update(name="cog")
+    await parts.update(part)
+    
+    found = await parts.find_by_id(part.id)
+    assert found == part
+    assert not hasattr(found, "__dict__")
+
+
+async def test_update_writes_only_dirty_fields(client):
+    items = client.get_model_client(Item)
+    item = await items.insert(Item(name="bolt", quantity=3))
+    assert item.get_dirty_fields() == []
+    
+    # A concurrent writer changes quantity; our update must not clobber it
+    async with client.adapter._async_engine.begin() as conn:
+        await conn.exec_driver_sql("UPDATE item SET quantity = 9")
+    
+    item.name = "nut"
+    assert item.get_dirty_fields() == ["name"]
+    await items.update(item)
+    assert item.get_dirty_fields() == []
+    
+    found = await items.find_by_id(item.id)
+    assert (found.name, found.quantity) == ("nut", 9)
+    
+    # full=True rewrites every column
+    await items.update(item, full=True)
+    assert (await items.find_by_id(item.id)).quantity == 3
+
+
+async def test_update_without_changes_skips_query(client):
+    items = client.get_model_client(Item)
+    item = await items.insert(Item(name="bolt"))
+    await items.delete_by_id(item.id)
+    
+    # Nothing changed, so no query is sent (and no NotFoundError raised)
+    assert await items.update(item) is item
+    
+    item.mark_dirty("label")
+    assert item.get_dirty_fields() == ["label"]
+    with pytest.raises(ValidationError):
+        item.mark_dirty("missing")
+
+
+async def test_insert_many_generates_keys_and_reports_duplicate_batches(client):
+    items = client.get_model_client(Item)
+    await items.insert(Item(name="taken", id="dup"))
+    
+    batch = [Item(name="a"), Item(name="b"), Item(name="c", id="dup"), Item(name="d")]
+    with pytest.raises(BulkWriteError) as exc_info:
+        await client.insert_many(batch, batch_size=2)
+    
+    error = exc_info.value
+    assert error.inserted_count == 2
+    assert error.errors == [
+        {"batch": 1, "index": 2, "size": 2, "duplicate": True, "message": error.errors[0]["message"]}
+    ]
+    assert all(item.id for item in batch)
+    assert batch[0].get_dirty_fields() == [] and batch[3].get_dirty_fields() != []
+    assert sorted(item.name for item in await items.find_many()) == ["a", "b", "taken"]
+
+
+def test_insert_many_sync(tmp_path):
+    client = NormaClient("sql", f"sqlite:///{tmp_path / 'sync.db'}")
+    client.connect_sync()
+    
+    inserted = client.insert_many_sync([Item(name=f"item{i}") for i in range(5)], batch_size=2)
+    assert len({item.id for item in inserted}) == 5
+    assert client.count_sync(Item) == 5
+
+
+async def test_update_many_and_delete_many_by_filter(client):
+    await client.insert_many([Item(name=f"item{i}", quantity=i) for i in range(6)])
+    
+    assert await client.update_many(Item, {"quantity": {"$gte": 3}}, {"label": "bulk"}) == 3
+    assert await client.count(Item, {"label": "bulk"}) == 3
+    
+    assert await client.delete_many(Item, {"quantity": {"$in": [0, 1, 5]}}) == 3
+    assert sorted(item.quantity for item in await client.find_many(Item)) == [2, 3, 4]
+    assert await client.delete_many(Item, {}) == 3
+    
+    # Writes refuse filters or changes they cannot apply exactly
+    with pytest.raises(QueryError):
+        await client.delete_many(Item, {"missing": 1})
+    with pytest.raises(QueryError):
+        await client.update_many(Item, {}, {"id": "x"})
+
+
+async def test_upsert_by_primary_key(client):
+    item = await client.upsert(Item(name="bolt", quantity=1))
+    item.quantity = 7
+    await client.upsert_many([item, Item(name="nut")])
+    
+    assert (await client.find_by_id(Item, item.id)).quantity == 7
+    assert await client.count(Item) == 2
+
+
+async def test_upsert_by_unique_field_keeps_stored_key(client):
+    accounts = client.get_model_client(Account)
+    await accounts.create_table()
+    stored = await accounts.insert(Account(email="ann@example.com"))
+    
+    incoming = [Account(email="ann@example.com", plan="pro"), Account(email="bob@example.com")]
+    await accounts.upsert_many(incoming, conflict_fields=["email"])
+    
+    assert incoming[0].id == stored.id
+    assert (await accounts.find_by_id(stored.id)).plan == "pro"
+    assert await accounts.count() == 2
+    
+    with pytest.raises(QueryError):
+        await accounts.upsert(Account(email="x"), conflict_fields=["plan"])
+
+
+async def test_upsert_many_writes_repeated_conflict_keys_once(client):
+    accounts = client.get_model_client(Account)
+    await accounts.create_table()
+    stored = await accounts.insert(Account(email="ann@example.com"))
+    
+    incoming = [
+        Account(email="cat@example.com"),
+        Account(email="ann@example.com", plan="pro"),
+        Account(email="cat@example.com", plan="team"),
+        Account(email="ann@example.com", plan="max"),
+    ]
+    # PostgreSQL rejects a statement that updates the same row twice, so each key is sent once
+    sent = []
+    engine = client.adapter._async_engine.sync_engine
+    record = lambda conn, clause, multiparams, params, options: sent.append(len(multiparams))
+    event.listen(engine, "before_execute", record)
+    await accounts.upsert_many(incoming, conflict_fields=["email"])
+    event.remove(engine, "before_execute", record)
+    
+    assert sent == [2]
+    
+    assert [account.id for account in incoming[1::2]] == [stored.id, stored.id]
+    assert incoming[0].id == incoming[2].id != stored.id
+    found = await accounts.find_many(order_by=["email"])
+    assert [(account.email, account.plan) for account in found] == [("ann@example.com", "max"), ("cat@example.com", "team")]
+
+
+def test_upsert_sync_after_connect_sync(tmp_path):
+    client = NormaClient("sql", f"sqlite:///{tmp_path / 'sync.db'}")
+    client.connect_sync()
+    item = client.upsert_sync(Item(name="bolt", quantity=1))
+    item.quantity = 2
+    client.upsert_many_sync([item, item])
+    assert client.find_by_id_sync(Item, item.id).quantity == 2
+    assert client.count_sync(Item) == 1
+
+async def test_sql_adapter_reuses_statements_across_values(client):
+    items = client.get_model_client(Item)
+    for quantity in range(3):
+        await items.insert(Item(name=f"item{quantity}", quantity=quantity, label=None if quantity else "x"))
+    
+    cache = client.adapter.statement_cache
+    before = cache.stats()
+    for quantity in range(3):
+        await items.find_many({"quantity": {"$gte": quantity}}, limit=10)
+    stats = cache.stats()
+    assert stats["misses"] == before["misses"] + 1
+    assert stats["hits"] == before["hits"] + 2
+    
+    # $in lists of any length and None comparisons bind correctly
+    assert await items.count({"quantity": {"$in": [0, 2]}}) == 2
+    assert await items.count({"quantity": {"$in": [1]}}) == 1
+    assert await items.count({"label": None}) == 2
+    assert await items.count({"label": {"$ne": None}}) == 1
+
+
+async def test_logical_and_pattern_filters(client):
+    items = client.get_model_client(Item)
+    await items.insert_many([
+        Item(name="bolt", quantity=1, label="hardware"),
+        Item(name="nut", quantity=5, label=None),
+        Item(name="washer", quantity=9, label="hardware"),
+    ])
+    
+    async def names(filters):
+        return sorted(item.name for item in await items.find_many(filters))
+    
+    assert await names({"$or": [{"quantity": {"$lt": 2}}, {"label": None}]}) == ["bolt", "nut"]
+    assert await names({"$and": [{"quantity": {"$gt": 1}}], "label": {"$exists": True}}) == ["washer"]
+    assert await names({"name": {"$nin": ["bolt", "nut"]}}) == ["washer"]
+    assert await names({"name": {"$like": "%t"}}) == ["bolt", "nut"]
+    assert await names({"$or": []}) == []
+    
+    assert await items.exists({"label": {"$exists": False}})
+    assert not await items.exists({"name": "screw"})
+    assert await items.delete_many({"$or": [{"name": "bolt"}, {"name": "nut"}]}) == 2
+
+
+async def test_stream_holds_one_batch_at_a_time(client):
+    items = client.get_model_client(Item)
+    await items.insert_many([Item(name=f"item{i}", quantity=i % 7) for i in range(500)])
+    
+    refs = []
+    peak = 0
+    names = []
+    async for item in items.stream({"quantity": {"$gt": 0}}, batch_size=50, order_by=["name"]):
+        refs.append(weakref.ref(item))
+        peak = max(peak, sum(ref() is not None for ref in refs))
+        names.append(item.name)
+        del item
+    
+    assert names == sorted(names) and len(names) == await items.count({"quantity": {"$gt": 0}})
+    assert peak <= 50
+
+
+def test_stream_sync(tmp_path):
+    client = NormaClient("sql", f"sqlite:///{tmp_path / 'sync.db'}")
+    client.connect_sync()
+    client.insert_many_sync([Item(name=f"item{i}") for i in range(5)])
+    
+    assert sorted(item.name for item in client.stream_sync(Item, batch_size=2)) == [f"item{i}" for i in range(5)]
+
+
+async def test_find_page_walks_keyset_cursors(client):
+    items = client.get_model_client(Item)
+    await items.insert_many([Item(name=f"item{i:02d}", quantity=i % 3, id=f"k{i:02d}") for i in range(10)])
+    
+    seen = []
+    cursor = None
+    while True:
+        page = await items.find_page({"name": {"$ne": "item05"}}, order_by=["-quantity"], after=cursor, limit=4)
+        seen.extend(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    
+    expected = await items.find_many({"name": {"$ne": "item05"}}, order_by=["-quantity", "id"])
+    assert [item.id for item in seen] == [item.id for item in expected]
+    assert len(seen) == 9
+    
+    pages = [page async for page in items.iter_pages({"name": {"$ne": "item05"}}, order_by=["-quantity"], limit=4)]
+    assert [item.id for page in pages for item in page] == [item.id for item in seen]
+    assert [len(page) for page in pages] == [4, 4, 1]
+    
+    # Cursors only fit the order they were issued for
+    other = (await items.find_page(order_by=["quantity"], limit=1)).next_cursor
+    with pytest.raises(QueryError):
+        await items.find_page(order_by=["name"], after=other)
+    with pytest.raises(QueryError):
+        await items.find_page(after="not-a-cursor")
+    
+    # A NULL sort value cannot be paged past, so it is rejected rather than ending the scan early
+    await items.insert(Item(name="unlabelled", label=None, id="k99"))
+    with pytest.raises(QueryError):
+        await items.find_page(order_by=["label"], limit=1)  # SQLite sorts NULLs first
+
+
+async def test_transaction_commits_once_or_rolls_back(client):
+    items = client.get_model_client(Item)
+    
+    async with client.transaction() as tx:
+        await tx.insert_many([Item(name="a"), Item(name="b")])
+        bolt = await items.insert(Item(name="bolt"))
+        bolt.quantity = 4
+        await items.update(bolt)
+        # Reads inside the transaction see its writes
+        assert await items.count() == 3
+    assert (await items.find_by_id(bolt.id)).quantity == 4
+    
+    with pytest.raises(RuntimeError):
+        async with client.transaction():
+            await items.insert(Item(name="lost"))
+            await items.delete_many({"name": "a"})
+            raise RuntimeError("abort")
+    assert sorted(item.name for item in await items.find_many()) == ["a", "b", "bolt"]
+
+
+async def test_rolled_back_writes_leave_models_dirty(client):
+    items = client.get_model_client(Item)
+    bolt = await items.insert(Item(name="bolt"))
+    
+    with pytest.raises(RuntimeError):
+        async with client.transaction():
+            bolt.quantity = 4
+            await items.update(bolt)
+            raise RuntimeError("abort")
+    assert bolt.get_dirty_fields() == ["quantity"]
+    await items.update(bolt)
+    assert (await items.find_by_id(bolt.id)).quantity == 4
+    
+    async with client.transaction():
+        bolt.quantity = 5
+        await items.update(bolt)
+        assert bolt.get_dirty_fields() == ["quantity"]  # Not persisted until the commit
+        bolt.label = "changed after the write"
+    assert bolt.get_dirty_fields() == ["label"]
+
+def test_transaction_sync(tmp_path):
+    client = NormaClient("sql", f"sqlite:///{tmp_path / 'sync.db'}")
+    client.connect_sync()
+    client.insert_sync(Item(name="seed"))
+    
+    with client.transaction_sync() as tx:
+        tx.insert_many_sync([Item(name=f"item{i}") for i in range(3)])
+        assert tx.count_sync(Item) == 4
+    
+    with pytest.raises(RuntimeError):
+        with client.transaction_sync():
+            client.delete_many_sync(Item, {})
+            raise RuntimeError("abort")
+    assert client.count_sync(Item) == 4
+    
+    seed = client.find_many_sync(Item, {"name": "seed"})[0]
+    with pytest.raises(RuntimeError):
+        with client.transaction_sync():
+            seed.quantity = 2
+            client.update_sync(seed)
+            raise RuntimeError("abort")
+    client.update_sync(seed)
+    assert client.find_by_id_sync(Item, seed.id).quantity == 2
+
+
+async def test_projection_loads_partial_models(client):
+    items = client.get_model_client(Item)
+    bolt = await items.insert(Item(name="bolt", quantity=3, label="hardware"))
+    
+    found = await items.find_by_id(bolt.id, fields=["name"])
+    assert (found.id, found.name, found.quantity, found.label) == (bolt.id, "bolt", 0, "none")
+    assert found.get_unloaded_fields() == ["label", "quantity"]
+    
+    found = (await items.find_many(exclude=["label"]))[0]
+    assert (found.name, found.quantity) == ("bolt", 3)
+    assert found.get_unloaded_fields() == ["label"]
+    
+    # A full update of a partial model leaves unloaded columns alone
+    found.quantity = 5
+    await items.update(found, full=True)
+    stored = await items.find_by_id(bolt.id)
+    assert (stored.quantity, stored.label) == (5, "hardware")
+    assert stored.get_unloaded_fields() == []
+    
+    page = await items.find_page(order_by=["quantity"], fields=["name"])
+    assert [item.name for item in page] == ["bolt"]
+    assert [item.name async for item in items.stream(fields=["name"])] == ["bolt"]
+    
+    with pytest.raises(QueryError):
+        await items.find_many(fields=["name"], exclude=["label"])
+    with pytest.raises(QueryError):
+        await items.find_many(fields=["missing"])
+
+
+async def test_aggregate_groups_in_the_database(client):
+    items = client.get_model_client(Item)
+    await items.insert_many([
+        Item(name="bolt", quantity=3, label="a"),
+        Item(name="nut", quantity=5, label="a"),
+        Item(name="gear", quantity=4, label="b"),
+        Item(name="cog", quantity=9, label=None),
+    ])
+    
+    rows = await items.aggregate(
+        {"quantity": {"$lt": 9}},
+        group_by=["label"],
+        metrics={"items": Count(), "total": Sum("quantity"), "largest": Max("quantity")},
+    )
+    assert sorted(rows, key=lambda row: row["label"]) == [
+        {"label": "a", "items": 2, "total": 8, "largest": 5},
+        {"label": "b", "items": 1, "total": 4, "largest": 4},
+    ]
+    
+    # The streaming Python fallback agrees with the GROUP BY query
+    fallback = await BaseAdapter.aggregate(
+        client.adapter, Item, {"quantity": {"$lt": 9}}, ["label"],
+        {"items": Count(), "total": Sum("quantity"), "largest": Max("quantity")},
+    )
+    assert sorted(fallback, key=lambda row: row["label"]) == sorted(rows, key=lambda row: row["label"])
+    
+    assert await client.aggregate(Item) == [{"count": 4}]
+    assert await items.aggregate({"name": "none"}, metrics={"n": Count(), "mean": Avg("quantity")}) == [
+        {"n": 0, "mean": None}
+    ]
+    with pytest.raises(QueryError):
+        await items.aggregate(group_by=["missing"])
+
+
+async def test_find_by_ids_batches_primary_key_reads(client):
+    items = client.get_model_client(Item)
+    bolts = await items.insert_many([Item(name=f"bolt{i}", quantity=i) for i in range(5)])
+    ids = [bolts[3].id, "missing", bolts[0].id, bolts[3].id]
+    
+    found = await items.find_by_ids(ids, batch_size=2)
+    assert [item and item.name for item in found] == ["bolt3", None, "bolt0", "bolt3"]
+    
+    by_id = await client.find_by_ids(Item, ids, preserve_order=False, fields=["name"])
+    assert {key: item.name for key, item in by_id.items()} == {bolts[3].id: "bolt3", bolts[0].id: "bolt0"}
+    assert by_id[bolts[0].id].get_unloaded_fields() == ["label", "quantity"]
+    assert await items.find_by_ids([]) == []
+    
+    assert await items.delete_many_by_ids([bolts[0].id, "missing", bolts[0].id, bolts[1].id], batch_size=2) == 2
+    assert await items.count() == 3
+
+
+def test_find_by_ids_sync(tmp_path):
+    client = NormaClient("sql", f"sqlite:///{tmp_path / 'sync.db'}")
+    client.connect_sync()
+    first, second = client.insert_many_sync([Item(name="a"), Item(name="b")])
+    found = client.find_by_ids_sync(Item, [second.id, first.id, "missing"])
+    assert [item and item.name for item in found] == ["b", "a", None]
+
+
+async def test_include_loads_relationships(client):
+    writers = client.get_model_client(Writer)
+    articles = client.get_model_client(Article)
+    await writers.create_table()
+    await articles.create_table()
+    ada, bob = await writers.insert_many([Writer(name="ada"), Writer(name="bob")])
+    await articles.insert_many([
+        Article(title="a1", writer_id=ada.id),
+        Article(title="a2", writer_id=ada.id),
+        Article(title="orphan"),
+    ])
+    
+    # To-one relations are joined into the same query
+    found = await articles.find_many(order_by=["title"], include=["writer"])
+    assert [article.get_related("writer") and article.get_related("writer").name for article in found] == ["ada", "ada", None]
+    assert found[0].get_related("writer") is found[1].get_related("writer")
+    
+    # back_refs are loaded with one extra query, nesting included
+    found = await writers.find_many(order_by=["name"], include=["articles.writer"])
+    assert [[article.title for article in writer.get_related("articles")] for writer in found] == [["a1", "a2"], []]
+    assert found[0].get_related("articles")[0].get_related("writer").name == "ada"
+    
+    first = await articles.find_first({"title": "a2"}, include="writer")
+    assert first.get_related("writer").name == "ada"
+    single = await client.find_by_id(Writer, bob.id, include=["articles"])
+    assert single.get_related("articles") == []
+    
+    with pytest.raises(QueryError):
+        (await articles.find_by_id(first.id)).get_related("writer")
+    with pytest.raises(QueryError):
+        await articles.find_many(include=["missing"])
+
+
+def test_include_sync(tmp_path):
+    client = NormaClient("sql", f"sqlite:///{tmp_path / 'sync.db'}")
+    client.connect_sync()
+    writer = client.insert_sync(Writer(name="ada"))
+    client.insert_sync(Article(title="a1", writer_id=writer.id))
+    
+    (article,) = client.find_many_sync(Article, include=["writer"])
+    assert article.get_related("writer").name == "ada"
+    found = client.find_by_id_sync(Writer, writer.id, include=["articles"])
+    assert [article.title for article in found.get_related("articles")] == ["a1"]
+
+
+@dataclass
+class Review(BaseModel):
+    """Model whose writer is always loaded (lazy_load=False)."""
+    
+    text: str
+    writer_id: Optional[str] = Field(default_factory=lambda: None, relationship=ManyToOne("Writer", lazy_load=False))
+    id: str = Field(primary_key=True, default_factory=lambda: "")
+
+
+async def test_lazy_relationships_prefetch_for_the_whole_read(client, monkeypatch):
+    writers = client.get_model_client(Writer)
+    articles = client.get_model_client(Article)
+    await writers.create_table()
+    await articles.create_table()
+    ada, bob = await writers.insert_many([Writer(name="ada"), Writer(name="bob")])
+    await articles.insert_many([Article(title=f"a{i}", writer_id=(ada, bob)[i % 2].id) for i in range(4)])
+    
+    calls = []
+    find_by_ids = client.adapter.find_by_ids
+    
+    async def counting_find_by_ids(*args, **kwargs):
+        calls.append(args)
+        return await find_by_ids(*args, **kwargs)
+    
+    monkeypatch.setattr(client.adapter, "find_by_ids", counting_find_by_ids)
+    found = await articles.find_many(order_by=["title"])
+    assert not found[0].writer.loaded and calls == []
+    
+    # The first access loads the writers of every article of the read
+    assert (await found[0].writer).name == "ada"
+    assert [(await article.writer).name for article in found] == ["ada", "bob", "ada", "bob"]
+    assert len(calls) == 1
+    
+    # Loaded targets can load their own relations
+    assert [article.title for article in await found[1].get_related("writer").articles] == ["a1", "a3"]
+    
+    with pytest.raises(QueryError):
+        await Article(title="new").writer
+    with pytest.raises(AttributeError):
+        found[0].missing
+
+
+def test_lazy_relationships_without_prefetch(tmp_path):
+    client = NormaClient("sql", f"sqlite:///{tmp_path / 'sync.db'}", prefetch_related=False)
+    client.connect_sync()
+    writer = client.insert_sync(Writer(name="ada"))
+    client.insert_many_sync([Article(title="a1", writer_id=writer.id), Article(title="a2", writer_id=writer.id)])
+    client.insert_sync(Review(text="good", writer_id=writer.id))
+    
+    first, second = client.find_many_sync(Article, order_by=["title"])
+    assert first.writer.load_sync().name == "ada"
+    assert first.has_related("writer") and not second.has_related("writer")
+    
+    (review,) = client.find_many_sync(Review)
+    assert review.get_related("writer").name == "ada"
@@ -0,0 +1,50 @@
+"""
+Tests for the statement cache.
+"""
+
+import asyncio
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from norma.adapters.statement_cache import StatementCache
+
+
+def test_statement_cache_counts_and_evicts():
+    cache = StatementCache(maxsize=2)
+    builds = []
+    build = lambda: builds.append(1) or object()
+    
+    first = cache.get(("t", "find"), build)
+    assert cache.get(("t", "find"), build) is first
+    cache.get(("t", "count"), build)
+    cache.get(("u", "find"), build)
+    
+    assert cache.stats() == {"hits": 1, "misses": 3, "size": 2}
+    assert ("t", "find") not in cache._statements
+    
+    cache.invalidate("u")
+    assert len(cache) == 1
+
+
+
+
+async def test_statement_cache_shares_async_builds_and_drops_invalidated_ones():
+    cache = StatementCache()
+    builds = []
+    
+    async def build():
+        builds.append(1)
+        await asyncio.sleep(0.01)
+        return object()
+    
+    first, second = await asyncio.gather(cache.get_async(("t", "find"), build), cache.get_async(("t", "find"), build))
+    assert first is second and len(builds) == 1
+    assert await cache.get_async(("t", "find"), build) is first
+    
+    pending = asyncio.ensure_future(cache.get_async(("t", "count"), build))
+    await asyncio.sleep(0)
+    cache.invalidate("t")
+    await pending
+    assert len(cache) == 0 and cache.stats()["hits"] == 1
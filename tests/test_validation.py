@@ -0,0 +1,60 @@
+"""
+Tests for compiled model validators.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from norma import BaseModel, Field
+from norma.core.validation import get_validator
+from norma.exceptions import ValidationError
+
+
+@dataclass
+class Contact(BaseModel):
+    """Model exercising every kind of field check."""
+
+    email: str = Field(regex_pattern=r"^[^@]+@[^@]+$", max_length=50)
+    nickname: Optional[str] = Field(min_length=2)
+    score: float = Field(default=0.0, min_value=0.0, max_value=1.0)
+    owner: str = Field(default="system", nullable=False)
+    id: str = Field(primary_key=True, default="c1")
+
+
+def test_validator_is_cached_per_class():
+    validator = get_validator(Contact)
+    assert get_validator(Contact) is validator
+
+    @dataclass
+    class Contact2(Contact):
+        pass
+
+    assert get_validator(Contact2) is not validator
+
+
+def test_compiled_validator_checks():
+    Contact(email="a@b", nickname="ok")
+
+    with pytest.raises(ValidationError, match="does not match required pattern"):
+        Contact(email="invalid", nickname=None)
+    with pytest.raises(ValidationError, match="must be at most 1.0"):
+        Contact(email="a@b", nickname=None, score=2.0)
+    with pytest.raises(ValidationError, match="must be at least 2 characters"):
+        Contact(email="a@b", nickname="x")
+    with pytest.raises(ValidationError, match="should be one of"):
+        Contact(email="a@b", nickname=5)
+    with pytest.raises(ValidationError, match="cannot be None"):
+        Contact(email="a@b", nickname=None, owner=None)
+
+
+def test_update_uses_compiled_validator():
+    contact = Contact(email="a@b", nickname=None)
+    with pytest.raises(ValidationError) as exc_info:
+        contact.update(score=-1.0)
+    assert exc_info.value.field == "score"